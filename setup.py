@@ -53,6 +53,7 @@ setup(
     packages=find_packages(exclude=('tests',)),
     requires=['python (>= 3.3.0)'],
     install_requires=['requests', 'lxml', 'python-dateutil'],
+    extras_require={'async': ['aiohttp'], 'xxhash': ['xxhash']},
     scripts=['wdc'],
     test_suite='tests',
     tests_require=['pytest'],
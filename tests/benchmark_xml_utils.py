@@ -0,0 +1,113 @@
+# coding=utf-8
+"""Micro-benchmark of parsing multistatus responses by WebDavXmlUtils against the previous implementation which
+searched every property in the whole subtree of response.
+The fixtures from tests/responses are multiplied to get big listings.
+
+Run it from the project's root folder: python -m tests.benchmark_xml_utils [amount of responses]
+"""
+import sys
+import timeit
+from urllib.parse import unquote, urlsplit, urlparse
+
+import lxml.etree as etree
+
+from webdav3.client import WebDavXmlUtils
+from webdav3.urn import Urn
+
+
+def legacy_get_info_from_response(response):
+    find_attributes = {
+        'created': ".//{DAV:}creationdate",
+        'name': ".//{DAV:}displayname",
+        'size': ".//{DAV:}getcontentlength",
+        'modified': ".//{DAV:}getlastmodified",
+        'etag': ".//{DAV:}getetag",
+        'content_type': ".//{DAV:}getcontenttype",
+    }
+    info = dict()
+    for (name, value) in find_attributes.items():
+        info[name] = response.findtext(value)
+    return info
+
+
+def legacy_parse_get_list_info_response(content):
+    tree = etree.fromstring(content)
+    infos = []
+    for response in tree.findall(".//{DAV:}response"):
+        href_el = next(iter(response.findall(".//{DAV:}href")), None)
+        if href_el is None:
+            continue
+        path = unquote(urlsplit(href_el.text).path)
+        is_dir = len(response.findall(".//{DAV:}collection")) > 0
+        info = legacy_get_info_from_response(response)
+        info['isdir'] = is_dir
+        info['path'] = path
+        infos.append(info)
+    return infos
+
+
+def legacy_extract_response_for_path(content, path, hostname):
+    prefix = urlparse(hostname).path
+    tree = etree.fromstring(content)
+    n_path = Urn.normalize_path(path)
+    for resp in tree.findall("{DAV:}response"):
+        href = resp.findtext("{DAV:}href")
+        if Urn.compare_path(n_path, href) is True:
+            return resp
+        href_without_prefix = href[len(prefix):] if href.startswith(prefix) else href
+        if Urn.compare_path(n_path, href_without_prefix) is True:
+            return resp
+
+
+def multiply_fixture(file_name, amount):
+    """Builds multistatus with given amount of responses from the fixture, every copy gets unique href."""
+    with open(file_name, 'rb') as f:
+        tree = etree.fromstring(f.read())
+    responses = tree.findall("{DAV:}response")
+    for response in responses:
+        tree.remove(response)
+    for index in range(amount):
+        response = etree.fromstring(etree.tostring(responses[index % len(responses)]))
+        href = response.find("{DAV:}href")
+        href.text = "/test_dir/{index}/{name}".format(index=index, name=href.text.rsplit('/', 1)[-1])
+        tree.append(response)
+    return etree.tostring(tree, xml_declaration=True, encoding='UTF-8')
+
+
+def measure(name, fn, number):
+    seconds = min(timeit.repeat(fn, number=number, repeat=3)) / number
+    print("{name:<45} {ms:10.2f} ms".format(name=name, ms=seconds * 1000))
+    return seconds
+
+
+def main(amount):
+    hostname = 'https://webdav.server.com'
+    for fixture in ('get_list.xml', 'get_list_info.xml', 'is_dir_file.xml'):
+        content = multiply_fixture('./tests/responses/' + fixture, amount)
+        hrefs = etree.fromstring(content).findall("{DAV:}response/{DAV:}href")
+        first_path, last_path = hrefs[0].text, hrefs[-1].text
+        assert legacy_parse_get_list_info_response(content) == WebDavXmlUtils.parse_get_list_info_response(content)
+        assert etree.tostring(legacy_extract_response_for_path(content, last_path, hostname)) == \
+            etree.tostring(WebDavXmlUtils.extract_response_for_path(content, last_path, hostname))
+
+        print("{fixture} x {amount} responses, {size} KB".format(fixture=fixture, amount=amount,
+                                                                 size=len(content) // 1024))
+        number = 3
+        legacy = measure("legacy parse_get_list_info_response",
+                         lambda: legacy_parse_get_list_info_response(content), number)
+        current = measure("parse_get_list_info_response", lambda: WebDavXmlUtils.parse_get_list_info_response(content),
+                          number)
+        print("{:<45} {:10.2f}x".format("speedup", legacy / current))
+        measure("legacy extract_response_for_path (first)",
+                lambda: legacy_extract_response_for_path(content, first_path, hostname), number)
+        measure("extract_response_for_path (first)",
+                lambda: WebDavXmlUtils.extract_response_for_path(content, first_path, hostname), number)
+        measure("legacy extract_response_for_path (last)",
+                lambda: legacy_extract_response_for_path(content, last_path, hostname), number)
+        measure("extract_response_for_path (last)",
+                lambda: WebDavXmlUtils.extract_response_for_path(content, last_path, hostname), number)
+        print()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
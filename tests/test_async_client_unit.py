@@ -0,0 +1,143 @@
+# coding=utf-8
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+from webdav3.exceptions import NotEnoughSpace, RemoteResourceNotFound, OptionNotValid
+
+try:
+    from unittest import IsolatedAsyncioTestCase
+    from aiohttp import web
+    from webdav3.async_client import AsyncClient
+except ImportError:
+    # IsolatedAsyncioTestCase is available since Python 3.8
+    IsolatedAsyncioTestCase = unittest.TestCase
+    web = None
+
+
+def read_file_content(file_name):
+    with open(file_name, encoding='utf-8') as f:
+        return f.read().encode('utf-8')
+
+
+@unittest.skipIf(web is None, 'aiohttp and Python 3.8+ are required')
+class AsyncClientTestCase(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.uploaded = {}
+        app = web.Application()
+        app.router.add_route('*', '/{path:.*}', self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.client = AsyncClient({'webdav_hostname': 'http://127.0.0.1:{port}'.format(port=port)})
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.runner.cleanup()
+
+    async def handle(self, request):
+        path = request.path
+        if path == '/full/':
+            return web.Response(status=507)
+        if request.method == 'HEAD':
+            return web.Response(status=200 if path.startswith('/test_dir') else 404)
+        if request.method == 'PROPFIND':
+            if path.startswith('/wrong'):
+                return web.Response(status=404)
+            if path == '/test_dir/test.txt':
+                return web.Response(status=207, body=read_file_content('./tests/responses/get_info.xml'))
+            return web.Response(status=207, body=read_file_content('./tests/responses/get_list.xml'))
+        if request.method == 'GET':
+            return web.Response(status=200, body=b'test content for testing of webdav client')
+        if request.method == 'PUT':
+            self.uploaded[path] = await request.read()
+            return web.Response(status=201)
+        return web.Response(status=405)
+
+    async def test_list(self):
+        result = await self.client.list('test_dir')
+        self.assertEqual(['test.txt'], result)
+
+    async def test_check(self):
+        self.assertTrue(await self.client.check('test_dir'))
+        self.assertFalse(await self.client.check('wrong'))
+
+    async def test_list_not_found(self):
+        with self.assertRaises(RemoteResourceNotFound):
+            await self.client.list('wrong')
+
+    async def test_info(self):
+        result = await self.client.info('test_dir/test.txt')
+        self.assertEqual(result['size'], '41')
+        self.assertEqual(result['content_type'], 'text/plain')
+
+    async def test_download_iter(self):
+        content = b''.join([chunk async for chunk in self.client.download_iter('test_dir/test.txt')])
+        self.assertEqual(content, b'test content for testing of webdav client')
+
+    async def test_download_iter_dir(self):
+        with self.assertRaises(OptionNotValid):
+            async for _ in self.client.download_iter('test_dir/'):
+                pass
+
+    async def test_upload_to(self):
+        await self.client.upload_to(b'test content', 'test_dir/uploaded.txt')
+        self.assertEqual(b'test content', self.uploaded['/test_dir/uploaded.txt'])
+
+    async def test_download_file(self):
+        progress = []
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test.txt')
+            await self.client.download_file('test_dir/test.txt', local_path,
+                                            progress=lambda current, total: progress.append(current))
+            with open(local_path, 'rb') as f:
+                self.assertEqual(b'test content for testing of webdav client', f.read())
+        self.assertEqual(41, progress[-1])
+
+    async def test_download_file_batched(self):
+        self.client.chunk_size = 2
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test.txt')
+            await self.client.download_file('test_dir/test.txt', local_path)
+            with open(local_path, 'rb') as f:
+                self.assertEqual(b'test content for testing of webdav client', f.read())
+
+    async def test_download_from(self):
+        buff = BytesIO()
+        await self.client.download_from(buff, 'test_dir/test.txt')
+        self.assertEqual(b'test content for testing of webdav client', buff.getvalue())
+
+    async def test_upload_file(self):
+        progress = []
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test.txt')
+            with open(local_path, 'wb') as f:
+                f.write(b'test content')
+            await self.client.upload_file('test_dir/uploaded.txt', local_path,
+                                          progress=lambda current, total: progress.append(current))
+            await self.client.upload_file('test_dir/plain.txt', local_path)
+        self.assertEqual(b'test content', self.uploaded['/test_dir/uploaded.txt'])
+        self.assertEqual(b'test content', self.uploaded['/test_dir/plain.txt'])
+        self.assertEqual([0, 12], progress)
+
+    async def test_timeout_limits_connect_and_read_only(self):
+        timeout = self.client.get_session().timeout
+        self.assertIsNone(timeout.total)
+        self.assertEqual(self.client.timeout, timeout.sock_connect)
+        self.assertEqual(self.client.timeout, timeout.sock_read)
+
+    async def test_optimistic_list_not_found(self):
+        self.client.webdav.optimistic = True
+        with self.assertRaises(RemoteResourceNotFound):
+            await self.client.list('wrong')
+
+    async def test_not_enough_space(self):
+        with self.assertRaises(NotEnoughSpace):
+            await self.client.execute_request(action='list', path='/full/')
+
+
+if __name__ == '__main__':
+    unittest.main()
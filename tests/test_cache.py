@@ -0,0 +1,195 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from webdav3.cache import MetadataCache, ETagIndex, ContentCache, DirectoryCache
+
+
+class MetadataCacheTestCase(unittest.TestCase):
+    def test_disabled_by_default(self):
+        cache = MetadataCache()
+        cache.put('/test_dir', {'isdir': True})
+        self.assertFalse(cache.enabled)
+        self.assertIsNone(cache.get('/test_dir'))
+
+    def test_hit_and_miss(self):
+        cache = MetadataCache(max_size=10)
+        cache.put('/test_dir', {'isdir': True})
+        self.assertEqual({'isdir': True}, cache.get('/test_dir'))
+        self.assertIsNone(cache.get('/wrong'))
+        self.assertEqual({'hits': 1, 'misses': 1, 'size': 1, 'max_size': 10}, cache.stats())
+
+    def test_returns_copy(self):
+        cache = MetadataCache(max_size=10)
+        cache.put('/test_dir', {'isdir': True})
+        cache.get('/test_dir')['isdir'] = False
+        self.assertTrue(cache.get('/test_dir')['isdir'])
+
+    def test_lru_eviction(self):
+        cache = MetadataCache(max_size=2)
+        cache.put('/a', {})
+        cache.put('/b', {})
+        cache.get('/a')
+        cache.put('/c', {})
+        self.assertIsNotNone(cache.get('/a'))
+        self.assertIsNone(cache.get('/b'))
+        self.assertIsNotNone(cache.get('/c'))
+
+    @patch('webdav3.cache.time.monotonic')
+    def test_ttl_expiration(self, mock_monotonic):
+        cache = MetadataCache(max_size=10, ttl=60)
+        mock_monotonic.return_value = 100
+        cache.put('/a', {})
+        mock_monotonic.return_value = 159
+        self.assertIsNotNone(cache.get('/a'))
+        mock_monotonic.return_value = 161
+        self.assertIsNone(cache.get('/a'))
+        self.assertEqual(0, cache.stats()['size'])
+
+    def test_partial_entry(self):
+        cache = MetadataCache(max_size=10)
+        cache.put('/a', {'isdir': False}, complete=False)
+        self.assertIsNone(cache.get('/a'))
+        self.assertIsNotNone(cache.get('/a', complete=False))
+
+    def test_partial_entry_does_not_replace_complete(self):
+        cache = MetadataCache(max_size=10)
+        cache.put('/a', {'isdir': False, 'size': '41'})
+        cache.put('/a', {'isdir': False}, complete=False)
+        self.assertEqual('41', cache.get('/a')['size'])
+
+    def test_invalidate_recursive(self):
+        cache = MetadataCache(max_size=10)
+        for path in ('/a', '/a/b', '/a/b/c', '/ab'):
+            cache.put(path, {})
+        cache.invalidate('/a', recursive=True)
+        self.assertIsNone(cache.get('/a'))
+        self.assertIsNone(cache.get('/a/b/c'))
+        self.assertIsNotNone(cache.get('/ab'))
+
+
+class ETagIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.local_path = os.path.join(self.directory.name, 'test.txt')
+        with open(self.local_path, 'wb') as f:
+            f.write(b'test')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_put_and_get(self):
+        ETagIndex().put(self.local_path, 'http://localhost/test.txt', '"1"')
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, ETagIndex.file_name)))
+        index = ETagIndex()
+        self.assertEqual('"1"', index.get(self.local_path, 'http://localhost/test.txt'))
+        self.assertIsNone(index.get(self.local_path, 'http://localhost/wrong.txt'))
+
+    def test_local_file_changed(self):
+        index = ETagIndex()
+        index.put(self.local_path, 'http://localhost/test.txt', '"1"')
+        with open(self.local_path, 'ab') as f:
+            f.write(b'changed')
+        self.assertIsNone(index.get(self.local_path, 'http://localhost/test.txt'))
+
+    def test_put_without_etag_removes_record(self):
+        index = ETagIndex()
+        index.put(self.local_path, 'http://localhost/test.txt', '"1"')
+        index.put(self.local_path, 'http://localhost/test.txt', None)
+        self.assertIsNone(ETagIndex().get(self.local_path, 'http://localhost/test.txt'))
+
+    def test_deferred(self):
+        index = ETagIndex()
+        with index.deferred():
+            index.put(self.local_path, 'http://localhost/test.txt', '"1"')
+            self.assertFalse(os.path.exists(os.path.join(self.directory.name, ETagIndex.file_name)))
+            self.assertEqual('"1"', index.get(self.local_path, 'http://localhost/test.txt'))
+        self.assertEqual('"1"', ETagIndex().get(self.local_path, 'http://localhost/test.txt'))
+
+
+class DirectoryCacheTestCase(unittest.TestCase):
+    def test_add_ancestors(self):
+        directories = DirectoryCache()
+        directories.add('/a/b/c')
+        self.assertIn('/a', directories)
+        self.assertIn('/a/b', directories)
+        self.assertNotIn('/a/d', directories)
+        self.assertEqual(3, len(directories))
+
+    def test_invalidate(self):
+        directories = DirectoryCache()
+        directories.add('/a/b/c')
+        directories.add('/a/bc')
+        directories.invalidate('/a/b')
+        self.assertEqual(2, len(directories))
+        self.assertIn('/a/bc', directories)
+        directories.clear()
+        self.assertEqual(0, len(directories))
+
+
+class ContentCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ContentCache(self.directory.name, max_size=10)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def put(self, path, etag, content):
+        writer = self.cache.writer('http://localhost', path, etag)
+        self.assertEqual([content], list(writer.tee([content])))
+
+    def test_disabled_by_default(self):
+        self.assertFalse(ContentCache().enabled)
+
+    def test_put_and_open(self):
+        self.assertIsNone(self.cache.lookup('http://localhost', '/a.txt'))
+        self.put('/a.txt', '"1"', b'test')
+        self.assertEqual('"1"', self.cache.lookup('http://localhost', '/a.txt'))
+        with self.cache.open('http://localhost', '/a.txt', '"1"') as cached_file:
+            self.assertEqual(b'test', cached_file.read())
+        self.assertIsNone(self.cache.lookup('http://other', '/a.txt'))
+        self.assertEqual({'hits': 1, 'misses': 2, 'max_size': 10}, self.cache.stats())
+
+    def test_new_etag_replaces_content(self):
+        self.put('/a.txt', '"1"', b'test')
+        self.put('/a.txt', '"2"', b'changed')
+        self.assertEqual('"2"', self.cache.lookup('http://localhost', '/a.txt'))
+        self.assertIsNone(self.cache.open('http://localhost', '/a.txt', '"1"'))
+
+    def test_incomplete_content_is_not_visible(self):
+        writer = self.cache.writer('http://localhost', '/a.txt', '"1"')
+        chunks = writer.tee([b'te', b'st'])
+        next(chunks)
+        self.assertIsNone(self.cache.writer('http://localhost', '/a.txt', '"1"'))
+        chunks.close()
+        self.assertIsNone(self.cache.lookup('http://localhost', '/a.txt'))
+        self.assertIsNotNone(self.cache.writer('http://localhost', '/a.txt', '"1"'))
+
+    def test_without_etag(self):
+        self.assertIsNone(self.cache.writer('http://localhost', '/a.txt', None))
+
+    def test_lru_eviction(self):
+        self.put('/a.txt', '"1"', b'aaaa')
+        self.put('/b.txt', '"1"', b'bbbb')
+        blob_path = self.cache._blob_path('http://localhost', '/a.txt', '"1"')
+        os.utime(blob_path, (1, 1))
+        self.cache.open('http://localhost', '/b.txt', '"1"').close()
+        self.put('/c.txt', '"1"', b'cccc')
+        self.assertIsNone(self.cache.lookup('http://localhost', '/a.txt'))
+        self.assertEqual('"1"', self.cache.lookup('http://localhost', '/b.txt'))
+        self.assertEqual('"1"', self.cache.lookup('http://localhost', '/c.txt'))
+
+
+    def test_eviction_scans_cache_when_estimate_exceeds_limit(self):
+        with patch('os.walk', wraps=os.walk) as walk:
+            self.put('/a.txt', '"1"', b'aaaa')
+            self.put('/b.txt', '"1"', b'bbbb')
+            self.put('/b.txt', '"2"', b'bbb')
+            self.assertEqual(1, walk.call_count)
+            self.put('/c.txt', '"1"', b'cccc')
+            self.assertEqual(2, walk.call_count)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import hashlib
+import unittest
+import zlib
+
+from webdav3.checksum import algorithms, Checksums, iter_checksums, parse_checksums, register_algorithm
+from webdav3.exceptions import ChecksumMismatch, OptionNotValid
+
+
+class ChecksumsTestCase(unittest.TestCase):
+    def test_incremental(self):
+        checksums = Checksums('MD5', 'SHA-256', 'adler32')
+        checksums.update(b'test ')
+        checksums.update(b'content')
+        self.assertEqual(hashlib.md5(b'test content').hexdigest(), checksums['md5'])
+        self.assertEqual(hashlib.sha256(b'test content').hexdigest(), checksums['sha256'])
+        self.assertEqual("{:08x}".format(zlib.adler32(b'test content')), checksums.hexdigests()['adler32'])
+        self.assertEqual(12, checksums.size)
+
+    def test_unknown_algorithm(self):
+        self.assertRaises(OptionNotValid, Checksums, 'wrong')
+        self.assertRaises(OptionNotValid, Checksums)
+
+    def test_register_algorithm(self):
+        register_algorithm('SHA3-256', hashlib.sha3_256)
+        self.addCleanup(algorithms.pop, 'sha3256')
+        checksums = Checksums('sha3-256')
+        checksums.update(b'test')
+        self.assertEqual(hashlib.sha3_256(b'test').hexdigest(), checksums['SHA3-256'])
+
+    def test_parse_checksums(self):
+        self.assertEqual({'sha1': 'abc', 'md5': 'def', 'adler32': '01'},
+                         dict(parse_checksums('SHA1:ABC MD5:def ADLER32:01')))
+        self.assertEqual({}, dict(parse_checksums(None)))
+
+    def test_verify(self):
+        checksums = Checksums('sha1')
+        checksums.update(b'test')
+        self.assertTrue(checksums.verify('SHA1:' + hashlib.sha1(b'test').hexdigest() + ' MD5:ignored', '/test.txt'))
+        self.assertEqual(('sha1',), checksums.verified)
+        self.assertFalse(checksums.verify('MD5:ignored', '/test.txt'))
+        with self.assertRaises(ChecksumMismatch):
+            checksums.verify('SHA1:0000', '/test.txt')
+
+    def test_iter_checksums(self):
+        checksums = Checksums('md5')
+        expected = 'MD5:' + hashlib.md5(b'test').hexdigest()
+        self.assertEqual([b'te', b'st'], list(iter_checksums([b'te', b'st'], checksums, '/test.txt', expected)))
+        self.assertEqual(('md5',), checksums.verified)
+        with self.assertRaises(ChecksumMismatch):
+            list(iter_checksums([b'wrong'], checksums, '/test.txt', expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
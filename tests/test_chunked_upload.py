@@ -0,0 +1,285 @@
+import os
+import tempfile
+import socketserver
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import unquote, urlsplit
+
+from webdav3.client import Client
+from webdav3.exceptions import ResponseErrorCode
+
+
+class ChunkingServer(socketserver.ThreadingMixIn, HTTPServer):
+    """Local stand-in of WebDAV server implementing chunking protocol of Nextcloud and partial updates of files by
+    `PATCH` requests of SabreDAV or `PUT` requests with `Content-Range`.
+    """
+    daemon_threads = True
+    files_root = '/remote.php/dav/files/user/'
+    uploads_root = '/remote.php/dav/uploads/user/'
+
+    def __init__(self, chunking=True, partial_update=None):
+        super().__init__(('127.0.0.1', 0), ChunkingHandler)
+        self.chunking = chunking
+        self.partial_update = partial_update
+        self.files = {}
+        self.uploads = {}
+        self.failures = {}
+        self.interrupt_after = None
+        self.requests = []
+        self.lock = threading.Lock()
+
+
+class ChunkingHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def respond(self, code):
+        self.send_response(code)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def read_body(self):
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def destination(self):
+        return unquote(urlsplit(self.headers['Destination']).path)
+
+    def do_MKCOL(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(('MKCOL', self.path))
+            if self.path.startswith(server.uploads_root) and server.chunking:
+                server.uploads[self.path] = {}
+                return self.respond(201)
+        self.respond(405 if self.path.startswith(server.uploads_root) else 201)
+
+    def do_PUT(self):
+        server = self.server
+        body = self.read_body()
+        directory, _, name = self.path.rpartition('/')
+        path = unquote(self.path)
+        with server.lock:
+            server.requests.append(('PUT', self.path))
+            if directory in server.uploads:
+                if server.failures.get(name, 0) > 0:
+                    server.failures[name] -= 1
+                    return self.respond(503)
+                server.uploads[directory][name] = body
+            elif 'Content-Range' in self.headers:
+                if server.partial_update != 'range':
+                    return self.respond(501)
+                start = int(self.headers['Content-Range'].split(' ')[1].split('-')[0])
+                server.files[path] = server.files.get(path, b'')[:start] + body
+            elif server.interrupt_after is not None:
+                # the connection is broken, but the received part is stored
+                server.files[path] = body[:server.interrupt_after]
+                server.interrupt_after = None
+                return self.respond(500)
+            else:
+                server.files[path] = body
+        self.respond(201)
+
+    def do_GET(self):
+        server = self.server
+        path = unquote(self.path)
+        with server.lock:
+            server.requests.append(('GET', self.path))
+            if path not in server.files:
+                return self.respond(404)
+            content = server.files[path]
+        start, _, end = self.headers['Range'][len('bytes='):].partition('-')
+        self.send_response(206)
+        self.send_header('Content-Range', 'bytes {start}-{end}/{total}'.format(start=start, end=end,
+                                                                              total=len(content)))
+        self.send_header('Content-Length', str(int(end) - int(start) + 1))
+        self.end_headers()
+        self.wfile.write(content[int(start):int(end) + 1])
+
+    def do_PATCH(self):
+        server = self.server
+        body = self.read_body()
+        path = unquote(self.path)
+        with server.lock:
+            server.requests.append(('PATCH', self.path))
+            if server.partial_update != 'patch':
+                return self.respond(405)
+            start = int(self.headers['X-Update-Range'][len('bytes='):].split('-')[0])
+            server.files[path] = server.files[path][:start] + body
+        self.respond(204)
+
+    def do_PROPFIND(self):
+        server = self.server
+        self.read_body()
+        path = unquote(self.path)
+        with server.lock:
+            server.requests.append(('PROPFIND', self.path))
+            if path in server.files:
+                resources = {path: server.files[path]}
+            elif path.rstrip('/') in server.uploads:
+                resources = {path.rstrip('/') + '/' + name: chunk
+                             for (name, chunk) in server.uploads[path.rstrip('/')].items()}
+            else:
+                return self.respond(404)
+        content = ''.join('<d:response><d:href>{path}</d:href><d:propstat><d:prop><d:resourcetype/>'
+                          '<d:getcontentlength>{size}</d:getcontentlength><d:getetag>"{etag}"</d:getetag>'
+                          '</d:prop><d:status>HTTP/1.1 200 OK</d:status></d:propstat></d:response>'
+                          .format(path=path, size=len(body), etag=hash(body)) for (path, body) in resources.items())
+        content = '<?xml version="1.0"?><d:multistatus xmlns:d="DAV:">{content}</d:multistatus>' \
+            .format(content=content).encode('utf-8')
+        self.send_response(207)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_MOVE(self):
+        server = self.server
+        directory, _, name = self.path.rpartition('/')
+        with server.lock:
+            server.requests.append(('MOVE', self.path))
+            chunks = server.uploads.pop(directory, None)
+            if name != '.file' or chunks is None:
+                return self.respond(404)
+            content = b''.join(chunks[key] for key in sorted(chunks))
+            if len(content) != int(self.headers['OC-Total-Length']):
+                return self.respond(400)
+            server.files[self.destination()] = content
+        self.respond(201)
+
+    def do_DELETE(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(('DELETE', self.path))
+            server.uploads.pop(self.path, None)
+        self.respond(204)
+
+
+class ChunkedUploadTestCase(unittest.TestCase):
+    def start_server(self, chunking=True, partial_update=None):
+        server = ChunkingServer(chunking, partial_update)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        client = Client({
+            'webdav_hostname': 'http://127.0.0.1:{port}'.format(port=server.server_port),
+            'webdav_root': server.files_root,
+            'webdav_optimistic': True,
+        })
+        return server, client
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.content = os.urandom(10000)
+        self.local_path = os.path.join(self.directory.name, 'test.bin')
+        with open(self.local_path, 'wb') as f:
+            f.write(self.content)
+
+    def test_upload_chunked(self):
+        server, client = self.start_server()
+        progress = []
+        client.upload_chunked('test_dir/test.bin', self.local_path, chunk_size=1024, max_workers=4,
+                              progress=lambda current, total: progress.append((current, total)))
+        self.assertEqual(self.content, server.files['/remote.php/dav/files/user/test_dir/test.bin'])
+        self.assertEqual(10, len([method for (method, _) in server.requests if method == 'PUT']))
+        self.assertTrue(server.requests[-1][1].endswith('/.file'))
+        self.assertEqual((10000, 10000), max(progress))
+
+    def test_failed_chunk_retried(self):
+        server, client = self.start_server()
+        server.failures['00003'] = 2
+        client.upload_chunked('test_dir/test.bin', self.local_path, chunk_size=1024)
+        self.assertEqual(self.content, server.files['/remote.php/dav/files/user/test_dir/test.bin'])
+        self.assertEqual(3, len([path for (_, path) in server.requests if path.endswith('/00003')]))
+
+    def test_failed_upload_removes_chunks(self):
+        server, client = self.start_server()
+        server.failures['00003'] = 5
+        with self.assertRaises(ResponseErrorCode):
+            client.upload_chunked('test_dir/test.bin', self.local_path, chunk_size=1024, retries=2)
+        self.assertEqual('DELETE', server.requests[-1][0])
+        self.assertEqual({}, server.uploads)
+        self.assertEqual({}, server.files)
+
+    def test_fallback_to_single_put(self):
+        server, client = self.start_server(chunking=False)
+        client.upload_chunked('test_dir/test.bin', self.local_path, chunk_size=1024)
+        self.assertEqual(self.content, server.files['/remote.php/dav/files/user/test_dir/test.bin'])
+        self.assertEqual(['MKCOL', 'PUT'], [method for (method, _) in server.requests])
+
+    def test_upload_file_with_progress_has_content_length(self):
+        server, client = self.start_server()
+        progress = []
+        client.upload_file('test_dir/test.bin', self.local_path,
+                           progress=lambda current, total: progress.append((current, total)))
+        # the stand-in reads the body by Content-Length header only, so chunked body would be stored empty
+        self.assertEqual(self.content, server.files['/remote.php/dav/files/user/test_dir/test.bin'])
+        self.assertEqual((10000, 10000), progress[-1])
+
+    def test_upload_file_pipeline(self):
+        server, client = self.start_server()
+        client.chunk_size = 1024
+        client.upload_file('test_dir/test.bin', self.local_path, pipeline=2)
+        self.assertEqual(self.content, server.files['/remote.php/dav/files/user/test_dir/test.bin'])
+
+    def test_small_file_uploaded_by_single_put(self):
+        server, client = self.start_server()
+        client.upload_chunked('test_dir/test.bin', self.local_path)
+        self.assertEqual([('PUT', '/remote.php/dav/files/user/test_dir/test.bin')], server.requests)
+
+    def test_resume_chunked(self):
+        server, client = self.start_server()
+        server.failures['00003'] = 1
+        with self.assertRaises(ResponseErrorCode):
+            client.upload_chunked('test_dir/test.bin', self.local_path, chunk_size=1024, retries=1, max_workers=1,
+                                  resume=True)
+        self.assertTrue(os.path.exists(self.local_path + Client.upload_journal_suffix))
+        del server.requests[:]
+        client.upload_chunked('test_dir/test.bin', self.local_path, chunk_size=4096, resume=True)
+        self.assertEqual(self.content, server.files['/remote.php/dav/files/user/test_dir/test.bin'])
+        self.assertEqual('PROPFIND', server.requests[0][0])
+        self.assertEqual('MOVE', server.requests[-1][0])
+        uploaded = [path[-5:] for (method, path) in server.requests if method == 'PUT']
+        self.assertIn('00003', uploaded)
+        self.assertNotIn('00001', uploaded)
+        self.assertNotIn('00002', uploaded)
+        self.assertFalse(os.path.exists(self.local_path + Client.upload_journal_suffix))
+
+    def resume_upload(self, partial_update):
+        server, client = self.start_server(partial_update=partial_update)
+        server.interrupt_after = 4000
+        with self.assertRaises(ResponseErrorCode):
+            client.upload_file('test_dir/test.bin', self.local_path, resume=True)
+        self.assertEqual(4000, len(server.files['/remote.php/dav/files/user/test_dir/test.bin']))
+        del server.requests[:]
+        client.upload_file('test_dir/test.bin', self.local_path, resume=True)
+        self.assertEqual(self.content, server.files['/remote.php/dav/files/user/test_dir/test.bin'])
+        self.assertFalse(os.path.exists(self.local_path + Client.upload_journal_suffix))
+        return [method for (method, _) in server.requests]
+
+    def test_resume_by_patch(self):
+        self.assertEqual(['PROPFIND', 'GET', 'PATCH'], self.resume_upload('patch'))
+
+    def test_resume_by_content_range(self):
+        self.assertEqual(['PROPFIND', 'GET', 'PATCH', 'PUT', 'PROPFIND'], self.resume_upload('range'))
+
+    def test_resume_not_supported(self):
+        self.assertEqual(['PROPFIND', 'GET', 'PATCH', 'PUT', 'PUT'], self.resume_upload(None))
+
+    def test_resume_previous_version(self):
+        server, client = self.start_server(partial_update='patch')
+        server.interrupt_after = 4000
+        with self.assertRaises(ResponseErrorCode):
+            client.upload_file('test_dir/test.bin', self.local_path, resume=True)
+        self.assertEqual([('PUT', '/remote.php/dav/files/user/test_dir/test.bin')], server.requests)
+        # the interrupted request did not store anything, the previous version of file is left
+        server.files['/remote.php/dav/files/user/test_dir/test.bin'] = os.urandom(4000)
+        del server.requests[:]
+        client.upload_file('test_dir/test.bin', self.local_path, resume=True)
+        self.assertEqual(self.content, server.files['/remote.php/dav/files/user/test_dir/test.bin'])
+        self.assertEqual(['PROPFIND', 'GET', 'PUT'], [method for (method, _) in server.requests])
+
+
+if __name__ == '__main__':
+    unittest.main()
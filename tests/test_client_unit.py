@@ -1,12 +1,23 @@
 # coding=utf-8
+import hashlib
+import os
+import tempfile
 import unittest
+from io import BytesIO
+from urllib.parse import urlsplit
 from unittest import TestCase
-from unittest.mock import patch, Mock, PropertyMock
+from unittest.mock import patch, Mock, MagicMock, PropertyMock
 
-from lxml.etree import ElementTree, Element
+from http.client import IncompleteRead
+from lxml.etree import ElementTree, Element, XMLSyntaxError
+from urllib3.exceptions import ProtocolError
 
-from webdav3.client import WebDavXmlUtils as Utils, listdir, MethodNotSupported, RemoteResourceNotFound, Client
-from webdav3.exceptions import ResponseErrorCode, NotEnoughSpace
+from webdav3.client import WebDavXmlUtils as Utils, listdir, MethodNotSupported, RemoteResourceNotFound, Client, \
+    WebDAVAdapter, UploadBody, DiskWriter, TransferStream
+from webdav3.exceptions import ResponseErrorCode, NotEnoughSpace, RemoteParentNotFound, OptionNotValid, TransferErrors, \
+    ChecksumMismatch, ConnectionException
+from webdav3.cache import ETagIndex
+from webdav3.checksum import Checksums
 
 
 def read_file_content(file_name):
@@ -36,6 +47,30 @@ class ClientTestCase(TestCase):
         self.assertEqual(result[0]['path'], '/test_dir/test.txt')
         self.assertEqual(result[0]['content_type'], 'text/plain')
 
+    def test_iter_get_list_info_response(self):
+        for name in ('get_list.xml', 'get_list_info.xml', 'get_list_directories.xml', 'get_list_empty.xml'):
+            content = read_file_content('./tests/responses/' + name)
+            result = list(Utils.iter_get_list_info_response(BytesIO(content)))
+            self.assertEqual(Utils.parse_get_list_info_response(content), result, name)
+        content = read_file_content('./tests/responses/get_list_incorrect.xml')
+        with self.assertRaises(XMLSyntaxError):
+            list(Utils.iter_get_list_info_response(BytesIO(content)))
+
+    @patch('requests.Session')
+    def test_list_truncated(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        content = read_file_content('./tests/responses/get_list.xml')
+        client.session.request.return_value.status_code = 207
+        client.session.request.return_value.raw = BytesIO(content[:len(content) // 2])
+        self.assertRaises(ResponseErrorCode, client.list, 'test_dir')
+
+        class BrokenRaw(BytesIO):
+            def read(self, *args):
+                raise ProtocolError('Connection broken', IncompleteRead(b''))
+
+        client.session.request.return_value.raw = BrokenRaw()
+        self.assertRaises(ConnectionException, client.list, 'test_dir')
+
     def test_parse_get_list_response_empty(self):
         content = read_file_content('./tests/responses/get_list_empty.xml')
         result = Utils.parse_get_list_response(content)
@@ -91,6 +126,21 @@ class ClientTestCase(TestCase):
         self.assertEqual(result['size'], '41')
         self.assertEqual(result['content_type'], 'text/plain')
 
+    def test_decode_response(self):
+        content = b'<?xml version="1.0" encoding="utf-8"?><d:multistatus xmlns:d="DAV:"><d:response>' \
+                  b'<d:href>/test_dir/test.txt</d:href>' \
+                  b'<d:propstat><d:prop><d:getcontentlength>41</d:getcontentlength><d:displayname/></d:prop>' \
+                  b'<d:status>HTTP/1.1 200 OK</d:status></d:propstat>' \
+                  b'<d:propstat><d:prop><d:getetag/><d:getcontentlength/></d:prop>' \
+                  b'<d:status>HTTP/1.1 404 Not Found</d:status></d:propstat></d:response></d:multistatus>'
+        response = Utils.extract_response_for_path(content, '/test_dir/test.txt', 'localhost')
+        href, is_dir, info = Utils.decode_response(response)
+        self.assertEqual('/test_dir/test.txt', href)
+        self.assertFalse(is_dir)
+        self.assertEqual('41', info['size'])
+        self.assertEqual('', info['name'])
+        self.assertIsNone(info['created'])
+
     def test_create_get_property_request_content(self):
         option = {
             'namespace': 'test',
@@ -249,6 +299,919 @@ class ClientTestCase(TestCase):
         client.session.request.return_value.status_code = 507
         self.assertRaises(NotEnoughSpace, client.execute_request, action='list', path='')
 
+    def test_connection_pool_configured(self):
+        client = Client(dict(self.options, webdav_pool_maxsize=64, webdav_pool_block=True))
+        adapter = client.session.get_adapter('http://localhost:8585')
+        self.assertIsInstance(adapter, WebDAVAdapter)
+        self.assertIs(adapter, client.session.get_adapter('https://localhost:8585'))
+        self.assertEqual(64, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+
+    def test_pool_block_string(self):
+        client = Client(dict(self.options, webdav_pool_block='False'))
+        self.assertFalse(client.session.get_adapter('http://localhost:8585')._pool_block)
+        client = Client(dict(self.options, webdav_pool_block='yes'))
+        self.assertTrue(client.session.get_adapter('http://localhost:8585')._pool_block)
+        self.assertRaises(OptionNotValid, Client, dict(self.options, webdav_pool_block='sometimes'))
+
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_idle_connections_dropped(self, mock_send):
+        adapter = WebDAVAdapter(keep_alive_timeout=5)
+        adapter.poolmanager = Mock()
+        adapter.send(Mock())
+        adapter.poolmanager.clear.assert_not_called()
+        adapter._last_used -= 10
+        adapter.send(Mock())
+        adapter.poolmanager.clear.assert_called_once_with()
+        self.assertEqual(2, mock_send.call_count)
+
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_idle_time_counted_from_release(self, mock_send):
+        adapter = WebDAVAdapter(keep_alive_timeout=5)
+        adapter.poolmanager = Mock()
+        response = adapter.send(Mock())
+        # the long transfer ends by release of the connection
+        adapter._last_used -= 10
+        response.raw.release_conn()
+        adapter.send(Mock())
+        adapter.poolmanager.clear.assert_not_called()
+
+    @patch('requests.Session')
+    def test_optimistic_download_sends_only_get(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.iter_content.return_value = [b'content']
+        client.download_from(buff=Mock(), remote_path='test_dir/test.txt')
+        self.assertEqual(1, client.session.request.call_count)
+        self.assertEqual('GET', client.session.request.call_args[1]['method'])
+
+    @patch('requests.Session')
+    def test_download_from_progress(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.headers = {'content-length': '12'}
+        client.session.request.return_value.iter_content.return_value = [b'test ', b'content']
+        progress = []
+        buff = BytesIO()
+        client.download_from(buff=buff, remote_path='test_dir/test.txt',
+                             progress=lambda current, total: progress.append((current, total)))
+        self.assertEqual(b'test content', buff.getvalue())
+        self.assertEqual([(0, 12), (5, 12), (12, 12)], progress)
+
+    @patch('requests.Session')
+    def test_optimistic_upload_parent_not_found(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.session.request.return_value.status_code = 409
+        self.assertRaises(RemoteParentNotFound, client.upload_to, buff=b'content', remote_path='wrong/test.txt')
+        self.assertEqual(1, client.session.request.call_count)
+
+    @patch('requests.Session')
+    def test_optimistic_download_directory_not_valid(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.session.request.return_value.status_code = 405
+        self.assertRaises(OptionNotValid, client.download_iter, remote_path='test_dir')
+
+    @patch('requests.Session')
+    def test_optimistic_upload_file_force_creates_parent(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        conflict, created = Mock(status_code=409), Mock(status_code=201)
+        client.session.request.side_effect = [conflict, created, created]
+        client.upload_file(remote_path='test_dir/test.txt', local_path='./tests/test.txt', force=True)
+        methods = [c[1]['method'] for c in client.session.request.call_args_list]
+        self.assertEqual(['PUT', 'MKCOL', 'PUT'], methods)
+
+    def directories_session(self, client, existing):
+        requested = []
+
+        def request(method, url, headers, **kwargs):
+            path = url[len(self.options['webdav_hostname']):]
+            requested.append((method, path))
+            parent = path.rstrip('/').rpartition('/')[0] + '/'
+            if method in ('MKCOL', 'PUT') and parent != '/' and parent not in existing:
+                return Mock(status_code=409)
+            if method == 'MKCOL':
+                if path in existing:
+                    return Mock(status_code=405)
+                existing.add(path)
+            return Mock(status_code=201 if method in ('MKCOL', 'PUT') else 200)
+
+        client.session.request.side_effect = request
+        return requested
+
+    @patch('requests.Session')
+    def test_make_directories(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        requested = self.directories_session(client, {'/a/'})
+        client.make_directories(['a/b/c/', 'a/b/d', 'a/', 'e'])
+        self.assertEqual([('MKCOL', '/a/'), ('MKCOL', '/e/'), ('MKCOL', '/a/b/'), ('MKCOL', '/a/b/c/'),
+                          ('MKCOL', '/a/b/d/')], requested)
+        del requested[:]
+        client.make_directories(['a/b/c/'])
+        self.assertTrue(client.mkdir('a/b/d', recursive=True))
+        client.upload_file(remote_path='a/b/c/test.txt', local_path='./tests/test.txt', force=True)
+        self.assertEqual([('PUT', '/a/b/c/test.txt')], requested)
+
+    @patch('requests.Session')
+    def test_mkdir_recursive_known_directories(self, mock_session):
+        client = Client(self.options)
+        requested = self.directories_session(client, {'/a/'})
+        client.mkdir('a/b/c', recursive=True)
+        self.assertEqual([('MKCOL', '/a/'), ('MKCOL', '/a/b/'), ('MKCOL', '/a/b/c/')], requested)
+        del requested[:]
+        client.mkdir('a/b/d')
+        client.upload_file(remote_path='a/b/c/test.txt', local_path='./tests/test.txt')
+        self.assertEqual([('MKCOL', '/a/b/d/'), ('PUT', '/a/b/c/test.txt')], requested)
+        client.clean('a/b/')
+        self.assertNotIn('/a/b/c', client.directories)
+        self.assertIn('/a', client.directories)
+
+    @patch('requests.Session')
+    def test_removed_known_directory(self, mock_session):
+        client = Client(self.options)
+        existing = {'/a/'}
+        requested = self.directories_session(client, existing)
+        client.mkdir('a/b/c', recursive=True)
+        existing.difference_update({'/a/b/', '/a/b/c/'})
+        del requested[:]
+        client.upload_file(remote_path='a/b/c/test.txt', local_path='./tests/test.txt', force=True)
+        self.assertEqual([('PUT', '/a/b/c/test.txt'), ('MKCOL', '/a/b/c/'), ('MKCOL', '/a/b/'), ('MKCOL', '/a/b/c/'),
+                          ('PUT', '/a/b/c/test.txt')], requested)
+        existing.difference_update({'/a/b/', '/a/b/c/'})
+        with self.assertRaises(RemoteParentNotFound):
+            client.mkdir('a/b/c/d')
+        self.assertNotIn('/a/b/c', client.directories)
+        self.assertIn('/a/b', client.directories)
+
+    @patch('requests.Session')
+    def test_metadata_cache_filled_by_list(self, mock_session):
+        client = Client(dict(self.options, webdav_metadata_cache_size=100))
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.raw = BytesIO(read_file_content('./tests/responses/get_list.xml'))
+        self.assertEqual(['/test_dir/test.txt'], [info['path'] for info in client.list('test_dir', get_info=True)])
+        requests_count = client.session.request.call_count
+
+        self.assertTrue(client.check('test_dir/test.txt'))
+        self.assertFalse(client.is_dir('test_dir/test.txt'))
+        self.assertTrue(client.is_dir('test_dir'))
+        self.assertEqual('text/plain', client.info('test_dir/test.txt')['content_type'])
+        self.assertNotIn('path', client.info('test_dir/test.txt'))
+        self.assertEqual(requests_count, client.session.request.call_count)
+        self.assertEqual(5, client.cache.stats()['hits'])
+
+    @patch('requests.Session')
+    def test_metadata_cache_invalidated_by_upload(self, mock_session):
+        client = Client(dict(self.options, webdav_metadata_cache_size=100))
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.raw = BytesIO(read_file_content('./tests/responses/get_list.xml'))
+        client.list('test_dir')
+        client.upload_to(buff=b'content', remote_path='test_dir/test.txt')
+        self.assertIsNone(client.cache.get('/test_dir/test.txt', complete=False))
+        self.assertIsNone(client.cache.get('/test_dir', complete=False))
+
+    @patch('requests.Session')
+    def test_iter_list(self, mock_session):
+        client = Client(self.options)
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.raw = BytesIO(read_file_content('./tests/responses/get_list.xml'))
+        result = client.iter_list('test_dir', get_info=True)
+        self.assertEqual(0, client.session.request.call_count)
+        self.assertEqual(['/test_dir/test.txt'], [info['path'] for info in result])
+        self.assertTrue(client.session.request.return_value.raw.decode_content)
+
+
+    @patch('requests.Session')
+    def test_list_typed(self, mock_session):
+        client = Client(self.options)
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.raw = BytesIO(read_file_content('./tests/responses/get_list_info.xml'))
+        result = client.list('test_dir', get_info=True, typed=True)
+        self.assertEqual(Utils.parse_get_list_info_response(read_file_content('./tests/responses/get_list_info.xml')),
+                         [info.to_dict() for info in result])
+        self.assertEqual(41, result[0].size)
+
+    @patch('requests.Session')
+    def test_info_typed(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.session.request.return_value.status_code = 207
+        client.session.request.return_value.content = read_file_content('./tests/responses/get_info.xml')
+        result = client.info('test_dir/test.txt', typed=True)
+        self.assertEqual(41, result.size)
+        self.assertEqual('/test_dir/test.txt', result.path)
+        self.assertEqual(1508339764.0, result.modified)
+
+    def test_create_propfind_request_content(self):
+        result = Utils.create_propfind_request_content(('getetag', 'resourcetype'))
+        self.assertEqual(result, b'<?xml version=\'1.0\' encoding=\'UTF-8\'?>\n<propfind xmlns="DAV:"><prop>'
+                                 b'<getetag/><resourcetype/></prop></propfind>')
+        self.assertIs(result, Utils.create_propfind_request_content(('getetag', 'resourcetype')))
+
+    @patch('requests.Session')
+    def test_list_properties(self, mock_session):
+        client = Client(dict(self.options, webdav_metadata_cache_size=100))
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.raw = BytesIO(read_file_content('./tests/responses/get_list_info.xml'))
+        result = client.list('test_dir', get_info=True, properties=['etag', 'size'])
+        self.assertEqual('41', result[0]['size'])
+        _, kwargs = client.session.request.call_args
+        self.assertEqual(Utils.create_propfind_request_content(('getcontentlength', 'getetag', 'resourcetype')),
+                         kwargs['data'])
+        self.assertEqual('text/xml', kwargs['headers']['Content-Type'])
+        self.assertIsNone(client.cache.get('/test_dir/test.txt'))
+        self.assertIsNotNone(client.cache.get('/test_dir/test.txt', complete=False))
+
+    @patch('requests.Session')
+    def test_list_names_requests_resourcetype_only(self, mock_session):
+        client = Client(self.options)
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.raw = BytesIO(read_file_content('./tests/responses/get_list.xml'))
+        self.assertEqual(['test.txt'], client.list('test_dir'))
+        _, kwargs = client.session.request.call_args
+        self.assertEqual(Utils.create_propfind_request_content(('resourcetype',)), kwargs['data'])
+
+    def test_list_wrong_property(self):
+        client = Client(self.options)
+        with self.assertRaises(OptionNotValid):
+            client.list('test_dir', get_info=True, properties=['wrong'])
+
+    @staticmethod
+    def multistatus(*paths, etags=None):
+        etags = etags or {}
+        responses = ''.join('<d:response><d:href>{path}</d:href><d:propstat><d:prop><d:resourcetype>{type}'
+                            '</d:resourcetype>{etag}</d:prop><d:status>HTTP/1.1 200 OK</d:status></d:propstat>'
+                            '</d:response>'.format(path=path, type='<d:collection/>' if path.endswith('/') else '',
+                                                   etag='<d:getetag>{}</d:getetag>'.format(etags[path])
+                                                   if path in etags else '')
+                            for path in paths)
+        return '<?xml version="1.0" encoding="utf-8"?><d:multistatus xmlns:d="DAV:">{responses}</d:multistatus>' \
+            .format(responses=responses).encode('utf-8')
+
+    def crawl_session(self, client, tree, contents=None, etags=None):
+        requested = []
+        etags = etags or {}
+
+        def request(method, url, headers, **kwargs):
+            path = url[len(self.options['webdav_hostname']):]
+            response = MagicMock()
+            if method in ('GET', 'PUT', 'MKCOL'):
+                requested.append((method, path))
+                data = kwargs.get('data')
+                if method == 'PUT':
+                    contents[path] = data.read() if hasattr(data, 'read') else b''.join(bytes(chunk) for chunk in data)
+                response.status_code = 404 if method == 'GET' and path not in contents else 201
+                response.headers = {'etag': etags[path]} if path in etags else {}
+                response.iter_content.return_value = [contents.get(path, b'')]
+                return response
+            requested.append((path, headers.get('Depth')))
+            if headers.get('Depth') == 'infinity':
+                response.status_code = 403
+                return response
+            if path not in tree:
+                response.status_code = 404
+                return response
+            response.status_code = 207
+            response.content = self.multistatus(path, *tree.get(path, []), etags=etags)
+            response.raw = BytesIO(response.content)
+            return response
+
+        client.session.request.side_effect = request
+        return requested
+
+    @patch('requests.Session')
+    def test_walk(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        self.crawl_session(client, {
+            '/test_dir/': ['/test_dir/a/', '/test_dir/b/', '/test_dir/test.txt'],
+            '/test_dir/a/': ['/test_dir/a/nested/', '/test_dir/a/a.txt'],
+            '/test_dir/a/nested/': ['/test_dir/a/nested/n.txt'],
+            '/test_dir/b/': ['/test_dir/b/b.txt'],
+        })
+        result = {path: (sorted(directories), sorted(files)) for path, directories, files in
+                  client.walk('test_dir', max_workers=2)}
+        self.assertEqual({
+            '/test_dir/': (['a', 'b'], ['test.txt']),
+            '/test_dir/a/': (['nested'], ['a.txt']),
+            '/test_dir/a/nested/': ([], ['n.txt']),
+            '/test_dir/b/': ([], ['b.txt']),
+        }, result)
+
+    @patch('requests.Session')
+    def test_walk_prune(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        requested = self.crawl_session(client, {
+            '/test_dir/': ['/test_dir/a/', '/test_dir/b/'],
+            '/test_dir/a/': ['/test_dir/a/a.txt'],
+        })
+        for path, directories, files in client.walk('test_dir'):
+            if 'b' in directories:
+                directories.remove('b')
+        self.assertEqual([('/test_dir/', '1'), ('/test_dir/a/', '1')], requested)
+
+    @patch('requests.Session')
+    def test_list_recursive_fallback(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        requested = self.crawl_session(client, {
+            '/test_dir/': ['/test_dir/a/', '/test_dir/test.txt'],
+            '/test_dir/a/': ['/test_dir/a/a.txt'],
+        })
+        self.assertEqual(['/test_dir/a/', '/test_dir/a/a.txt', '/test_dir/test.txt'],
+                         sorted(info['path'] for info in client.list('test_dir', get_info=True, recursive=True)))
+        self.assertFalse(client.depth_infinity)
+        self.assertEqual(['a.txt', 'a/', 'test.txt'], sorted(client.list('test_dir', recursive=True)))
+        self.assertEqual(1, [depth for _, depth in requested].count('infinity'))
+
+    @patch('requests.Session')
+    def test_info_batch(self, mock_session):
+        client = Client(self.options)
+        requested = self.crawl_session(client, {
+            '/test_dir/': ['/test_dir/a/', '/test_dir/test.txt'],
+            '/test_dir/a/': ['/test_dir/a/a.txt', '/test_dir/a/b.txt'],
+        })
+        result = client.info_batch(['test_dir/test.txt', 'test_dir/a', 'test_dir/a/a.txt', 'test_dir/a/b.txt',
+                                    'test_dir/a/wrong.txt', 'wrong/wrong.txt'], max_workers=2)
+        self.assertEqual(['/test_dir/', '/test_dir/a/', '/wrong/'], sorted(path for path, _ in requested))
+        self.assertIsNone(result['test_dir/a/wrong.txt'])
+        self.assertIsNone(result['wrong/wrong.txt'])
+        self.assertNotIn('path', result['test_dir/a/a.txt'])
+        self.assertEqual(6, len(result))
+
+    @patch('requests.Session')
+    def test_info_batch_typed(self, mock_session):
+        client = Client(self.options)
+        self.crawl_session(client, {'/test_dir/': ['/test_dir/test.txt']})
+        result = client.info_batch(['test_dir/test.txt'], typed=True)
+        self.assertEqual('/test_dir/test.txt', result['test_dir/test.txt'].path)
+
+    def ranged_session(self, client, content, support_ranges=True):
+        requested = []
+
+        def request(method, url, headers, **kwargs):
+            requested.append(headers.get('Range'))
+            response = MagicMock()
+            response.headers = {'etag': '"1"'}
+            body = content
+            if support_ranges and 'Range' in headers and headers.get('If-Range', '"1"') == '"1"':
+                start, end = headers['Range'][len('bytes='):].split('-')
+                start, end = int(start), min(int(end or len(content)), len(content) - 1)
+                body = content[start:end + 1]
+                response.status_code = 206
+                response.headers['content-range'] = 'bytes {}-{}/{}'.format(start, end, len(content))
+            else:
+                response.status_code = 200
+                response.headers['content-length'] = str(len(content))
+            response.content = body
+            response.iter_content.side_effect = lambda chunk_size: (body[i:i + chunk_size]
+                                                                    for i in range(0, len(body), chunk_size))
+            return response
+
+        client.session.request.side_effect = request
+        return requested
+
+    @patch('requests.Session')
+    def test_download_file_segments(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.chunk_size = 1000
+        content = os.urandom(10500)
+        requested = self.ranged_session(client, content)
+        progress = []
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test.bin')
+            client.download_file('test_dir/test.bin', local_path, progress=lambda current, total: progress.append(
+                (current, total)), connections=4)
+            with open(local_path, 'rb') as f:
+                self.assertEqual(content, f.read())
+        self.assertEqual(5, len(requested))
+        self.assertEqual((len(content), len(content)), max(progress))
+
+    @patch('requests.Session')
+    def test_download_file_segments_not_supported(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        content = os.urandom(10500)
+        requested = self.ranged_session(client, content, support_ranges=False)
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test.bin')
+            client.download_file('test_dir/test.bin', local_path, connections=4)
+            with open(local_path, 'rb') as f:
+                self.assertEqual(content, f.read())
+        self.assertEqual(2, len(requested))
+        self.assertIsNone(requested[-1])
+
+    @patch('requests.Session')
+    def test_download_file_resume(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        content = os.urandom(10500)
+        requested = self.ranged_session(client, content)
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test.bin')
+            with open(local_path, 'wb') as f:
+                f.write(content[:4000] + b'garbage')
+            with open(local_path + Client.resume_suffix, 'w') as f:
+                f.write('{"etag": "\\"1\\"", "written": 4000}')
+            client.download_file('test_dir/test.bin', local_path, resume=True)
+            with open(local_path, 'rb') as f:
+                self.assertEqual(content, f.read())
+            self.assertFalse(os.path.exists(local_path + Client.resume_suffix))
+        self.assertEqual(['bytes=4000-'], requested)
+
+    @patch('requests.Session')
+    def test_download_file_resume_changed(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        content = os.urandom(10500)
+        self.ranged_session(client, content)
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test.bin')
+            with open(local_path, 'wb') as f:
+                f.write(os.urandom(4000))
+            with open(local_path + Client.resume_suffix, 'w') as f:
+                f.write('{"etag": "\\"0\\"", "written": 4000}')
+            client.download_file('test_dir/test.bin', local_path, resume=True)
+            with open(local_path, 'rb') as f:
+                self.assertEqual(content, f.read())
+
+    @patch('requests.Session')
+    def test_download_file_interrupted(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+
+        def iter_content(chunk_size):
+            yield b'a' * 100
+            raise ConnectionError()
+
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.headers = {'etag': '"1"'}
+        client.session.request.return_value.iter_content.side_effect = iter_content
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test.bin')
+            with self.assertRaises(ConnectionError):
+                client.download_file('test_dir/test.bin', local_path, resume=True)
+            self.assertEqual({'etag': '"1"', 'written': 100},
+                             Client._read_resume_state(local_path + Client.resume_suffix))
+
+    @patch('requests.Session')
+    def test_download_file_interrupted_pipeline(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True, webdav_pipeline_depth=4))
+
+        def iter_content(chunk_size):
+            for _ in range(10):
+                yield b'a' * 10
+            raise ConnectionError()
+
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.headers = {'etag': '"1"'}
+        client.session.request.return_value.iter_content.side_effect = iter_content
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test.bin')
+            with self.assertRaises(ConnectionError):
+                client.download_file('test_dir/test.bin', local_path, resume=True)
+            # the queued blocks are written before the state of downloading is saved
+            self.assertEqual(100, os.path.getsize(local_path))
+            self.assertEqual({'etag': '"1"', 'written': 100},
+                             Client._read_resume_state(local_path + Client.resume_suffix))
+
+    @patch('requests.Session')
+    def test_download_file_resume_wrong_range(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        content = os.urandom(10500)
+        requested = self.ranged_session(client, content)
+        request = client.session.request.side_effect
+
+        def wrong_range(method, url, headers, **kwargs):
+            # the server returns the part which does not start at requested position
+            return request(method, url, dict(headers, Range='bytes=0-') if 'Range' in headers else headers, **kwargs)
+
+        client.session.request.side_effect = wrong_range
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test.bin')
+            with open(local_path, 'wb') as f:
+                f.write(content[:4000])
+            with open(local_path + Client.resume_suffix, 'w') as f:
+                f.write('{"etag": "\\"1\\"", "written": 4000}')
+            client.download_file('test_dir/test.bin', local_path, resume=True)
+            with open(local_path, 'rb') as f:
+                self.assertEqual(content, f.read())
+        self.assertEqual(['bytes=0-', None], requested)
+
+    @patch('requests.Session')
+    def test_download_file_checkpoint(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        states = []
+
+        def iter_content(chunk_size):
+            for _ in range(3):
+                yield b'a' * 10
+                states.append(Client._read_resume_state(local_path + Client.resume_suffix))
+
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.headers = {'etag': '"1"'}
+        client.session.request.return_value.iter_content.side_effect = iter_content
+        with tempfile.TemporaryDirectory() as directory, patch.object(DiskWriter, 'checkpoint_size', 20):
+            local_path = os.path.join(directory, 'test.bin')
+            client.download_file('test_dir/test.bin', local_path, resume=True)
+            self.assertEqual(['test.bin'], os.listdir(directory))
+        # the state is saved while the file is written, so it is not lost when the process is killed
+        self.assertEqual([0, 20, 20], [state['written'] for state in states])
+
+    @patch('os.fsync')
+    def test_disk_writer(self, mock_fsync):
+        with tempfile.TemporaryFile() as f:
+            writer = DiskWriter(f, depth=2, fsync=8)
+            for block in (b'test', b'test', b'test'):
+                writer.write(block)
+            self.assertEqual(12, writer.close())
+            f.seek(0)
+            self.assertEqual(b'testtesttest', f.read())
+        # synchronized after 8 bytes and when it is closed
+        self.assertEqual(2, mock_fsync.call_count)
+
+    def test_disk_writer_error(self):
+        local_file = MagicMock()
+        local_file.write.side_effect = OSError('No space left on device')
+        writer = DiskWriter(local_file, depth=1)
+        writer.write(b'test')
+        with self.assertRaises(OSError):
+            for _ in range(3):
+                writer.write(b'test')
+            writer.close()
+        writer.abort()
+
+    def test_upload_body_pipeline(self):
+        progress = []
+        checksums = Checksums('md5')
+        content = os.urandom(1000)
+        body = UploadBody(BytesIO(content), 1000, chunk_size=64, checksums=checksums, pipeline=3,
+                          progress=lambda current, total: progress.append(current))
+        self.assertEqual(content, b''.join(bytes(block) for block in body))
+        self.assertEqual(1000, progress[-1])
+        self.assertEqual(hashlib.md5(content).hexdigest(), checksums['md5'])
+        blocks = iter(body)
+        self.assertEqual(content[:64], bytes(next(blocks)))
+        blocks.close()
+        self.assertEqual(content, b''.join(bytes(block) for block in body))
+
+    @patch('requests.Session')
+    def test_download_directory_parallel(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        requested = self.crawl_session(client, {
+            '/test_dir/': ['/test_dir/a/', '/test_dir/test.txt', '/test_dir/wrong.txt'],
+            '/test_dir/a/': ['/test_dir/a/a.txt', '/test_dir/a/empty/'],
+            '/test_dir/a/empty/': [],
+        }, {'/test_dir/test.txt': b'test', '/test_dir/a/a.txt': b'nested'})
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(TransferErrors) as context:
+                client.download_directory('test_dir', os.path.join(directory, 'test_dir'), max_workers=4)
+            self.assertEqual(['/test_dir/wrong.txt'], [path for path, _ in context.exception.errors])
+            with open(os.path.join(directory, 'test_dir', 'a', 'a.txt'), 'rb') as f:
+                self.assertEqual(b'nested', f.read())
+            self.assertTrue(os.path.isdir(os.path.join(directory, 'test_dir', 'a', 'empty')))
+        self.assertEqual(3, len([path for method, path in requested if method == 'GET']))
+
+    @patch('requests.Session')
+    def test_download_file_conditional(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.headers = {'etag': '"1"'}
+        client.session.request.return_value.iter_content.return_value = [b'test']
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test.txt')
+            self.assertTrue(client.download_file('test_dir/test.txt', local_path, conditional=True))
+            self.assertTrue(os.path.exists(os.path.join(directory, ETagIndex.file_name)))
+
+            client.session.request.return_value.status_code = 304
+            self.assertFalse(client.download_file('test_dir/test.txt', local_path, conditional=True))
+            self.assertEqual('"1"', client.session.request.call_args[1]['headers']['If-None-Match'])
+            with open(local_path, 'rb') as f:
+                self.assertEqual(b'test', f.read())
+
+    @patch('requests.Session')
+    def test_download_directory_conditional(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        tree = {'/test_dir/': ['/test_dir/a.txt', '/test_dir/b.txt']}
+        contents = {'/test_dir/a.txt': b'a', '/test_dir/b.txt': b'b'}
+        etags = {'/test_dir/a.txt': '"1"', '/test_dir/b.txt': '"1"'}
+        requested = self.crawl_session(client, tree, contents, etags)
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test_dir')
+            client.download_directory('test_dir', local_path, conditional=True)
+            etags['/test_dir/b.txt'] = '"2"'
+            contents['/test_dir/b.txt'] = b'changed'
+            del requested[:]
+            client.download_directory('test_dir', local_path, conditional=True)
+            self.assertEqual([('GET', '/test_dir/b.txt')], [item for item in requested if item[0] == 'GET'])
+            with open(os.path.join(local_path, 'b.txt'), 'rb') as f:
+                self.assertEqual(b'changed', f.read())
+
+    @patch('requests.Session')
+    def test_download_file_checksums(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.headers = {'oc-checksum': 'MD5:' + hashlib.md5(b'test').hexdigest()}
+        client.session.request.return_value.iter_content.return_value = [b'te', b'st']
+        checksums = Checksums('md5', 'sha1')
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test.txt')
+            client.download_file('test_dir/test.txt', local_path, checksums=checksums)
+            self.assertEqual(hashlib.sha1(b'test').hexdigest(), checksums['sha1'])
+            self.assertEqual(('md5',), checksums.verified)
+
+            client.session.request.return_value.headers = {'oc-checksum': 'MD5:0000'}
+            with self.assertRaises(ChecksumMismatch):
+                client.download_file('test_dir/test.txt', local_path, checksums=checksums)
+
+    @patch('requests.Session')
+    def test_upload_to_checksums(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        sent = []
+
+        def request(method, url, headers, data, **kwargs):
+            sent.append(data if isinstance(data, bytes) else b''.join(bytes(chunk) for chunk in data))
+            response = MagicMock()
+            response.status_code = 201
+            response.headers = {'oc-checksum': 'SHA1:' + hashlib.sha1(b'test').hexdigest()}
+            return response
+
+        client.session.request.side_effect = request
+        checksums = Checksums('sha1')
+        client.upload_to(b'test', 'test_dir/test.txt', checksums=checksums)
+        self.assertEqual(('sha1',), checksums.verified)
+        client.upload_to(BytesIO(b'test'), 'test_dir/test.txt', checksums=checksums)
+        self.assertEqual(4, len(client.session.request.call_args[1]['data']))
+        self.assertEqual(('sha1',), checksums.verified)
+        self.assertEqual([b'test', b'test'], sent)
+
+    @patch('requests.Session')
+    def test_upload_file_checksums_property(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+
+        def request(method, url, headers, **kwargs):
+            response = MagicMock()
+            response.status_code = 201
+            response.headers = {}
+            if method == 'PUT':
+                list(kwargs['data'])
+            else:
+                response.status_code = 207
+                response.content = '<?xml version="1.0"?><d:multistatus xmlns:d="DAV:" ' \
+                                   'xmlns:oc="http://owncloud.org/ns"><d:response><d:href>/test_dir/test.txt</d:href>' \
+                                   '<d:propstat><d:prop><oc:checksums><oc:checksum>SHA1:{} MD5:00</oc:checksum>' \
+                                   '</oc:checksums></d:prop></d:propstat></d:response></d:multistatus>' \
+                    .format(hashlib.sha1(b'test').hexdigest()).encode('utf-8')
+            return response
+
+        client.session.request.side_effect = request
+        checksums = Checksums('sha1')
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, 'test.txt')
+            with open(local_path, 'wb') as f:
+                f.write(b'test')
+            client.upload_file('test_dir/test.txt', local_path, checksums=checksums)
+        self.assertEqual(('sha1',), checksums.verified)
+        self.assertEqual('PROPFIND', client.session.request.call_args[1]['method'])
+
+    @patch('requests.Session')
+    def test_download_file_content_cache(self, mock_session):
+        with tempfile.TemporaryDirectory() as directory:
+            client = Client(dict(self.options, webdav_optimistic=True,
+                                 webdav_content_cache_path=os.path.join(directory, 'cache')))
+            requested = []
+
+            def request(method, url, headers, **kwargs):
+                requested.append(headers.get('If-None-Match'))
+                response = MagicMock()
+                response.status_code = 304 if headers.get('If-None-Match') == '"1"' else 200
+                response.headers = {'etag': '"1"', 'content-length': '4'}
+                response.iter_content.return_value = [b'te', b'st']
+                return response
+
+            client.session.request.side_effect = request
+            for name in ('a.txt', 'b.txt'):
+                client.download_file('test_dir/test.txt', os.path.join(directory, name))
+                with open(os.path.join(directory, name), 'rb') as f:
+                    self.assertEqual(b'test', f.read())
+            self.assertEqual(b'test', b''.join(client.download_iter('test_dir/test.txt')))
+            self.assertEqual([None, '"1"', '"1"'], requested)
+            self.assertEqual(2, client.content_cache.stats()['hits'])
+
+            other = Client(dict(self.options, webdav_optimistic=True, webdav_root='/other',
+                                webdav_content_cache_path=os.path.join(directory, 'cache')))
+            other.session.request.side_effect = request
+            self.assertEqual(b'test', b''.join(other.download_iter('test_dir/test.txt')))
+            self.assertIsNone(requested[-1])
+
+    @patch('requests.Session')
+    def test_transfer_same_server(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.session.request.return_value.status_code = 201
+        client.transfer('test_dir/', 'copy_dir', target=Client(dict(self.options, webdav_root='/other')))
+        kwargs = client.session.request.call_args[1]
+        self.assertEqual('COPY', kwargs['method'])
+        self.assertEqual('http://localhost:8585/test_dir/', kwargs['url'])
+        self.assertEqual('http://localhost:8585/other/copy_dir/', kwargs['headers']['Destination'])
+        self.assertEqual('infinity', kwargs['headers']['Depth'])
+
+    @patch('requests.Session')
+    def test_transfer_to_other_server(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        target = Client(dict(self.options, webdav_optimistic=True, webdav_hostname='http://other:8585'))
+        contents = {'/test_dir/test.txt': b'test', '/test_dir/a/a.txt': b'nested'}
+        tree = {'/test_dir/': ['/test_dir/a/', '/test_dir/test.txt'], '/test_dir/a/': ['/test_dir/a/a.txt']}
+        uploaded = {}
+        requested = []
+
+        def request(method, url, headers, data=None, **kwargs):
+            requested.append((method, url))
+            response = MagicMock()
+            path = urlsplit(url).path
+            if method == 'PUT':
+                uploaded[path] = (data.len, data.read())
+                response.status_code = 201
+            elif method == 'GET':
+                response.status_code = 200
+                response.headers = {'content-length': str(len(contents[path]))}
+                response.raw = BytesIO(contents[path])
+            elif method == 'MKCOL':
+                response.status_code = 201
+            else:
+                response.status_code = 207
+                response.content = self.multistatus(path, *tree[path])
+                response.raw = BytesIO(response.content)
+            return response
+
+        client.session.request.side_effect = request
+        progress = []
+        client.transfer('test_dir/', 'copy_dir', target=target, max_workers=2,
+                        progress=lambda current, total: progress.append((current, total)))
+        self.assertEqual({'/copy_dir/test.txt': (4, b'test'), '/copy_dir/a/a.txt': (6, b'nested')}, uploaded)
+        self.assertIn(('MKCOL', 'http://other:8585/copy_dir/a/'), requested)
+        self.assertEqual(10, progress[-1][0])
+
+    def test_transfer_stream_broken(self):
+        stream = TransferStream(Mock(raw=BytesIO(b'test')), 10)
+        self.assertEqual(b'test', stream.read(8))
+        self.assertRaises(ConnectionException, stream.read, 8)
+
+        class BrokenRaw(BytesIO):
+            def read(self, *args):
+                raise ProtocolError('Connection broken', IncompleteRead(b''))
+
+        stream = TransferStream(Mock(raw=BrokenRaw()), 10)
+        self.assertRaises(ConnectionException, stream.read, 8)
+
+    def test_upload_body_mapped_file(self):
+        progress = []
+        checksums = Checksums('md5')
+        with tempfile.TemporaryFile() as f:
+            f.write(b'test content')
+            f.seek(5)
+            body = UploadBody(f, 7, chunk_size=4, progress=lambda current, total: progress.append(current),
+                              checksums=checksums)
+            self.assertEqual(7, len(body))
+            blocks = [bytes(block) for block in body]
+            self.assertEqual([b'cont', b'ent'], blocks)
+            self.assertEqual(blocks, [bytes(block) for block in body])
+        self.assertEqual([0, 4, 7, 0, 4, 7], progress)
+        self.assertEqual(hashlib.md5(b'contentcontent').hexdigest(), checksums['md5'])
+
+    def test_upload_body_stream(self):
+        body = UploadBody(BytesIO(b'test content'), 12, chunk_size=5)
+        self.assertEqual(b'test content', b''.join(bytes(block) for block in body))
+        self.assertTrue(all(isinstance(block, memoryview) for block in body))
+        self.assertEqual([b'te', b'st'], list(UploadBody(iter([b'te', b'st']), 4)))
+        self.assertRaises(OptionNotValid, UploadBody, BytesIO(), None)
+
+    @patch('requests.Session')
+    def test_upload_declared_length(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.session.request.return_value.status_code = 201
+        chunks = iter([b'test ', b'content', b''])
+        client.upload_iter(lambda: next(chunks), 'test_dir/test.txt', length=12)
+        data = client.session.request.call_args[1]['data']
+        self.assertEqual(12, len(data))
+        self.assertEqual(b'test content', b''.join(data))
+        client.upload_to(BytesIO(b'test'), 'test_dir/test.txt', length=4)
+        self.assertEqual(4, len(client.session.request.call_args[1]['data']))
+
+    @patch('requests.Session')
+    def test_upload_directory_parallel(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        uploaded = {}
+        requested = self.crawl_session(client, {}, uploaded)
+        progress = []
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(os.path.join(directory, 'a', 'b'))
+            for name in ('test.txt', os.path.join('a', 'a.txt'), os.path.join('a', 'b', 'b.txt')):
+                with open(os.path.join(directory, name), 'wb') as f:
+                    f.write(b'content')
+            client.upload_directory('test_dir/', directory, max_workers=3,
+                                    progress=lambda current, total: progress.append((current, total)))
+        self.assertEqual({'/test_dir/test.txt', '/test_dir/a/a.txt', '/test_dir/a/b/b.txt'}, set(uploaded))
+        mkcol = [path for method, path in requested if method == 'MKCOL']
+        self.assertEqual(['/test_dir/', '/test_dir/a/', '/test_dir/a/b/'], mkcol)
+        self.assertEqual((21, 21), progress[-1])
+
+    @patch('requests.Session')
+    def test_download_into(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.headers = {'content-length': '12'}
+        client.session.request.return_value.raw = BytesIO(b'test content')
+        result = client.download_into('test_dir/test.txt')
+        self.assertEqual(b'test content', result.tobytes())
+        _, kwargs = client.session.request.call_args
+        self.assertEqual('identity', kwargs['headers']['Accept-Encoding'])
+
+    @patch('requests.Session')
+    def test_download_into_buffer(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.headers = {}
+        client.session.request.return_value.raw = BytesIO(b'test content')
+        buffer = bytearray(20)
+        result = client.download_into('test_dir/test.txt', buffer)
+        self.assertEqual(12, len(result))
+        self.assertEqual(b'test content', bytes(buffer[:12]))
+
+    @patch('requests.Session')
+    def test_download_into_small_buffer(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.headers = {'content-length': '12'}
+        client.session.request.return_value.raw = BytesIO(b'test content')
+        with self.assertRaises(OptionNotValid):
+            client.download_into('test_dir/test.txt', bytearray(4))
+
+    @patch('requests.Session')
+    def test_download_into_broken(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.headers = {'content-length': '20'}
+        client.session.request.return_value.raw = BytesIO(b'test content')
+        self.assertRaises(ConnectionException, client.download_into, 'test_dir/test.txt')
+
+        class BrokenStream(BytesIO):
+            def readinto(self, buffer):
+                raise IncompleteRead(b'', 20)
+
+        client.session.request.return_value.raw = Mock(_fp=BrokenStream())
+        self.assertRaises(ConnectionException, client.download_into, 'test_dir/test.txt')
+
+    @patch('requests.Session')
+    def test_open(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        content = os.urandom(10500)
+        self.ranged_session(client, content)
+        with client.open('test_dir/test.bin', block_size=1000) as remote_file:
+            remote_file.seek(5000)
+            self.assertEqual(content[5000:5100], remote_file.read(100))
+
+    def test_open_wrong_mode(self):
+        client = Client(self.options)
+        with self.assertRaises(OptionNotValid):
+            client.open('test_dir/test.bin', 'wb')
+
+    @patch('requests.Session')
+    def test_read_ranges(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        content = os.urandom(100000)
+        client.session.request.return_value.status_code = 206
+        client.session.request.return_value.headers = {'content-type': 'multipart/byteranges; boundary=THIS'}
+        client.session.request.return_value.raw = BytesIO(
+            b'--THIS\r\nContent-Range: bytes 0-199/100000\r\n\r\n' + content[0:200] +
+            b'\r\n--THIS\r\nContent-Range: bytes 50000-50009/100000\r\n\r\n' + content[50000:50010] +
+            b'\r\n--THIS--\r\n')
+        result = client.read_ranges('test_dir/test.bin', [(50000, 10), (100, 100), (0, 10)], gap=100)
+        self.assertEqual([content[50000:50010], content[100:200], content[0:10]], result)
+        _, kwargs = client.session.request.call_args
+        self.assertEqual('bytes=0-199,50000-50009', kwargs['headers']['Range'])
+
+    @patch('requests.Session')
+    def test_read_ranges_single_range_supported(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        content = os.urandom(100000)
+        requested = []
+
+        def request(method, url, headers, **kwargs):
+            requested.append(headers['Range'])
+            start, end = (int(value) for value in headers['Range'][len('bytes='):].split(',')[0].split('-'))
+            response = MagicMock()
+            response.status_code = 206
+            response.headers = {'content-range': 'bytes {}-{}/100000'.format(start, end)}
+            response.content = content[start:end + 1]
+            return response
+
+        client.session.request.side_effect = request
+        result = client.read_ranges('test_dir/test.bin', [(50000, 10), (0, 10)])
+        self.assertEqual([content[50000:50010], content[0:10]], result)
+        self.assertEqual(['bytes=0-9,50000-50009', 'bytes=50000-50009'], requested)
+
+    @patch('requests.Session')
+    def test_read_ranges_ignored(self, mock_session):
+        client = Client(dict(self.options, webdav_optimistic=True))
+        content = os.urandom(10240)
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.headers = {}
+        client.session.request.return_value.content = content
+        result = client.read_ranges('test_dir/test.bin', [(5000, 10), (0, 10), (10000, 1000)])
+        self.assertEqual([content[5000:5010], content[0:10], content[10000:]], result)
+        self.assertEqual(1, client.session.request.call_count)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -37,6 +37,17 @@ class ConnectionTestCase(unittest.TestCase):
         settings = WebDAVSettings(webdav_options)
         self.assertEqual(30, settings.timeout)
 
+    def test_connection_settings_pool_default(self):
+        options = {
+            'webdav_hostname': 'http://localhost:8585'
+        }
+        webdav_options = get_options(option_type=WebDAVSettings, from_options=options)
+        settings = WebDAVSettings(webdav_options)
+        self.assertEqual(10, settings.pool_connections)
+        self.assertEqual(10, settings.pool_maxsize)
+        self.assertFalse(settings.pool_block)
+        self.assertFalse(settings.keep_alive_timeout)
+
     def test_connection_settings_no_hostname(self):
         options = {
             'webdav_login': 'alice',
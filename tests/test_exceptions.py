@@ -1,7 +1,8 @@
 import unittest
 
 from webdav3.exceptions import OptionNotValid, LocalResourceNotFound, RemoteResourceNotFound, MethodNotSupported, ConnectionException, NoConnection, \
-    RemoteParentNotFound, NotConnection, ResponseErrorCode, NotEnoughSpace
+    RemoteParentNotFound, NotConnection, ResponseErrorCode, NotEnoughSpace, TransferErrors, \
+    ChecksumMismatch
 
 
 class ExceptionsTestCase(unittest.TestCase):
@@ -45,6 +46,15 @@ class ExceptionsTestCase(unittest.TestCase):
         exception = NotEnoughSpace()
         self.assertEqual("Not enough space on the server", exception.__str__())
 
+    def test_transfer_errors(self):
+        exception = TransferErrors([('/a.txt', RemoteResourceNotFound('/a.txt')), ('/b.txt', NotEnoughSpace())])
+        self.assertEqual("Transfer of 2 resources failed: /a.txt: Remote resource: /a.txt not found; "
+                         "/b.txt: Not enough space on the server", exception.__str__())
+
+    def test_checksum_mismatch(self):
+        exception = ChecksumMismatch('/a.txt', 'sha1', 'abc', 'def')
+        self.assertEqual("Checksum sha1 of /a.txt is def, but server reports abc", exception.__str__())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from webdav3.info import ResourceInfo, to_timestamp
+
+
+class ResourceInfoTestCase(unittest.TestCase):
+    info = {
+        'created': '2017-10-18T15:16:04Z',
+        'name': 'test.txt',
+        'size': '41',
+        'modified': 'Wed, 18 Oct 2017 15:16:04 GMT',
+        'etag': 'ab0b4b7973803c03639b848682b5f38c',
+        'content_type': 'text/plain',
+        'isdir': False,
+        'path': '/test_dir/test.txt'
+    }
+
+    def test_from_dict(self):
+        info = ResourceInfo.from_dict(self.info)
+        self.assertEqual('/test_dir/test.txt', info.path)
+        self.assertEqual('/test_dir/', info.parent)
+        self.assertEqual(41, info.size)
+        self.assertFalse(info.isdir)
+        self.assertEqual(self.info, info.to_dict())
+
+    def test_lazy_dates(self):
+        info = ResourceInfo.from_dict(self.info)
+        self.assertEqual(1508339764.0, info.modified)
+        self.assertEqual(1508339764.0, info.created)
+        self.assertEqual('Wed, 18 Oct 2017 15:16:04 GMT', info.modified_raw)
+
+    def test_directory(self):
+        info = ResourceInfo('/test_dir/nested/', isdir=True, size='')
+        self.assertEqual('/test_dir/', info.parent)
+        self.assertIsNone(info.size)
+        self.assertIsNone(info.modified)
+
+    def test_interned_parent(self):
+        first = ResourceInfo(''.join(['/test_dir/', 'a.txt']))
+        second = ResourceInfo(''.join(['/test_dir/', 'b.txt']))
+        self.assertIs(first.parent, second.parent)
+
+    def test_no_dict(self):
+        self.assertFalse(hasattr(ResourceInfo('/test.txt'), '__dict__'))
+
+    def test_to_timestamp(self):
+        self.assertEqual(1508339764.0, to_timestamp('2017-10-18 15:16:04'))
+        self.assertIsNone(to_timestamp('wrong date'))
+        self.assertIsNone(to_timestamp(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
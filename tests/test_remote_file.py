@@ -0,0 +1,112 @@
+import io
+import os
+import unittest
+import zipfile
+from unittest.mock import MagicMock, Mock
+
+from webdav3.exceptions import OptionNotValid
+from webdav3.remote_file import RemoteFile, coalesce_ranges, parse_content_range, iter_byteranges
+from webdav3.urn import Urn
+
+
+class RemoteFileTestCase(unittest.TestCase):
+    def setUp(self):
+        self.requested = []
+        self.client = Mock()
+        self.client.execute_request.side_effect = self.execute_request
+
+    def execute_request(self, action, path, headers_ext=None):
+        headers = dict(header.split(': ', 1) for header in headers_ext or [])
+        response = MagicMock()
+        response.headers = {'etag': '"1"'}
+        if action == 'check' and not getattr(self, 'dynamic', False):
+            response.headers['content-length'] = str(len(self.content))
+        if action == 'download':
+            self.requested.append(headers['Range'])
+            if getattr(self, 'ignore_ranges', False):
+                response.status_code = 200
+                response.content = self.content
+                return response
+            start, end = (int(value) for value in headers['Range'][len('bytes='):].split('-'))
+            response.status_code = 206
+            response.content = self.content[start:end + 1]
+            response.headers['content-range'] = 'bytes {}-{}/{}'.format(start, end, len(self.content))
+        return response
+
+    def test_read_and_seek(self):
+        self.content = os.urandom(1000)
+        remote_file = RemoteFile(self.client, Urn('/test.bin'), block_size=100, read_ahead=0)
+        self.assertEqual(1000, remote_file.size)
+        remote_file.seek(150)
+        self.assertEqual(self.content[150:260], remote_file.read(110))
+        self.assertEqual(260, remote_file.tell())
+        remote_file.seek(-10, io.SEEK_END)
+        self.assertEqual(self.content[990:], remote_file.read())
+        self.assertEqual(b'', remote_file.read(10))
+        self.assertEqual(['bytes=100-199', 'bytes=200-299', 'bytes=900-999'], self.requested)
+
+    def test_cache(self):
+        self.content = os.urandom(1000)
+        remote_file = RemoteFile(self.client, Urn('/test.bin'), block_size=100, cache_size=2, read_ahead=0)
+        for position in (0, 50, 0, 500, 550, 0):
+            remote_file.seek(position)
+            remote_file.read(10)
+        self.assertEqual(['bytes=0-99', 'bytes=500-599'], self.requested)
+
+    def test_read_ahead(self):
+        self.content = os.urandom(1000)
+        remote_file = RemoteFile(self.client, Urn('/test.bin'), block_size=100, read_ahead=4)
+        self.assertEqual(self.content, remote_file.read())
+        self.assertEqual(['bytes=0-99', 'bytes=100-599', 'bytes=600-999'], self.requested)
+
+    def test_size_without_content_length(self):
+        self.content = os.urandom(1000)
+        self.dynamic = True
+        remote_file = RemoteFile(self.client, Urn('/test.bin'), block_size=100, read_ahead=0)
+        self.assertEqual(1000, remote_file.size)
+        self.assertEqual(self.content, remote_file.read())
+        self.assertEqual('bytes=0-0', self.requested[0])
+
+    def test_ranges_ignored(self):
+        self.content = os.urandom(1000)
+        self.ignore_ranges = True
+        remote_file = RemoteFile(self.client, Urn('/test.bin'), block_size=100, read_ahead=0)
+        remote_file.seek(500)
+        self.assertEqual(self.content[500:], remote_file.read())
+        remote_file.seek(0)
+        self.assertEqual(self.content[:10], remote_file.read(10))
+        self.assertEqual(1, len(self.requested))
+
+    def test_zipfile(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as archive:
+            archive.writestr('big.bin', os.urandom(100000))
+            archive.writestr('test.txt', 'test content')
+        self.content = buffer.getvalue()
+        with zipfile.ZipFile(RemoteFile(self.client, Urn('/test.zip'), block_size=1024, read_ahead=0)) as archive:
+            self.assertEqual(b'test content', archive.read('test.txt'))
+        self.assertLess(len(self.requested), 5)
+
+    def test_wrong_whence(self):
+        self.content = b''
+        with self.assertRaises(OptionNotValid):
+            RemoteFile(self.client, Urn('/test.bin')).seek(0, 5)
+
+
+    def test_coalesce_ranges(self):
+        self.assertEqual([(0, 19), (100, 109)], coalesce_ranges([(100, 10), (10, 10), (0, 5)], gap=5))
+        self.assertEqual([(0, 4), (10, 19)], coalesce_ranges([(10, 10), (0, 5)]))
+        with self.assertRaises(OptionNotValid):
+            coalesce_ranges([(0, 0)])
+
+    def test_parse_content_range(self):
+        self.assertEqual((0, 99, 1000), parse_content_range('bytes 0-99/1000'))
+        self.assertEqual((0, 99, None), parse_content_range('bytes 0-99/*'))
+
+    def test_iter_byteranges(self):
+        content = b'\r\n--THIS\r\nContent-Type: text/plain\r\nContent-Range: bytes 0-3/100\r\n\r\ntest\r\n' \
+                  b'--THIS\r\nContent-Range: bytes 50-55/100\r\n\r\n\r\nline\r\n--THIS--\r\n'
+        self.assertEqual([(0, b'test'), (50, b'\r\nline')], list(iter_byteranges(io.BytesIO(content), 'THIS')))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,753 @@
+# -*- coding: utf-8
+
+import asyncio
+import functools
+import io
+import logging
+import os
+import shutil
+import ssl
+
+from webdav3.client import Client, WebDavXmlUtils, get_options, listdir
+from webdav3.connection import WebDAVSettings
+from webdav3.exceptions import NoConnection, ConnectionException, NotEnoughSpace, RemoteResourceNotFound, \
+    MethodNotSupported, ResponseErrorCode, RemoteParentNotFound, OptionNotValid, LocalResourceNotFound, \
+    ResourceLocked
+from webdav3.urn import Urn
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+log = logging.getLogger(__name__)
+
+
+def wrap_connection_error(fn):
+    @functools.wraps(fn)
+    async def _wrapper(self, *args, **kw):
+        log.debug("Requesting %s(%s, %s)", fn, args, kw)
+        try:
+            return await fn(self, *args, **kw)
+        except aiohttp.ClientConnectionError:
+            raise NoConnection(self.webdav.hostname)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ce:
+            raise ConnectionException(ce)
+
+    return _wrapper
+
+
+class AsyncClient(object):
+    """The asyncio client for WebDAV servers. It mirrors the API of :class:`webdav3.client.Client` but all network
+    methods are coroutines executed on top of `aiohttp`, so one event loop can keep many requests in flight.
+    The client should be closed by `await client.close()` or used as `async with AsyncClient(options) as client:`.
+    """
+    # path to root directory of WebDAV
+    root = Client.root
+
+    # controls whether to verify the server's TLS certificate or not
+    verify = True
+
+    default_http_header = Client.default_http_header
+    default_requests = Client.default_requests
+
+    def __init__(self, options):
+        """Constructor of asyncio WebDAV client
+
+        :param options: the dictionary of connection options to WebDAV, the same as for
+                        :class:`webdav3.client.Client`. Pool options limit the number of concurrent connections:
+                        `webdav_pool_maxsize` per host and `webdav_pool_connections` * `webdav_pool_maxsize` in total.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncClient requires aiohttp, install it by `pip install webdavclient3[async]`")
+        self.session = None
+        self.http_header = AsyncClient.default_http_header.copy()
+        self.requests = AsyncClient.default_requests.copy()
+        webdav_options = get_options(option_type=WebDAVSettings, from_options=options)
+
+        self.webdav = WebDAVSettings(webdav_options)
+        self.requests.update(self.webdav.override_methods)
+        self.timeout = self.webdav.timeout
+        self.chunk_size = 65536
+
+    get_headers = Client.get_headers
+    get_url = Client.get_url
+    get_full_path = Client.get_full_path
+    valid = Client.valid
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Closes the underlying HTTP session and releases all pooled connections."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    def get_session(self):
+        """Returns the HTTP session of the client, the session is created on first use inside running event loop.
+
+        :return: the instance of `aiohttp.ClientSession`.
+        """
+        if self.session is None or self.session.closed:
+            auth = None
+            if not self.webdav.token and self.webdav.login and self.webdav.password:
+                auth = aiohttp.BasicAuth(self.webdav.login, self.webdav.password)
+            self.session = aiohttp.ClientSession(
+                auth=auth,
+                # the timeout limits connecting and waiting for data as in requests, not the whole transfer
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    ssl=self._get_ssl(),
+                    limit=int(self.webdav.pool_connections) * int(self.webdav.pool_maxsize),
+                    limit_per_host=int(self.webdav.pool_maxsize),
+                    keepalive_timeout=float(self.webdav.keep_alive_timeout) if self.webdav.keep_alive_timeout else 15
+                )
+            )
+        return self.session
+
+    @staticmethod
+    async def _run_blocking(func, *args):
+        """Runs blocking call of local file in the default executor, so it does not stall other coroutines.
+
+        :param func: the blocking function.
+        :param args: the arguments of function.
+        :return: the result of function.
+        """
+        return await asyncio.get_event_loop().run_in_executor(None, functools.partial(func, *args))
+
+    def _get_ssl(self):
+        if not self.verify:
+            return False
+        if self.webdav.cert_path and self.webdav.key_path:
+            context = ssl.create_default_context()
+            context.load_cert_chain(self.webdav.cert_path, self.webdav.key_path)
+            return context
+        return None
+
+    async def execute_request(self, action, path, data=None, headers_ext=None):
+        """Generate request to WebDAV server for specified action and path and execute it.
+
+        :param action: the action for WebDAV server which should be executed.
+        :param path: the path to resource for action
+        :param data: (optional) bytes, string, file-like object or async iterable to send in the body of the request.
+        :param headers_ext: (optional) the addition headers list witch should be added to basic HTTP headers for
+                            the specified action.
+        :return: HTTP response of request, the body of response is not read yet.
+        """
+        response = await self.get_session().request(
+            method=self.requests[action],
+            url=self.get_url(path),
+            headers=self.get_headers(action, headers_ext),
+            data=data
+        )
+        if response.status >= 400:
+            content = await response.read()
+            response.release()
+            if response.status == 507:
+                raise NotEnoughSpace()
+            if response.status == 404:
+                raise RemoteResourceNotFound(path=path)
+            if response.status == 423:
+                raise ResourceLocked(path=path)
+            if response.status == 405:
+                raise MethodNotSupported(name=action, server=self.webdav.hostname)
+            raise ResponseErrorCode(url=self.get_url(path), code=response.status, message=content)
+        return response
+
+    async def _read(self, action, path, data=None, headers_ext=None):
+        response = await self.execute_request(action=action, path=path, data=data, headers_ext=headers_ext)
+        async with response:
+            return response.status, await response.read()
+
+    async def _execute_operation(self, action, urn, data=None, headers_ext=None):
+        """Executes request of operation on the resource, see :meth:`webdav3.client.Client._execute_operation`."""
+        if not self.webdav.optimistic:
+            return await self.execute_request(action=action, path=urn.quote(), data=data, headers_ext=headers_ext)
+        try:
+            return await self.execute_request(action=action, path=urn.quote(), data=data, headers_ext=headers_ext)
+        except RemoteResourceNotFound:
+            if action == 'upload':
+                raise RemoteParentNotFound(urn.path())
+            raise RemoteResourceNotFound(urn.path())
+        except MethodNotSupported:
+            raise OptionNotValid(name="remote_path", value=urn.path())
+        except ResponseErrorCode as error:
+            if error.code == 409:
+                raise RemoteParentNotFound(urn.path())
+            raise
+
+    async def _read_operation(self, action, urn, data=None, headers_ext=None):
+        response = await self._execute_operation(action=action, urn=urn, data=data, headers_ext=headers_ext)
+        async with response:
+            return response.status, await response.read()
+
+    @wrap_connection_error
+    async def list(self, remote_path=root, get_info=False, recursive=False):
+        """Returns list of nested files and directories for remote WebDAV directory by path.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PROPFIND
+
+        :param remote_path: path to remote directory.
+        :param get_info: path and element info to remote directory, like cmd 'ls -l'.
+        :param recursive: true will do a recursive listing of infinite depth
+        :return: the same result as :meth:`webdav3.client.Client.list`.
+        """
+        headers = []
+        if recursive:
+            headers = ["Depth:infinity"]
+        directory_urn = Urn(remote_path, directory=True)
+        if not self.webdav.optimistic and directory_urn.path() != AsyncClient.root \
+                and not await self.check(directory_urn.path()):
+            raise RemoteResourceNotFound(directory_urn.path())
+
+        path = Urn.normalize_path(self.get_full_path(directory_urn))
+        _, content = await self._read(action='list', path=directory_urn.quote(), headers_ext=headers)
+        if get_info:
+            subfiles = WebDavXmlUtils.parse_get_list_info_response(content)
+            return [subfile for subfile in subfiles if Urn.compare_path(path, subfile.get('path')) is False]
+
+        urns = WebDavXmlUtils.parse_get_list_response(content)
+        return [urn.filename() for urn in urns if Urn.compare_path(path, urn.path()) is False]
+
+    @wrap_connection_error
+    async def free(self):
+        """Returns an amount of free space on remote WebDAV server.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PROPFIND
+
+        :return: an amount of free space in bytes.
+        """
+        data = WebDavXmlUtils.create_free_space_request_content()
+        _, content = await self._read(action='free', path='', data=data)
+        return WebDavXmlUtils.parse_free_space_response(content, self.webdav.hostname)
+
+    @wrap_connection_error
+    async def check(self, remote_path=root):
+        """Checks an existence of remote resource on WebDAV server by remote path.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#rfc.section.9.4
+
+        :param remote_path: (optional) path to resource on WebDAV server. Defaults is root directory of WebDAV.
+        :return: True if resource is exist or False otherwise
+        """
+        if self.webdav.disable_check:
+            return True
+
+        urn = Urn(remote_path)
+        try:
+            response = await self.execute_request(action='check', path=urn.quote())
+        except RemoteResourceNotFound:
+            return False
+
+        response.release()
+        return response.status == 200
+
+    @wrap_connection_error
+    async def mkdir(self, remote_path, recursive=False):
+        """Makes new directory on WebDAV server.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_MKCOL
+
+        :param remote_path: path to directory
+        :param recursive: (optional) creates all missing parent directories. Defaults is False.
+        :return: True if request executed with code 200 or 201 and False otherwise.
+        """
+        directory_urn = Urn(remote_path, directory=True)
+        if not self.webdav.optimistic and not await self.check(directory_urn.parent()):
+            if recursive:
+                await self.mkdir(directory_urn.parent(), recursive=True)
+            else:
+                raise RemoteParentNotFound(directory_urn.path())
+
+        try:
+            status, _ = await self._read(action='mkdir', path=directory_urn.quote())
+        except MethodNotSupported:
+            # Yandex WebDAV returns 405 status code when directory already exists
+            return True
+        except ResponseErrorCode as error:
+            # In optimistic mode the missing parent is reported by 409 status code
+            if not self.webdav.optimistic or error.code != 409:
+                raise
+            if not recursive:
+                raise RemoteParentNotFound(directory_urn.path())
+            await self.mkdir(directory_urn.parent(), recursive=True)
+            status, _ = await self._read(action='mkdir', path=directory_urn.quote())
+        return status in (200, 201)
+
+    async def download_iter(self, remote_path):
+        """Downloads file from WebDAV and return content in asynchronous generator.
+        Usage: `async for chunk in client.download_iter(remote_path): ...`
+
+        :param remote_path: path to file on WebDAV server.
+        """
+        try:
+            urn = Urn(remote_path)
+            if not self.webdav.optimistic and await self.is_dir(urn.path()):
+                raise OptionNotValid(name="remote_path", value=remote_path)
+
+            response = await self._execute_operation(action='download', urn=urn)
+            async with response:
+                async for chunk in response.content.iter_chunked(self.chunk_size):
+                    yield chunk
+        except aiohttp.ClientConnectionError:
+            raise NoConnection(self.webdav.hostname)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ce:
+            raise ConnectionException(ce)
+
+    @wrap_connection_error
+    async def download_from(self, buff, remote_path, progress=None, progress_args=()):
+        """Downloads file from WebDAV and writes it in buffer.
+
+        :param buff: buffer object for writing of downloaded file content.
+        :param remote_path: path to file on WebDAV server.
+        :param progress: Pass a callback function to view the file transmission progress, see
+                         :meth:`webdav3.client.Client.download_from`.
+        :param progress_args: A tuple with extra custom arguments for the progress callback function.
+        """
+        urn = Urn(remote_path)
+        if not self.webdav.optimistic and await self.is_dir(urn.path()):
+            raise OptionNotValid(name="remote_path", value=remote_path)
+
+        response = await self._execute_operation(action='download', urn=urn)
+        async with response:
+            await self._write_content(response, buff, progress, progress_args)
+
+    async def download(self, remote_path, local_path, progress=None, progress_args=()):
+        """Downloads remote resource from WebDAV and save it in local path.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#rfc.section.9.4
+
+        :param remote_path: the path to remote resource for downloading can be file and directory.
+        :param local_path: the path to save resource locally.
+        :param progress: Pass a callback function to view the file transmission progress.
+        :param progress_args: A tuple with extra custom arguments for the progress callback function.
+        """
+        urn = Urn(remote_path)
+        if await self.is_dir(urn.path()):
+            await self.download_directory(local_path=local_path, remote_path=remote_path, progress=progress,
+                                          progress_args=progress_args)
+        else:
+            await self.download_file(local_path=local_path, remote_path=remote_path, progress=progress,
+                                     progress_args=progress_args)
+
+    async def download_directory(self, remote_path, local_path, progress=None, progress_args=()):
+        """Downloads directory and downloads all nested files and directories from remote WebDAV to local.
+        If there is something on local path it deletes directories and files then creates new.
+        Nested resources are downloaded concurrently.
+
+        :param remote_path: the path to directory for downloading form WebDAV server.
+        :param local_path: the path to local directory for saving downloaded files and directories.
+        :param progress: Pass a callback function to view the file transmission progress.
+        :param progress_args: A tuple with extra custom arguments for the progress callback function.
+        """
+        urn = Urn(remote_path, directory=True)
+        if not await self.is_dir(urn.path()):
+            raise OptionNotValid(name="remote_path", value=remote_path)
+
+        if os.path.exists(local_path):
+            shutil.rmtree(local_path)
+
+        os.makedirs(local_path)
+
+        downloads = []
+        for resource_name in await self.list(urn.path()):
+            if urn.path().endswith(resource_name):
+                continue
+            _remote_path = "{parent}{name}".format(parent=urn.path(), name=resource_name)
+            _local_path = os.path.join(local_path, resource_name)
+            downloads.append(self.download(local_path=_local_path, remote_path=_remote_path, progress=progress,
+                                           progress_args=progress_args))
+        await asyncio.gather(*downloads)
+
+    @wrap_connection_error
+    async def download_file(self, remote_path, local_path, progress=None, progress_args=()):
+        """Downloads file from WebDAV server and save it locally.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#rfc.section.9.4
+
+        :param remote_path: the path to remote file for downloading.
+        :param local_path: the path to save file locally.
+        :param progress: Pass a callback function to view the file transmission progress.
+        :param progress_args: A tuple with extra custom arguments for the progress callback function.
+        """
+        urn = Urn(remote_path)
+        if not self.webdav.optimistic and await self.is_dir(urn.path()):
+            raise OptionNotValid(name="remote_path", value=remote_path)
+
+        if os.path.isdir(local_path):
+            raise OptionNotValid(name="local_path", value=local_path)
+
+        response = await self._execute_operation(action='download', urn=urn)
+        async with response:
+            local_file = await self._run_blocking(open, local_path, 'wb')
+            try:
+                await self._write_content(response, local_file, progress, progress_args)
+            finally:
+                await self._run_blocking(local_file.close)
+
+    async def _write_content(self, response, buff, progress, progress_args):
+        total = response.content_length
+        current = 0
+
+        if callable(progress):
+            progress(current, total, *progress_args)  # zero call
+
+        # writing to memory does not block, writes to files are batched to pass few large blocks to the executor
+        in_memory = isinstance(buff, io.BytesIO)
+        pending = bytearray()
+        async for chunk in response.content.iter_chunked(self.chunk_size):
+            if in_memory:
+                buff.write(chunk)
+            else:
+                pending += chunk
+                if len(pending) >= 16 * self.chunk_size:
+                    await self._run_blocking(buff.write, pending)
+                    pending = bytearray()
+            current += len(chunk)
+            if callable(progress):
+                progress(current, total, *progress_args)
+        if pending:
+            await self._run_blocking(buff.write, pending)
+
+    @wrap_connection_error
+    async def upload_iter(self, read_callback, remote_path):
+        """Uploads content produced by iterable or asynchronous iterable to remote path on WebDAV server.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PUT
+
+        :param read_callback: the iterable or asynchronous iterable of bytes.
+        :param str remote_path: the path to save file remotely on WebDAV server.
+        """
+        urn = Urn(remote_path)
+        if urn.is_dir():
+            raise OptionNotValid(name="remote_path", value=remote_path)
+
+        if not self.webdav.optimistic and not await self.check(urn.parent()):
+            raise RemoteParentNotFound(urn.path())
+
+        await self._read_operation(action='upload', urn=urn, data=read_callback)
+
+    @wrap_connection_error
+    async def upload_to(self, buff, remote_path):
+        """Uploads file from buffer to remote path on WebDAV server.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PUT
+
+        :param buff: the buffer with content for file.
+        :param remote_path: the path to save file remotely on WebDAV server.
+        """
+        urn = Urn(remote_path)
+        if urn.is_dir():
+            raise OptionNotValid(name="remote_path", value=remote_path)
+
+        if not self.webdav.optimistic and not await self.check(urn.parent()):
+            raise RemoteParentNotFound(urn.path())
+
+        await self._read_operation(action='upload', urn=urn, data=buff)
+
+    async def upload(self, remote_path, local_path, progress=None, progress_args=()):
+        """Uploads resource to remote path on WebDAV server.
+        In case resource is directory it will upload all nested files and directories.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PUT
+
+        :param remote_path: the path for uploading resources on WebDAV server. Can be file and directory.
+        :param local_path: the path to local resource for uploading.
+        :param progress: Pass a callback function to view the file transmission progress.
+        :param progress_args: A tuple with extra custom arguments for the progress callback function.
+        """
+        if os.path.isdir(local_path):
+            await self.upload_directory(local_path=local_path, remote_path=remote_path, progress=progress,
+                                        progress_args=progress_args)
+        else:
+            await self.upload_file(local_path=local_path, remote_path=remote_path, progress=progress,
+                                   progress_args=progress_args)
+
+    async def upload_directory(self, remote_path, local_path, progress=None, progress_args=()):
+        """Uploads directory to remote path on WebDAV server.
+        In case directory is exist on remote server it will delete it and then upload directory with nested files and
+        directories. Nested resources are uploaded concurrently.
+
+        :param remote_path: the path to directory for uploading on WebDAV server.
+        :param local_path: the path to local directory for uploading.
+        :param progress: Pass a callback function to view the file transmission progress.
+        :param progress_args: A tuple with extra custom arguments for the progress callback function.
+        """
+        urn = Urn(remote_path, directory=True)
+        if not urn.is_dir():
+            raise OptionNotValid(name="remote_path", value=remote_path)
+
+        if not os.path.isdir(local_path):
+            raise OptionNotValid(name="local_path", value=local_path)
+
+        if not os.path.exists(local_path):
+            raise LocalResourceNotFound(local_path)
+
+        if await self.check(urn.path()):
+            await self.clean(urn.path())
+
+        await self.mkdir(remote_path)
+
+        uploads = []
+        for resource_name in listdir(local_path):
+            _remote_path = "{parent}{name}".format(parent=urn.path(), name=resource_name).replace('\\', '')
+            _local_path = os.path.join(local_path, resource_name)
+            uploads.append(self.upload(local_path=_local_path, remote_path=_remote_path, progress=progress,
+                                       progress_args=progress_args))
+        await asyncio.gather(*uploads)
+
+    @wrap_connection_error
+    async def upload_file(self, remote_path, local_path, progress=None, progress_args=(), force=False):
+        """Uploads file to remote path on WebDAV server.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PUT
+
+        :param remote_path: the path to uploading file on WebDAV server.
+        :param local_path: the path to local file for uploading.
+        :param progress: Pass a callback function to view the file transmission progress.
+        :param progress_args: A tuple with extra custom arguments for the progress callback function.
+        :param force:  if the directory isn't there it will creat the directory.
+        """
+        if not os.path.exists(local_path):
+            raise LocalResourceNotFound(local_path)
+
+        urn = Urn(remote_path)
+        if urn.is_dir():
+            raise OptionNotValid(name="remote_path", value=remote_path)
+
+        if os.path.isdir(local_path):
+            raise OptionNotValid(name="local_path", value=local_path)
+
+        if not self.webdav.optimistic and not await self.check(urn.parent()):
+            if force:
+                await self.mkdir(urn.parent(), recursive=True)
+            else:
+                raise RemoteParentNotFound(urn.path())
+
+        local_file = await self._run_blocking(open, local_path, "rb")
+        try:
+            total = os.path.getsize(local_path)
+
+            async def read_in_chunks(file_object):
+                current = 0
+                progress(current, total, *progress_args)
+                while current < total:
+                    data = await self._run_blocking(file_object.read, self.chunk_size)
+                    if not data:
+                        break
+                    current += len(data)
+                    yield data
+                    progress(current, total, *progress_args)
+
+            async def send():
+                if callable(progress):
+                    headers = ["Content-Length: {length}".format(length=total)]
+                    await self._read_operation(action='upload', urn=urn, data=read_in_chunks(local_file),
+                                               headers_ext=headers)
+                else:
+                    # aiohttp reads file objects in the executor itself
+                    await self._read_operation(action='upload', urn=urn, data=local_file)
+
+            try:
+                await send()
+            except RemoteParentNotFound:
+                # Only optimistic mode gets here, the parent is created on demand instead of checking it in advance
+                if not force:
+                    raise
+                await self.mkdir(urn.parent(), recursive=True)
+                await self._run_blocking(local_file.seek, 0)
+                await send()
+        finally:
+            await self._run_blocking(local_file.close)
+
+    @wrap_connection_error
+    async def copy(self, remote_path_from, remote_path_to, depth=1):
+        """Copies resource from one place to another on WebDAV server.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_COPY
+
+        :param remote_path_from: the path to resource which will be copied,
+        :param remote_path_to: the path where resource will be copied.
+        :param depth: folder depth to copy
+        """
+        urn_from = Urn(remote_path_from)
+        urn_to = Urn(remote_path_to)
+        if not self.webdav.optimistic:
+            if not await self.check(urn_from.path()):
+                raise RemoteResourceNotFound(urn_from.path())
+
+            if not await self.check(urn_to.parent()):
+                raise RemoteParentNotFound(urn_to.path())
+
+        headers = [
+            "Destination: {url}".format(url=self.get_url(urn_to.quote()))
+        ]
+        if self.webdav.optimistic:
+            # the directory is recognized by tailing slash instead of additional request
+            is_dir = urn_from.is_dir()
+        else:
+            is_dir = await self.is_dir(urn_from.path())
+        if is_dir:
+            headers.append("Depth: {depth}".format(depth=depth))
+        await self._read_operation(action='copy', urn=urn_from, headers_ext=headers)
+
+    @wrap_connection_error
+    async def move(self, remote_path_from, remote_path_to, overwrite=False):
+        """Moves resource from one place to another on WebDAV server.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_MOVE
+
+        :param remote_path_from: the path to resource which will be moved,
+        :param remote_path_to: the path where resource will be moved.
+        :param overwrite: (optional) the flag, overwrite file if it exists. Defaults is False
+        """
+        urn_from = Urn(remote_path_from)
+        urn_to = Urn(remote_path_to)
+        if not self.webdav.optimistic:
+            if not await self.check(urn_from.path()):
+                raise RemoteResourceNotFound(urn_from.path())
+
+            if not await self.check(urn_to.parent()):
+                raise RemoteParentNotFound(urn_to.path())
+
+        header_destination = "Destination: {path}".format(path=self.get_url(urn_to.quote()))
+        header_overwrite = "Overwrite: {flag}".format(flag="T" if overwrite else "F")
+        await self._read_operation(action='move', urn=urn_from, headers_ext=[header_destination, header_overwrite])
+
+    @wrap_connection_error
+    async def clean(self, remote_path):
+        """Cleans (Deletes) a remote resource on WebDAV server.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_DELETE
+
+        :param remote_path: the remote resource whisch will be deleted.
+        """
+        urn = Urn(remote_path)
+        await self._read(action='clean', path=urn.quote())
+
+    @wrap_connection_error
+    async def info(self, remote_path):
+        """Gets information about resource on WebDAV.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PROPFIND
+
+        :param str remote_path: the path to remote resource.
+        :return: the same dictionary of information attributes as :meth:`webdav3.client.Client.info`.
+        """
+        urn = Urn(remote_path)
+        await self._check_remote_resource(remote_path, urn)
+
+        _, content = await self._read(action='info', path=urn.quote())
+        path = self.get_full_path(urn)
+        return WebDavXmlUtils.parse_info_response(content=content, path=path, hostname=self.webdav.hostname)
+
+    async def _check_remote_resource(self, remote_path, urn):
+        if self.webdav.optimistic:
+            return
+        if not await self.check(urn.path()) and not await self.check(Urn(remote_path, directory=True).path()):
+            raise RemoteResourceNotFound(remote_path)
+
+    @wrap_connection_error
+    async def is_dir(self, remote_path):
+        """Checks is the remote resource directory.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PROPFIND
+
+        :param remote_path: the path to remote resource.
+        :return: True in case the remote resource is directory and False otherwise.
+        """
+        urn = Urn(remote_path)
+        await self._check_remote_resource(remote_path, urn)
+
+        _, content = await self._read(action='info', path=urn.quote(), headers_ext=["Depth: 0"])
+        path = self.get_full_path(urn)
+        return WebDavXmlUtils.parse_is_dir_response(content=content, path=path, hostname=self.webdav.hostname)
+
+    @wrap_connection_error
+    async def get_property(self, remote_path, option):
+        """Gets metadata property of remote resource on WebDAV server.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PROPFIND
+
+        :param remote_path: the path to remote resource.
+        :param option: the property attribute as dictionary with following keys:
+                       `namespace`: (optional) the namespace for XML property which will be set,
+                       `name`: the name of property which will be set.
+        :return: the value of property or None if property is not found.
+        """
+        urn = Urn(remote_path)
+        if not self.webdav.optimistic and not await self.check(urn.path()):
+            raise RemoteResourceNotFound(urn.path())
+
+        data = WebDavXmlUtils.create_get_property_request_content(option)
+        _, content = await self._read_operation(action='get_property', urn=urn, data=data)
+        return WebDavXmlUtils.parse_get_property_response(content, option['name'])
+
+    async def set_property(self, remote_path, option):
+        """Sets metadata property of remote resource on WebDAV server.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PROPPATCH
+
+        :param remote_path: the path to remote resource.
+        :param option: the property attribute as dictionary with following keys:
+                       `namespace`: (optional) the namespace for XML property which will be set,
+                       `name`: the name of property which will be set,
+                       `value`: (optional) the value of property which will be set. Defaults is empty string.
+        """
+        await self.set_property_batch(remote_path=remote_path, option=[option])
+
+    @wrap_connection_error
+    async def set_property_batch(self, remote_path, option):
+        """Sets batch metadata properties of remote resource on WebDAV server in batch.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PROPPATCH
+
+        :param remote_path: the path to remote resource.
+        :param option: the property attributes as list of dictionaries with following keys:
+                       `namespace`: (optional) the namespace for XML property which will be set,
+                       `name`: the name of property which will be set,
+                       `value`: (optional) the value of property which will be set. Defaults is empty string.
+        """
+        urn = Urn(remote_path)
+        if not self.webdav.optimistic and not await self.check(urn.path()):
+            raise RemoteResourceNotFound(urn.path())
+
+        data = WebDavXmlUtils.create_set_property_batch_request_content(option)
+        await self._read_operation(action='set_property', urn=urn, data=data)
+
+    @wrap_connection_error
+    async def lock(self, remote_path=root, timeout=0):
+        """Creates a lock on the given path and returns an AsyncLockClient that handles the lock.
+        To ensure the lock is released this should be used as `async with await client.lock("path") as c:`.
+        More information at http://webdav.org/specs/rfc4918.html#METHOD_LOCK
+
+        :param remote_path: the path to remote resource to lock.
+        :param timeout: the timeout for the lock (default infinite).
+        :return: AsyncLockClient that wraps the AsyncClient and handle the lock
+        """
+        headers_ext = None
+        if timeout > 0:
+            headers_ext = [
+                "Timeout: Second-%d" % timeout
+            ]
+
+        response = await self.execute_request(
+            action='lock', path=Urn(remote_path).quote(), headers_ext=headers_ext,
+            data="""<D:lockinfo xmlns:D='DAV:'><D:lockscope><D:exclusive/></D:lockscope><D:locktype><D:write/></D:locktype></D:lockinfo>""")
+        response.release()
+
+        return AsyncLockClient(self, Urn(remote_path).quote(), response.headers["Lock-Token"])
+
+
+class AsyncLockClient(AsyncClient):
+    def __init__(self, client, lock_path, lock_token):
+        super().__init__([])
+        self.session = client.get_session()
+        self.webdav = client.webdav
+        self.requests = client.requests
+        self.timeout = self.webdav.timeout
+
+        self.__lock_path = lock_path
+        self.__lock_token = lock_token
+
+    def get_headers(self, action, headers_ext=None):
+        headers = super().get_headers(action, headers_ext)
+        headers["Lock-Token"] = self.__lock_token
+        headers["If"] = "(%s)" % self.__lock_token
+        return headers
+
+    async def close(self):
+        # the session is owned by the parent client
+        self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._read(action='unlock', path=self.__lock_path)
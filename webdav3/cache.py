@@ -0,0 +1,502 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class MetadataCache(object):
+    """The cache of remote resource properties received in PROPFIND responses.
+    Entries expire after TTL and the least recently used entries are evicted when the cache exceeds its size.
+    The instance is safe to use from multiple threads.
+    """
+
+    def __init__(self, max_size=0, ttl=60):
+        """Constructor of metadata cache
+
+        :param max_size: maximum amount of cached resources, the cache is disabled when it is 0.
+        :param ttl: time in seconds while cached properties are valid.
+        """
+        self.max_size = int(max_size) if max_size else 0
+        self.ttl = float(ttl) if ttl else 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.max_size > 0
+
+    def get(self, path, complete=True):
+        """Returns cached information about resource.
+
+        :param path: the normalized full path to resource.
+        :param complete: True when all properties are needed and the entries filled by partial PROPFIND responses
+                         should be skipped.
+        :return: a copy of information dictionary or None in case there is no valid entry in the cache.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[path]
+                entry = None
+            if entry is None or (complete and not entry[2]):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(path)
+            self.hits += 1
+            return dict(entry[1])
+
+    def put(self, path, info, complete=True):
+        """Stores information about resource.
+
+        :param path: the normalized full path to resource.
+        :param info: the dictionary of information attributes.
+        :param complete: False when the information was received for a part of properties only.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self._entries.get(path)
+            if not complete and entry is not None and entry[2] and entry[0] >= time.monotonic():
+                return
+            self._entries[path] = (time.monotonic() + self.ttl, info, complete)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path, recursive=False):
+        """Removes information about resource from the cache.
+
+        :param path: the normalized full path to resource.
+        :param recursive: True to remove all nested resources as well.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries.pop(path, None)
+            if recursive:
+                prefix = path + '/'
+                for key in [key for key in self._entries if key.startswith(prefix)]:
+                    del self._entries[key]
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Returns counters of the cache usage.
+
+        :return: the dictionary with following keys:
+                 `hits`: amount of requests answered from the cache,
+                 `misses`: amount of requests not found in the cache,
+                 `size`: amount of cached resources,
+                 `max_size`: maximum amount of cached resources.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'max_size': self.max_size}
+
+
+class DirectoryCache(object):
+    """The set of remote directories which are known to exist because the client created or verified them, so
+    uploads skip checks and `MKCOL` requests of parent directories for the lifetime of the client.
+    The instance is safe to use from multiple threads.
+    """
+
+    def __init__(self):
+        self._paths = set()
+        self._lock = threading.Lock()
+
+    def __contains__(self, path):
+        with self._lock:
+            return path in self._paths
+
+    def __len__(self):
+        with self._lock:
+            return len(self._paths)
+
+    def add(self, path):
+        """Remembers existing directory and all its ancestors.
+
+        :param path: the normalized full path to directory.
+        """
+        with self._lock:
+            while path and path not in self._paths:
+                self._paths.add(path)
+                path = path.rpartition('/')[0]
+
+    def invalidate(self, path):
+        """Forgets directory and all nested directories when they are removed or replaced.
+
+        :param path: the normalized full path to resource.
+        """
+        prefix = path + '/'
+        with self._lock:
+            self._paths = {key for key in self._paths if key != path and not key.startswith(prefix)}
+
+    def clear(self):
+        """Forgets all directories."""
+        with self._lock:
+            self._paths.clear()
+
+
+class ETagIndex(object):
+    """The index of ETags of downloaded files. It is kept in the file with name `.webdav-index.json` in each local
+    directory and it remembers the remote file, its ETag and size, and the modification time of local file.
+    The record is valid only while the local file is not changed.
+    The instance is safe to use from multiple threads.
+    """
+    file_name = '.webdav-index.json'
+
+    def __init__(self):
+        self._directories = {}
+        self._dirty = set()
+        self._deferred = 0
+        self._lock = threading.RLock()
+
+    def get(self, local_path, remote):
+        """Returns ETag of remote file which content is in the local file.
+
+        :param local_path: the path to local file.
+        :param remote: the URL of remote file.
+        :return: the ETag or None in case there is no valid record.
+        """
+        directory, name = os.path.split(os.path.abspath(local_path))
+        with self._lock:
+            record = self._load(directory).get(name)
+            if not self._deferred and directory not in self._dirty:
+                del self._directories[directory]
+        if not record or record.get('remote') != remote:
+            return None
+        try:
+            stat = os.stat(local_path)
+        except OSError:
+            return None
+        if stat.st_size != record.get('size') or stat.st_mtime_ns != record.get('mtime'):
+            return None
+        return record.get('etag')
+
+    def put(self, local_path, remote, etag):
+        """Records ETag of remote file downloaded to the local file.
+
+        :param local_path: the path to local file.
+        :param remote: the URL of remote file.
+        :param etag: the ETag of remote file, the record is removed when it is None.
+        """
+        directory, name = os.path.split(os.path.abspath(local_path))
+        with self._lock:
+            records = self._load(directory)
+            if etag:
+                stat = os.stat(local_path)
+                records[name] = {'remote': remote, 'etag': etag, 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+            elif records.pop(name, None) is None:
+                return
+            self._dirty.add(directory)
+            if not self._deferred:
+                self.save()
+
+    @contextmanager
+    def deferred(self):
+        """Defers saving of index files until the end of block, it is used by bulk operations."""
+        with self._lock:
+            self._deferred += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._deferred -= 1
+                if not self._deferred:
+                    self.save()
+
+    def save(self):
+        """Writes changed index files."""
+        with self._lock:
+            for directory in self._dirty:
+                path = os.path.join(directory, ETagIndex.file_name)
+                temp_path = "{path}.{pid}.tmp".format(path=path, pid=os.getpid())
+                with open(temp_path, 'w', encoding='utf-8') as index_file:
+                    json.dump(self._directories[directory], index_file)
+                os.replace(temp_path, path)
+            self._dirty.clear()
+            if not self._deferred:
+                self._directories.clear()
+
+    def _load(self, directory):
+        records = self._directories.get(directory)
+        if records is None:
+            try:
+                with open(os.path.join(directory, ETagIndex.file_name), encoding='utf-8') as index_file:
+                    records = json.load(index_file)
+            except (OSError, ValueError):
+                records = None
+            self._directories[directory] = records if isinstance(records, dict) else {}
+        return self._directories[directory]
+
+
+class ContentCache(object):
+    """The disk cache of downloaded content keyed by hostname, full path and ETag of remote file.
+    The cache directory can be shared by processes on the same host: content is written to temporary files which are
+    renamed when they are complete, lock files prevent downloading the same content into the cache twice and the least
+    recently used content is evicted when the total size exceeds the limit.
+    """
+    # time in seconds after which lock files of interrupted writers are removed
+    lock_timeout = 600
+
+    def __init__(self, path=None, max_size=1073741824):
+        """Constructor of content cache
+
+        :param path: the path to directory of cache, the cache is disabled when it is empty.
+        :param max_size: maximum total size of cached content in bytes, 0 means unlimited size.
+        """
+        self.path = os.path.abspath(os.path.expanduser(path)) if path else None
+        self.max_size = int(max_size) if max_size else 0
+        self.hits = 0
+        self.misses = 0
+        # the estimated total size of cached content, it is counted by scan of the cache and increased by content
+        # written by this instance, so the cache is scanned only when the estimate exceeds the limit
+        self._size = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.path is not None
+
+    def lookup(self, hostname, path):
+        """Returns ETag of cached content of remote file, it is sent in `If-None-Match` header to validate the content.
+
+        :param hostname: the hostname of WebDAV server.
+        :param path: the full path to remote file including root of WebDAV.
+        :return: the ETag or None in case the content is not cached.
+        """
+        try:
+            with open(self._ref_path(hostname, path), encoding='utf-8') as ref_file:
+                etag = ref_file.read()
+        except OSError:
+            etag = None
+        if etag and os.path.isfile(self._blob_path(hostname, path, etag)):
+            return etag
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def open(self, hostname, path, etag):
+        """Opens cached content of remote file for reading and marks it as recently used.
+
+        :param hostname: the hostname of WebDAV server.
+        :param path: the full path to remote file including root of WebDAV.
+        :param etag: the ETag of remote file.
+        :return: the binary file object or None in case the content was evicted.
+        """
+        blob_path = self._blob_path(hostname, path, etag)
+        try:
+            cached_file = open(blob_path, 'rb')
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(blob_path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return cached_file
+
+    def writer(self, hostname, path, etag):
+        """Starts writing content of remote file to the cache.
+
+        :param hostname: the hostname of WebDAV server.
+        :param path: the full path to remote file including root of WebDAV.
+        :param etag: the ETag of remote file.
+        :return: the instance of ContentCacheWriter or None in case the content can not be cached, it happens when
+                 there is no ETag or another writer writes the same content.
+        """
+        if not etag:
+            return None
+        blob_path = self._blob_path(hostname, path, etag)
+        if not self._acquire(blob_path + '.lock'):
+            return None
+        return ContentCacheWriter(self, hostname, path, etag)
+
+    def evict(self):
+        """Removes the least recently used content while the total size exceeds the limit. The cache is scanned
+        for that, so writers call it only when the estimated total size exceeds the limit.
+        """
+        if not self.max_size:
+            return
+        lock_path = os.path.join(self.path, '.evict.lock')
+        if not self._acquire(lock_path):
+            return
+        try:
+            entries = []
+            for directory, _, names in os.walk(os.path.join(self.path, 'blobs')):
+                for name in names:
+                    if name.endswith('.lock') or name.endswith('.tmp'):
+                        continue
+                    blob_path = os.path.join(directory, name)
+                    try:
+                        stat = os.stat(blob_path)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, blob_path))
+            total = sum(size for (_, size, _) in entries)
+            for (_, size, blob_path) in sorted(entries):
+                if total <= self.max_size:
+                    break
+                try:
+                    os.remove(blob_path)
+                except OSError:
+                    continue
+                total -= size
+            with self._lock:
+                self._size = total
+        finally:
+            self._release(lock_path)
+
+    def _added(self, size):
+        """Counts content written to the cache and evicts content when the estimated total size exceeds the limit.
+
+        :param size: the change of total size in bytes.
+        """
+        if not self.max_size:
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size += size
+            exceeded = self._size is None or self._size > self.max_size
+        if exceeded:
+            self.evict()
+
+    def stats(self):
+        """Returns counters of the cache.
+
+        :return: dictionary with `hits`, `misses` and `max_size` keys.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'max_size': self.max_size}
+
+    def _ref_path(self, hostname, path):
+        key = hashlib.sha256("{hostname}\0{path}".format(hostname=hostname, path=path).encode('utf-8')).hexdigest()
+        return os.path.join(self.path, 'refs', key[:2], key)
+
+    def _blob_path(self, hostname, path, etag):
+        key = hashlib.sha256("{hostname}\0{path}\0{etag}".format(hostname=hostname, path=path, etag=etag)
+                             .encode('utf-8')).hexdigest()
+        return os.path.join(self.path, 'blobs', key[:2], key)
+
+    def _acquire(self, lock_path):
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        for _ in range(2):
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(lock_path) < ContentCache.lock_timeout:
+                        return False
+                    os.remove(lock_path)
+                except OSError:
+                    pass
+        return False
+
+    @staticmethod
+    def _release(lock_path):
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+
+class ContentCacheWriter(object):
+    """Writer of content to the cache, the content becomes visible for readers after `commit` only."""
+
+    def __init__(self, cache, hostname, path, etag):
+        """Constructor of writer, the lock of content should be acquired by the cache.
+
+        :param cache: the instance of ContentCache.
+        :param hostname: the hostname of WebDAV server.
+        :param path: the full path to remote file including root of WebDAV.
+        :param etag: the ETag of remote file.
+        """
+        self.cache = cache
+        self.hostname = hostname
+        self.path = path
+        self.etag = etag
+        self.ref_path = cache._ref_path(hostname, path)
+        self.blob_path = cache._blob_path(hostname, path, etag)
+        self.temp_path = "{path}.{pid}.{thread}.tmp".format(path=self.blob_path, pid=os.getpid(),
+                                                             thread=threading.get_ident())
+        self.closed = False
+        try:
+            self._file = open(self.temp_path, 'wb')
+        except OSError:
+            self.cache._release(self.blob_path + '.lock')
+            raise
+
+    def write(self, data):
+        self._file.write(data)
+
+    def commit(self):
+        """Publishes written content and replaces the previous content of the same remote file."""
+        if self.closed:
+            return
+        self.closed = True
+        self._file.close()
+        size = 0
+        try:
+            size = os.path.getsize(self.temp_path)
+            os.replace(self.temp_path, self.blob_path)
+            try:
+                with open(self.ref_path, encoding='utf-8') as ref_file:
+                    previous_etag = ref_file.read()
+            except OSError:
+                previous_etag = None
+            os.makedirs(os.path.dirname(self.ref_path), exist_ok=True)
+            temp_path = "{path}.{pid}.{thread}.tmp".format(path=self.ref_path, pid=os.getpid(),
+                                                           thread=threading.get_ident())
+            with open(temp_path, 'w', encoding='utf-8') as ref_file:
+                ref_file.write(self.etag)
+            os.replace(temp_path, self.ref_path)
+            if previous_etag and previous_etag != self.etag:
+                previous_path = self.cache._blob_path(self.hostname, self.path, previous_etag)
+                try:
+                    previous_size = os.path.getsize(previous_path)
+                    os.remove(previous_path)
+                    size -= previous_size
+                except OSError:
+                    pass
+        finally:
+            self.cache._release(self.blob_path + '.lock')
+        self.cache._added(size)
+
+    def abort(self):
+        """Discards written content."""
+        if self.closed:
+            return
+        self.closed = True
+        self._file.close()
+        try:
+            os.remove(self.temp_path)
+        except OSError:
+            pass
+        self.cache._release(self.blob_path + '.lock')
+
+    def tee(self, chunks):
+        """Writes chunks of content while they are iterated, the content is committed when all chunks are iterated.
+
+        :param chunks: the iterable of chunks of content.
+        :return: generator of the same chunks.
+        """
+        try:
+            for chunk in chunks:
+                self.write(chunk)
+                yield chunk
+            self.commit()
+        finally:
+            self.abort()
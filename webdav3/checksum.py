@@ -0,0 +1,154 @@
+import hashlib
+import re
+import zlib
+from collections import OrderedDict
+
+from webdav3.exceptions import ChecksumMismatch, OptionNotValid
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover
+    xxhash = None
+
+
+class Adler32(object):
+    """The Adler-32 checksum with the interface of hashlib objects, it is used by ownCloud servers."""
+
+    def __init__(self):
+        self._value = 1
+
+    def update(self, data):
+        self._value = zlib.adler32(data, self._value)
+
+    def hexdigest(self):
+        return "{value:08x}".format(value=self._value)
+
+
+# mapping of names of algorithms to factories of objects with `update` and `hexdigest` methods
+algorithms = OrderedDict([
+    ('md5', hashlib.md5),
+    ('sha1', hashlib.sha1),
+    ('sha256', hashlib.sha256),
+    ('sha512', hashlib.sha512),
+    ('adler32', Adler32),
+])
+if xxhash is not None:
+    for _name in ('xxh32', 'xxh64', 'xxh3_64', 'xxh3_128'):
+        if hasattr(xxhash, _name):
+            algorithms[_name] = getattr(xxhash, _name)
+
+
+def normalize_algorithm(name):
+    """Normalizes name of algorithm, so `SHA-256`, `SHA256` and `sha256` are the same.
+
+    :param name: the name of algorithm.
+    :return: the normalized name.
+    """
+    return name.strip().lower().replace('-', '')
+
+
+def register_algorithm(name, factory):
+    """Registers algorithm of checksum.
+
+    :param name: the name of algorithm as servers report it, for example in `OC-Checksum` header.
+    :param factory: the callable without arguments which returns object with `update` and `hexdigest` methods.
+    """
+    if not callable(factory):
+        raise OptionNotValid(name="factory", value=factory)
+    algorithms[normalize_algorithm(name)] = factory
+
+
+def parse_checksums(value):
+    """Parses checksums in the format of `OC-Checksum` header and `oc:checksums` property.
+
+    :param value: the string of checksums, for example 'SHA1:a9993e36 MD5:90015098'.
+    :return: the dictionary of normalized names of algorithms and checksums.
+    """
+    checksums = OrderedDict()
+    for item in re.split(r'[\s,]+', value or ''):
+        name, _, checksum = item.partition(':')
+        if name and checksum:
+            checksums[normalize_algorithm(name)] = checksum.lower()
+    return checksums
+
+
+class Checksums(object):
+    """Digests of content computed incrementally while it is transferred.
+    The instance is passed to transfer methods of client and keeps results of the last transfer.
+    """
+
+    def __init__(self, *names, verify_remote=True):
+        """Constructor of checksums
+
+        :param names: the names of algorithms, look at `algorithms` for available ones.
+        :param verify_remote: True to compare digests with checksums reported by the server after transfer.
+        """
+        if not names:
+            raise OptionNotValid(name="names", value=names)
+        self.names = tuple(normalize_algorithm(name) for name in names)
+        for name in self.names:
+            if name not in algorithms:
+                raise OptionNotValid(name="names", value=name)
+        self.verify_remote = verify_remote
+        self.reset()
+
+    def reset(self):
+        """Starts computation of digests from the beginning."""
+        self._digests = OrderedDict((name, algorithms[name]()) for name in self.names)
+        self.size = 0
+        self.verified = ()
+
+    def update(self, data):
+        """Updates digests by the next chunk of content.
+
+        :param data: the bytes-like chunk of content.
+        """
+        for digest in self._digests.values():
+            digest.update(data)
+        self.size += len(data)
+
+    def hexdigests(self):
+        """Returns the digests of content processed so far.
+
+        :return: the dictionary of names of algorithms and hexadecimal digests.
+        """
+        return OrderedDict((name, digest.hexdigest()) for (name, digest) in self._digests.items())
+
+    def __getitem__(self, name):
+        return self._digests[normalize_algorithm(name)].hexdigest()
+
+    def verify(self, expected, path):
+        """Compares digests with checksums reported by the server, algorithms which are not computed are ignored.
+
+        :param expected: the checksums in the format of `OC-Checksum` header or None.
+        :param path: the path to resource for the error message.
+        :return: True in case at least one checksum is compared.
+        """
+        verified = []
+        for (name, checksum) in parse_checksums(expected).items():
+            digest = self._digests.get(name)
+            if digest is None:
+                continue
+            actual = digest.hexdigest()
+            if actual.lower() != checksum:
+                raise ChecksumMismatch(path=path, algorithm=name, expected=checksum, actual=actual)
+            verified.append(name)
+        self.verified = tuple(verified)
+        return bool(verified)
+
+
+def iter_checksums(chunks, checksums, path, expected=None):
+    """Updates checksums by chunks of content while they are iterated and compares them at the end.
+
+    :param chunks: the iterable of chunks of content.
+    :param checksums: the instance of Checksums.
+    :param path: the path to resource for the error message.
+    :param expected: (optional) the checksums reported by the server in the format of `OC-Checksum` header.
+    :return: generator of the same chunks.
+    """
+    checksums.reset()
+    for chunk in chunks:
+        checksums.update(chunk)
+        yield chunk
+    if checksums.verify_remote:
+        checksums.verify(expected, path)
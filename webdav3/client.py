@@ -1,22 +1,37 @@
 # -*- coding: utf-8
 
 import functools
+import http.client
+import inspect
+import io
+import json
 import logging
+import mmap
 import os
+import queue
 import shutil
 import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED, as_completed
 from io import BufferedReader, BytesIO, FileIO
 from re import sub
 from urllib.parse import unquote, urlsplit, urlparse
 
 import lxml.etree as etree
 import requests
-from dateutil import parser as dateutil_parser
+import urllib3
+from requests.adapters import HTTPAdapter
 
+from webdav3.cache import MetadataCache, ETagIndex, ContentCache, DirectoryCache
+from webdav3.checksum import iter_checksums
 from webdav3.connection import WebDAVSettings
 from webdav3.exceptions import NoConnection, ConnectionException, NotEnoughSpace, RemoteResourceNotFound, \
     MethodNotSupported, ResponseErrorCode, \
-    RemoteParentNotFound, OptionNotValid, LocalResourceNotFound, ResourceLocked
+    RemoteParentNotFound, OptionNotValid, LocalResourceNotFound, ResourceLocked, TransferErrors
+from webdav3.info import ResourceInfo
+from webdav3.remote_file import RemoteFile, coalesce_ranges, iter_byteranges, parse_content_range
 from webdav3.urn import Urn
 
 log = logging.getLogger(__name__)
@@ -59,7 +74,41 @@ def get_options(option_type, from_options):
     return _options
 
 
+# errors of reading response content directly from `response.raw`, requests maps them in `iter_content` only
+raw_read_errors = (urllib3.exceptions.HTTPError, http.client.HTTPException)
+
+
+def parse_bool(name, value):
+    """Parses boolean option which can be passed as string, for example from configuration file.
+
+    :param name: the name of option.
+    :param value: the value of option, the strings 'true', 'yes', 'on', '1' and 'false', 'no', 'off', '0' or empty
+                  are accepted in any case.
+    :return: the boolean value of option.
+    """
+    if not isinstance(value, str):
+        return bool(value)
+    if value.strip().lower() in ('true', 'yes', 'on', '1'):
+        return True
+    if value.strip().lower() in ('false', 'no', 'off', '0', ''):
+        return False
+    raise OptionNotValid(name=name, value=value)
+
+
 def wrap_connection_error(fn):
+    if inspect.isgeneratorfunction(fn):
+        @functools.wraps(fn)
+        def _generator_wrapper(self, *args, **kw):
+            log.debug("Requesting %s(%s, %s)", fn, args, kw)
+            try:
+                yield from fn(self, *args, **kw)
+            except requests.ConnectionError:
+                raise NoConnection(self.webdav.hostname)
+            except (requests.RequestException, *raw_read_errors) as re:
+                raise ConnectionException(re)
+
+        return _generator_wrapper
+
     @functools.wraps(fn)
     def _wrapper(self, *args, **kw):
         log.debug("Requesting %s(%s, %s)", fn, args, kw)
@@ -67,7 +116,7 @@ def wrap_connection_error(fn):
             res = fn(self, *args, **kw)
         except requests.ConnectionError:
             raise NoConnection(self.webdav.hostname)
-        except requests.RequestException as re:
+        except (requests.RequestException, *raw_read_errors) as re:
             raise ConnectionException(re)
         else:
             return res
@@ -75,8 +124,367 @@ def wrap_connection_error(fn):
     return _wrapper
 
 
+class WebDAVAdapter(HTTPAdapter):
+    """The transport adapter with configurable connection pool which is shared by all threads using the client.
+    Connections kept in the pool are dropped when the pool was idle longer than keep-alive timeout, so the stale
+    connections closed by the server are not reused.
+    """
+
+    def __init__(self, keep_alive_timeout=None, **kwargs):
+        self.keep_alive_timeout = keep_alive_timeout
+        self._last_used = time.monotonic()
+        self._idle_lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if not self.keep_alive_timeout:
+            return super().send(request, **kwargs)
+        with self._idle_lock:
+            now = time.monotonic()
+            if now - self._last_used > float(self.keep_alive_timeout):
+                self.poolmanager.clear()
+            self._last_used = now
+        response = super().send(request, **kwargs)
+        # the connection is idle since its response is released, long transfers do not count as idle time
+        release_conn = response.raw.release_conn
+
+        def _release_conn():
+            release_conn()
+            with self._idle_lock:
+                self._last_used = time.monotonic()
+
+        response.raw.release_conn = _release_conn
+        return response
+
+
+class AggregatedProgress(object):
+    """Aggregates progress of files transferred in parallel and reports it to single progress callback.
+    The total is the sum of sizes of all files known so far.
+    """
+
+    def __init__(self, progress=None, progress_args=()):
+        self.progress = progress
+        self.progress_args = progress_args
+        self.current = 0
+        self.total = 0
+        self._files = {}
+        self._lock = threading.Lock()
+
+    def add(self, key, size):
+        """Adds file to the transfer.
+
+        :param key: the identifier of file.
+        :param size: the size of file in bytes or None if it is unknown.
+        :return: the progress callback for transfer of this file.
+        """
+        with self._lock:
+            self._files[key] = 0
+            self.total += size or 0
+        return lambda current, total, *args: self.update(key, current)
+
+    def update(self, key, current):
+        with self._lock:
+            self.current += current - self._files.get(key, 0)
+            self._files[key] = current
+            if callable(self.progress):
+                self.progress(self.current, self.total, *self.progress_args)
+
+    def finish(self, key, size):
+        if size is not None:
+            self.update(key, size)
+
+
+class UploadBody(object):
+    """Body of upload request with known length, so it is sent with `Content-Length` header instead of chunked
+    transfer encoding. Regular files are mapped to memory and sent by slices of the mapping without copying, other
+    streams are read by `readinto` into single reusable buffer. The progress and checksums are updated by each block.
+    The body can be iterated again to repeat the request.
+    """
+
+    def __init__(self, source, length, chunk_size=65536, progress=None, progress_args=(), checksums=None,
+                 pipeline=0):
+        """Constructor of upload body
+
+        :param source: the binary file-like object which is sent from its current position, the iterable of chunks of
+                       content or the callable which returns next chunk and empty bytes at the end.
+        :param length: the length of content in bytes.
+        :param chunk_size: (optional) the size of blocks sent to the connection.
+        :param progress: (optional) the progress callback function.
+        :param progress_args: (optional) a tuple with extra custom arguments for the progress callback function.
+        :param checksums: (optional) the instance of `webdav3.checksum.Checksums` updated by sent blocks.
+        :param pipeline: (optional) amount of reusable buffers which file-like source is read into by background
+                         thread while the previous blocks are sent, so reading of slow disks overlaps with sending.
+                         Defaults is 0, the source is read by the sending thread.
+        """
+        if length is None or int(length) < 0:
+            raise OptionNotValid(name="length", value=length)
+        self.source = source
+        self.length = int(length)
+        self.chunk_size = int(chunk_size)
+        self.progress = progress
+        self.progress_args = progress_args
+        self.checksums = checksums
+        self.pipeline = int(pipeline or 0)
+        self._offset = source.tell() if hasattr(source, 'read') else None
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        current = 0
+        if callable(self.progress):
+            self.progress(current, self.length, *self.progress_args)
+        for block in self._iter_blocks():
+            if self.checksums is not None:
+                self.checksums.update(block)
+            current += len(block)
+            yield block
+            if callable(self.progress):
+                self.progress(current, self.length, *self.progress_args)
+
+    def _iter_blocks(self):
+        if not hasattr(self.source, 'read'):
+            chunks = iter(self.source, b'') if callable(self.source) else self.source
+            for chunk in chunks:
+                yield chunk
+            return
+        self.source.seek(self._offset)
+        if self.pipeline > 0 and self.length > 0:
+            yield from self._prefetch()
+            return
+        mapping = self._map()
+        if mapping is not None:
+            with mapping, memoryview(mapping) as view:
+                end = self._offset + self.length
+                for start in range(self._offset, end, self.chunk_size):
+                    yield from self._lend(view[start:min(start + self.chunk_size, end)])
+            return
+        with memoryview(bytearray(self.chunk_size)) as view:
+            left = self.length
+            while left > 0:
+                size = self._read_into(view, min(self.chunk_size, left))
+                if not size:
+                    break
+                left -= size
+                yield from self._lend(view[:size])
+
+    def _read_into(self, view, size):
+        """Reads the next block of source into buffer.
+
+        :param view: the memory view of buffer.
+        :param size: maximum amount of bytes to read.
+        :return: amount of read bytes, 0 at the end of source.
+        """
+        if hasattr(self.source, 'readinto'):
+            return self.source.readinto(view[:size]) or 0
+        data = self.source.read(size)
+        view[:len(data)] = data
+        return len(data)
+
+    def _prefetch(self):
+        """Reads the source by background thread into the ring of reusable buffers. The thread reads ahead while
+        there are free buffers and the buffer is returned to the ring after its block is sent.
+
+        :return: generator of blocks.
+        """
+        buffers = [memoryview(bytearray(self.chunk_size)) for _ in range(self.pipeline)]
+        free, ready = queue.Queue(), queue.Queue()
+        for index in range(self.pipeline):
+            free.put(index)
+
+        def read():
+            try:
+                left = self.length
+                while left > 0:
+                    index = free.get()
+                    if index is None:
+                        return
+                    size = self._read_into(buffers[index], min(self.chunk_size, left))
+                    if not size:
+                        break
+                    left -= size
+                    ready.put((index, size))
+                ready.put(None)
+            except BaseException as error:
+                ready.put(error)
+
+        reader = threading.Thread(target=read, daemon=True)
+        reader.start()
+        try:
+            while True:
+                item = ready.get()
+                if item is None:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                index, size = item
+                yield from self._lend(buffers[index][:size])
+                free.put(index)
+        finally:
+            free.put(None)
+            reader.join()
+            for buffer in buffers:
+                buffer.release()
+
+    @staticmethod
+    def _lend(block):
+        """Yields view of buffer and releases it after it is sent, so the buffer can be reused or unmapped.
+
+        :param block: the block of content.
+        :return: generator of the block.
+        """
+        try:
+            yield block
+        finally:
+            if isinstance(block, memoryview):
+                block.release()
+
+    def _map(self):
+        """Maps regular file to memory.
+
+        :return: the read-only memory map or None in case the source can not be mapped.
+        """
+        if self._offset is None or self.length == 0:
+            return None
+        try:
+            stat = os.fstat(self.source.fileno())
+            if self._offset + self.length > stat.st_size:
+                return None
+            return mmap.mmap(self.source.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            return None
+
+
+class DiskWriter(object):
+    """Writer of downloaded blocks to local file. With positive depth the blocks are queued for background thread
+    which writes them while the next blocks are received, so writing to slow disks overlaps with receiving. The errors
+    of writing are raised by the next call of `write` or by `close`.
+    """
+    # amount of written bytes after which the file is flushed and the position is reported to checkpoint callback
+    checkpoint_size = 4 * 1024 * 1024
+
+    def __init__(self, local_file, depth=0, fsync=False, checkpoint=None):
+        """Constructor of writer
+
+        :param local_file: the binary file opened for writing.
+        :param depth: (optional) maximum amount of blocks queued for background thread. Defaults is 0, the blocks are
+                      written by the calling thread.
+        :param fsync: (optional) True to flush the file to disk by `fsync` when it is closed or amount of bytes after
+                      which the file is flushed while it is written. Defaults is False.
+        :param checkpoint: (optional) the function which is called with the position in file each time the file is
+                           flushed while it is written, so the progress survives killing of the process.
+        """
+        self.local_file = local_file
+        self.fsync = fsync
+        self.checkpoint = checkpoint
+        self._unsynced = 0
+        self._error = None
+        self._queue = None
+        if int(depth or 0) > 0:
+            self._queue = queue.Queue(maxsize=int(depth))
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def write(self, block):
+        if self._queue is None:
+            return self._write(block)
+        if self._error is not None:
+            raise self._error
+        self._queue.put(block)
+
+    def close(self):
+        """Waits until queued blocks are written and flushes the file to disk when it is configured.
+
+        :return: the position in file after the last written block.
+        """
+        self._join()
+        if self._error is not None:
+            raise self._error
+        if self.fsync:
+            self._sync()
+        return self.local_file.tell()
+
+    def abort(self):
+        """Waits until queued blocks are written and ignores errors of writing, it is used when transfer is failed.
+
+        :return: the position in file after the last written block.
+        """
+        self._join()
+        self.local_file.flush()
+        return self.local_file.tell()
+
+    def _join(self):
+        if self._queue is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._queue = None
+
+    def _run(self):
+        while True:
+            block = self._queue.get()
+            if block is None:
+                return
+            # the queue is drained after error, so the receiving thread is not blocked
+            if self._error is None:
+                try:
+                    self._write(block)
+                except BaseException as error:
+                    self._error = error
+
+    def _write(self, block):
+        self.local_file.write(block)
+        self._unsynced += len(block)
+        if self.fsync and self.fsync is not True and self._unsynced >= int(self.fsync):
+            self._sync()
+        elif self.checkpoint is not None and self._unsynced >= self.checkpoint_size:
+            self.local_file.flush()
+            self._unsynced = 0
+            self.checkpoint(self.local_file.tell())
+
+    def _sync(self):
+        self.local_file.flush()
+        os.fsync(self.local_file.fileno())
+        self._unsynced = 0
+        if self.checkpoint is not None:
+            self.checkpoint(self.local_file.tell())
+
+
+class TransferStream(object):
+    """File-like object which reads content of download response while it is uploaded by another request.
+    Only the block requested by upload is kept in memory, the known length is sent as `Content-Length`.
+    """
+
+    def __init__(self, response, length, progress=None, progress_args=()):
+        """Constructor of stream
+
+        :param response: the response of download request with not encoded content.
+        :param length: the length of content in bytes.
+        :param progress: (optional) the progress callback function.
+        :param progress_args: (optional) a tuple with extra custom arguments for the progress callback function.
+        """
+        self.response = response
+        self.len = length
+        self.progress = progress
+        self.progress_args = progress_args
+        self.current = 0
+
+    def read(self, size=-1):
+        # the errors are raised while the upload request is sent, they must not be taken for errors of upload
+        try:
+            data = self.response.raw.read(None if size is None or size < 0 else size)
+        except raw_read_errors as error:
+            raise ConnectionException(error)
+        if not data and size != 0 and self.current < self.len:
+            raise ConnectionException(http.client.IncompleteRead(b'', self.len - self.current))
+        self.current += len(data)
+        if callable(self.progress):
+            self.progress(self.current, self.len, *self.progress_args)
+        return data
+
+
 class Client(object):
     """The client for WebDAV servers provides an ability to control files on remote WebDAV server.
+    The instance of client is safe to share between threads, all threads use the same pool of connections.
     """
     # path to root directory of WebDAV
     root = '/'
@@ -84,6 +492,15 @@ class Client(object):
     # controls whether to verify the server's TLS certificate or not
     verify = True
 
+    # suffix of file which keeps state of partially downloaded file for resuming
+    resume_suffix = '.webdav-resume'
+
+    # suffix of file which keeps journal of interrupted uploading for resuming
+    upload_journal_suffix = '.webdav-upload'
+
+    # the property of ownCloud and Nextcloud servers with checksums of file
+    checksums_property = {'namespace': 'http://owncloud.org/ns', 'name': 'checksums'}
+
     # HTTP headers for different actions
     default_http_header = {
         'list': ["Accept: */*", "Depth: 1"],
@@ -93,6 +510,7 @@ class Client(object):
         'mkdir': ["Accept: */*", "Connection: Keep-Alive"],
         'clean': ["Accept: */*", "Connection: Keep-Alive"],
         'check': ["Accept: */*"],
+        'patch': ["Accept: */*", "Content-Type: application/x-sabredav-partialupdate"],
         'info': ["Accept: */*", "Depth: 1"],
         'get_property': ["Accept: */*", "Depth: 1", "Content-Type: application/x-www-form-urlencoded"],
         'set_property': ["Accept: */*", "Depth: 1", "Content-Type: application/x-www-form-urlencoded"]
@@ -108,6 +526,7 @@ class Client(object):
         'mkdir': "MKCOL",
         'clean': "DELETE",
         'check': "HEAD",
+        'patch': "PATCH",
         'list': "PROPFIND",
         'free': "PROPFIND",
         'info': "PROPFIND",
@@ -143,18 +562,60 @@ class Client(object):
                                  Defaults to unlimited speed.
             `webdav_timeout`: (optional) Timeout in seconds used in HTTP connection managed by requests. Defaults to 30 seconds.
             `webdav_verbose`: (optional) Set verbose mode on/off. By default verbose mode is off.
+            `webdav_pool_connections`: (optional) Number of connection pools to cache, one pool per host.
+                                       Defaults to 10.
+            `webdav_pool_maxsize`: (optional) Maximum number of connections to keep in pool per host. It should be
+                                   not less than number of threads sharing the client. Defaults to 10.
+            `webdav_pool_block`: (optional) Block a request when all connections of the pool are in use instead of
+                                 opening a new connection which is discarded after the request, the strings
+                                 like 'true' or 'false' are accepted as well. Defaults is False.
+            `webdav_keep_alive_timeout`: (optional) Time in seconds after which idle pooled connections are dropped.
+                                         Defaults to keep connections until server closes them.
+            `webdav_optimistic`: (optional) Send operations directly without pre-flight existence checks, the error
+                                 codes of operation are mapped to the same exceptions. Defaults is False.
+            `webdav_metadata_cache_size`: (optional) Maximum amount of resources which properties are cached to answer
+                                          `check`, `is_dir` and `info` without requests. Defaults is 0, the cache is
+                                          disabled.
+            `webdav_metadata_cache_ttl`: (optional) Time in seconds while cached properties are valid. Defaults to 60.
+            `webdav_content_cache_path`: (optional) Path to directory of disk cache of downloaded content shared by
+                                         processes on the same host. Defaults is None, the cache is disabled.
+            `webdav_content_cache_size`: (optional) Maximum total size of cached content in bytes, the least recently
+                                         used content is evicted. Defaults to 1 GiB.
+            `webdav_chunked_upload_root`: (optional) Path to collection of chunked uploads of Nextcloud and ownCloud
+                                          servers like `/remote.php/dav/uploads/<user>`. Defaults is derived from
+                                          `webdav_root` like `/remote.php/dav/files/<user>`.
+            `webdav_chunked_upload_size`: (optional) Size of chunks of `upload_chunked` in bytes. Defaults to 10 MiB.
+            `webdav_pipeline_depth`: (optional) Amount of chunks read ahead by background thread while `upload_file`
+                                     sends the previous ones and amount of chunks queued for background thread which
+                                     writes files of `download_file`. Defaults is 0, files are read and written by the
+                                     transferring thread.
+            `webdav_fsync`: (optional) True to flush downloaded files to disk by `fsync` when they are complete or
+                            amount of bytes after which they are flushed while they are written. Defaults is False.
 
         """
-        self.session = requests.Session()
         self.http_header = Client.default_http_header.copy()
         self.requests = Client.default_requests.copy()
         webdav_options = get_options(option_type=WebDAVSettings, from_options=options)
 
         self.webdav = WebDAVSettings(webdav_options)
+        self.session = requests.Session()
+        adapter = WebDAVAdapter(
+            keep_alive_timeout=self.webdav.keep_alive_timeout,
+            pool_connections=int(self.webdav.pool_connections),
+            pool_maxsize=int(self.webdav.pool_maxsize),
+            pool_block=parse_bool('pool_block', self.webdav.pool_block)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.requests.update(self.webdav.override_methods)
         self.default_options = {}
         self.timeout = self.webdav.timeout
         self.chunk_size = 65536
+        self.cache = MetadataCache(max_size=self.webdav.metadata_cache_size, ttl=self.webdav.metadata_cache_ttl)
+        self.depth_infinity = None
+        self.etag_index = ETagIndex()
+        self.content_cache = ContentCache(path=self.webdav.content_cache_path, max_size=self.webdav.content_cache_size)
+        self.directories = DirectoryCache()
 
     def get_headers(self, action, headers_ext=None):
         """Returns HTTP headers of specified WebDAV actions.
@@ -197,7 +658,92 @@ class Client(object):
         """
         return "{root}{path}".format(root=unquote(self.webdav.root), path=urn.path())
 
-    def execute_request(self, action, path, data=None, headers_ext=None):
+    def _cache_key(self, urn):
+        return Urn.normalize_path(self.get_full_path(urn))
+
+    def _cache_response(self, content, complete=True):
+        """Stores information about all resources from PROPFIND response in the metadata cache.
+
+        :param content: the XML content of PROPFIND response.
+        :param complete: False when the response contains only a part of properties.
+        """
+        if not self.cache.enabled:
+            return
+        for info in WebDavXmlUtils.parse_get_list_info_response(content):
+            self._cache_info(info, complete=complete)
+
+    def _cache_info(self, info, complete=True):
+        self.cache.put(self._info_key(info), info, complete=complete)
+
+    def _info_key(self, info):
+        """Returns the same key for information received from server as `_cache_key` returns for the resource URN.
+
+        :param info: the information dictionary as `list` returns it.
+        :return: the normalized path to resource with root path.
+        """
+        path = info['path']
+        prefix = unquote(urlparse(self.webdav.hostname).path)
+        if prefix and path.startswith(prefix):
+            path = path[len(prefix):]
+        return Urn.normalize_path(path)
+
+    def _invalidate(self, urn, recursive=False):
+        """Removes the resource and its parent changed by the client from the metadata cache.
+
+        :param urn: the URN of changed resource.
+        :param recursive: True to remove all nested resources as well, the resource is removed or replaced then and
+                          it is removed from known directories too.
+        """
+        self.cache.invalidate(self._cache_key(urn), recursive=recursive)
+        self.cache.invalidate(self._cache_key(Urn(urn.parent())))
+        if recursive:
+            self.directories.invalidate(self._cache_key(urn))
+
+    def _forget_parent(self, urn):
+        """Removes parent directory of resource and its nested directories from known directories, it is called
+        when the server reports that the parent is missing.
+
+        :param urn: the URN of resource.
+        """
+        self.directories.invalidate(self._cache_key(Urn(urn.parent(), directory=True)))
+
+    def _parent_exists(self, urn):
+        """Checks that parent directory of resource exists, the directories known to exist are not requested.
+
+        :param urn: the URN of resource.
+        :return: True in case the parent directory exists.
+        """
+        parent = Urn(urn.parent(), directory=True)
+        if self._cache_key(parent) in self.directories:
+            return True
+        if not self.check(parent.path()):
+            return False
+        self.directories.add(self._cache_key(parent))
+        return True
+
+    @staticmethod
+    def _propfind_request(properties, headers=None):
+        """Prepares PROPFIND request for the selected information attributes only.
+
+        :param properties: the names of information attributes to request or None to request all properties.
+        :param headers: (optional) the additional headers of request.
+        :return: the tuple of request content or None and the list of additional headers.
+        """
+        headers = list(headers) if headers else []
+        if properties is None:
+            return None, headers
+        names = ['resourcetype']
+        for name in properties:
+            if name in ('isdir', 'path'):
+                continue
+            tag = WebDavXmlUtils.info_attributes.get(name)
+            if tag is None:
+                raise OptionNotValid(name='properties', value=name)
+            names.append(tag)
+        headers.append("Content-Type: text/xml")
+        return WebDavXmlUtils.create_propfind_request_content(tuple(sorted(set(names)))), headers
+
+    def execute_request(self, action, path, data=None, headers_ext=None, url=None):
         """Generate request to WebDAV server for specified action and path and execute it.
 
         :param action: the action for WebDAV server which should be executed.
@@ -206,11 +752,13 @@ class Client(object):
                      or file-like object to send in the body of the :class:`Request`.
         :param headers_ext: (optional) the addition headers list witch should be added to basic HTTP headers for
                             the specified action.
+        :param url: (optional) the full URL of resource outside of root directory, the path is not used then.
         :return: HTTP response of request.
         """
+        url = url or self.get_url(path)
         response = self.session.request(
             method=self.requests[action],
-            url=self.get_url(path),
+            url=url,
             auth=(self.webdav.login, self.webdav.password) if (not self.webdav.token and not self.session.auth)
                                                               and (
                                                                           self.webdav.login and self.webdav.password) else None,
@@ -231,9 +779,43 @@ class Client(object):
         if response.status_code == 405:
             raise MethodNotSupported(name=action, server=self.webdav.hostname)
         if response.status_code >= 400:
-            raise ResponseErrorCode(url=self.get_url(path), code=response.status_code, message=response.content)
+            raise ResponseErrorCode(url=url, code=response.status_code, message=response.content)
         return response
 
+    def _execute_operation(self, action, urn, data=None, headers_ext=None):
+        """Executes request of operation on the resource. In optimistic mode the callers skip pre-flight checks, so
+        error codes of the operation are mapped to the exceptions which the checks would raise.
+
+        :param action: the action for WebDAV server which should be executed.
+        :param urn: the URN of resource for action.
+        :param data: (optional) the body of request.
+        :param headers_ext: (optional) the addition headers list.
+        :return: HTTP response of request.
+        """
+        if not self.webdav.optimistic:
+            try:
+                return self.execute_request(action=action, path=urn.quote(), data=data, headers_ext=headers_ext)
+            except ResponseErrorCode as error:
+                # the check of parent is skipped for known directories, so their removal is reported by 409 status
+                if error.code != 409 or self._cache_key(Urn(urn.parent(), directory=True)) not in self.directories:
+                    raise
+                self._forget_parent(urn)
+                raise RemoteParentNotFound(urn.path())
+        try:
+            return self.execute_request(action=action, path=urn.quote(), data=data, headers_ext=headers_ext)
+        except RemoteResourceNotFound:
+            if action == 'upload':
+                self._forget_parent(urn)
+                raise RemoteParentNotFound(urn.path())
+            raise RemoteResourceNotFound(urn.path())
+        except MethodNotSupported:
+            raise OptionNotValid(name="remote_path", value=urn.path())
+        except ResponseErrorCode as error:
+            if error.code == 409:
+                self._forget_parent(urn)
+                raise RemoteParentNotFound(urn.path())
+            raise
+
     def valid(self):
         """Validates of WebDAV settings.
 
@@ -242,13 +824,18 @@ class Client(object):
         return True if self.webdav.valid() else False
 
     @wrap_connection_error
-    def list(self, remote_path=root, get_info=False, recursive=False):
+    def list(self, remote_path=root, get_info=False, recursive=False, typed=False, properties=None):
         """Returns list of nested files and directories for remote WebDAV directory by path.
         More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PROPFIND
 
         :param remote_path: path to remote directory.
         :param get_info: path and element info to remote directory, like cmd 'ls -l'.
-        :param recursive: true will do a recursive listing of infinite depth
+        :param recursive: true will do a recursive listing of infinite depth, in case the server refuses
+                          `Depth: infinity` the tree is crawled by parallel requests of depth 1 as `walk` does.
+        :param typed: true to get the information as compact `ResourceInfo` records instead of dictionaries.
+        :param properties: (optional) the names of information attributes to request, for example ['etag', 'size'],
+                           the server computes and returns these properties only, other attributes are None.
+                           All properties are requested by default.
         :return: if get_info=False it returns list of nested file or directory names, otherwise it returns
                  list of information, the information is a dictionary and it values with following keys:
                  `created`: date of resource creation,
@@ -261,22 +848,144 @@ class Client(object):
                  `path`: path of resource.
 
         """
-        headers = []
-        if recursive == True:
-            headers = ["Depth:infinity"]
+        return [resource for resource in self.iter_list(remote_path, get_info=get_info, recursive=recursive,
+                                                        typed=typed, properties=properties)]
+
+    @wrap_connection_error
+    def iter_list(self, remote_path=root, get_info=False, recursive=False, typed=False, properties=None):
+        """Iterates over nested files and directories for remote WebDAV directory by path.
+        The response is parsed incrementally while it is received, so memory usage does not depend on size of listing.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PROPFIND
+
+        :param remote_path: path to remote directory.
+        :param get_info: path and element info to remote directory, like cmd 'ls -l'.
+        :param recursive: true will do a recursive listing of infinite depth
+        :param typed: true to get the information as compact `ResourceInfo` records instead of dictionaries.
+        :param properties: (optional) the names of information attributes to request as for `list`.
+        :return: generator of the same items as `list` returns.
+        """
+        if not get_info and properties is None:
+            properties = ()
+        self._propfind_request(properties)
         directory_urn = Urn(remote_path, directory=True)
-        if directory_urn.path() != Client.root and not self.check(directory_urn.path()):
+        if not self.webdav.optimistic and directory_urn.path() != Client.root and not self.check(directory_urn.path()):
             raise RemoteResourceNotFound(directory_urn.path())
 
+        if recursive == True:
+            resources = self._iter_tree(directory_urn, properties)
+        else:
+            resources = self._iter_directory(directory_urn, properties)
+        for info in resources:
+            if not get_info:
+                yield Urn(info['path'], info['isdir']).filename()
+            else:
+                yield ResourceInfo.from_dict(info) if typed else info
+
+    def _iter_directory(self, directory_urn, properties, headers=None):
+        """Requests PROPFIND for directory and iterates over information about nested resources while the response
+        is received. The information is stored in the metadata cache.
+
+        :param directory_urn: the URN of remote directory.
+        :param properties: the names of information attributes to request or None to request all properties.
+        :param headers: (optional) the additional headers of request.
+        :return: generator of information dictionaries as `list` returns them.
+        """
+        data, headers = self._propfind_request(properties, headers)
         path = Urn.normalize_path(self.get_full_path(directory_urn))
-        response = self.execute_request(action='list', path=directory_urn.quote(), headers_ext=headers)
-        if get_info:
-            subfiles = WebDavXmlUtils.parse_get_list_info_response(response.content)
-            return [subfile for subfile in subfiles if Urn.compare_path(path, subfile.get('path')) is False]
+        response = self.execute_request(action='list', path=directory_urn.quote(), data=data, headers_ext=headers)
+        response.raw.decode_content = True
+        with response:
+            try:
+                for info in WebDavXmlUtils.iter_get_list_info_response(response.raw):
+                    if self.cache.enabled:
+                        self._cache_info(dict(info), complete=data is None)
+                    if Urn.compare_path(path, info['path']) is True:
+                        continue
+                    yield info
+            except etree.XMLSyntaxError as error:
+                # the truncated or malformed listing is not returned partially
+                raise ResponseErrorCode(url=self.get_url(directory_urn.quote()), code=response.status_code,
+                                        message="malformed PROPFIND response: {error}".format(error=error))
+
+    def _iter_tree(self, directory_urn, properties):
+        """Iterates over all resources of directory tree by single `Depth: infinity` request. In case the server
+        refuses such requests the tree is crawled by `walk` and the client does not try infinite depth anymore.
+
+        :param directory_urn: the URN of remote directory.
+        :param properties: the names of information attributes to request or None to request all properties.
+        :return: generator of information dictionaries as `list` returns them.
+        """
+        if self.depth_infinity is not False:
+            resources = self._iter_directory(directory_urn, properties, headers=["Depth:infinity"])
+            try:
+                first = next(resources, None)
+            except MethodNotSupported:
+                self.depth_infinity = False
+            except ResponseErrorCode as error:
+                if error.code not in (400, 403, 501):
+                    raise
+                self.depth_infinity = False
+            else:
+                self.depth_infinity = True
+                if first is not None:
+                    yield first
+                yield from resources
+                return
+
+        for _, directories, files in self.walk(directory_urn.path(), get_info=True, properties=properties):
+            yield from directories
+            yield from files
 
-        urns = WebDavXmlUtils.parse_get_list_response(response.content)
+    @wrap_connection_error
+    def walk(self, remote_path=root, max_workers=None, get_info=False, properties=None):
+        """Walks the remote directory tree like `os.walk` does. Directories are listed breadth-first by PROPFIND
+        requests of depth 1 which are executed in parallel, the results are returned as soon as they are received.
+        Like for `os.walk` the caller can remove names from the list of directories to skip them.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PROPFIND
+
+        :param remote_path: (optional) path to remote directory. Defaults is root directory of WebDAV.
+        :param max_workers: (optional) maximum amount of parallel requests. Defaults to `webdav_pool_maxsize`.
+        :param get_info: true to get information dictionaries of resources as `list` returns instead of names.
+        :param properties: (optional) the names of information attributes to request as for `list`.
+        :return: generator of tuples (directory path, directories, files) in order the listings are received.
+        """
+        if not get_info and properties is None:
+            properties = ()
+        self._propfind_request(properties)
+        directory_urn = Urn(remote_path, directory=True)
+        if not self.webdav.optimistic and directory_urn.path() != Client.root and not self.check(directory_urn.path()):
+            raise RemoteResourceNotFound(directory_urn.path())
 
-        return [urn.filename() for urn in urns if Urn.compare_path(path, urn.path()) is False]
+        def list_directory(directory_path):
+            return [info for info in self._iter_directory(Urn(directory_path, directory=True), properties)]
+
+        max_workers = int(max_workers or self.webdav.pool_maxsize)
+        pending = deque([directory_urn.path()])
+        running = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                while pending or running:
+                    while pending and len(running) < max_workers:
+                        directory_path = pending.popleft()
+                        running[executor.submit(list_directory, directory_path)] = directory_path
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        directory_path = running.pop(future)
+                        try:
+                            resources = future.result()
+                        except RemoteResourceNotFound:
+                            continue
+                        directories, files = [], []
+                        for info in resources:
+                            resource = info if get_info else Urn(info['path'], info['isdir']).filename().rstrip('/')
+                            (directories if info['isdir'] else files).append(resource)
+                        yield directory_path, directories, files
+                        for directory in directories:
+                            name = Urn(directory['path'], directory=True).filename() if get_info else directory
+                            pending.append(Urn(directory_path + name, directory=True).path())
+            finally:
+                for future in running:
+                    future.cancel()
 
     @wrap_connection_error
     def free(self):
@@ -301,6 +1010,9 @@ class Client(object):
             return True
 
         urn = Urn(remote_path)
+        if self.cache.get(self._cache_key(urn), complete=False) is not None:
+            return True
+
         try:
             response = self.execute_request(action='check', path=urn.quote())
         except RemoteResourceNotFound:
@@ -316,41 +1028,120 @@ class Client(object):
         More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_MKCOL
 
         :param remote_path: path to directory
+        :param recursive: (optional) True to make missing parent directories as well, look at `make_directories`.
         :return: True if request executed with code 200 or 201 and False otherwise.
 
         """
         directory_urn = Urn(remote_path, directory=True)
-        if not self.check(directory_urn.parent()):
-            if recursive == True:
-                self.mkdir(directory_urn.parent(), recursive=True)
-            else:
-                raise RemoteParentNotFound(directory_urn.path())
+        if self._cache_key(directory_urn) in self.directories:
+            return True
+        if recursive == True:
+            return self._make_directories(directory_urn)
+        if not self.webdav.optimistic and not self._parent_exists(directory_urn):
+            raise RemoteParentNotFound(directory_urn.path())
+
+        return self._make_directory(directory_urn)
 
+    @wrap_connection_error
+    def make_directories(self, remote_paths):
+        """Makes directories with missing parents on WebDAV server, for example before uploading a batch of files.
+        The directories are made top-down by one `MKCOL` request each, the directory which already exists is reported
+        by 405 status code. In case the parent of directory is missing the unknown parents are made first.
+        Made and verified directories are remembered for the lifetime of the client, so they are not requested again
+        by following calls and uploads.
+
+        :param remote_paths: the paths to directories.
+        """
+        urns = {}
+        for remote_path in remote_paths:
+            urn = Urn(remote_path, directory=True)
+            urns[self._cache_key(urn)] = urn
+        for key in sorted(urns, key=lambda key: (key.count(Urn.separate), key)):
+            if key not in self.directories:
+                self._make_directories(urns[key])
+
+    def _make_directories(self, urn):
+        """Makes directory with missing parents. The directories which are not known to exist are made top-down by one
+        request each. In case the server reports that the parent known to exist is missing, it is forgotten and the
+        missing directories are made again from the nearest known one.
+
+        :param urn: the URN of directory.
+        :return: True if request executed with code 200 or 201 and False otherwise.
+        """
+        while True:
+            missing = []
+            directory = urn
+            while directory.path() != Urn.separate and self._cache_key(directory) not in self.directories:
+                missing.append(directory)
+                directory = Urn(directory.parent(), directory=True)
+            if not missing:
+                return True
+            try:
+                for parent in reversed(missing[1:]):
+                    try:
+                        self._make_directory(parent)
+                    except ResponseErrorCode:
+                        # the existing directory may be forbidden to make, for example above the home directory of user
+                        if not self.check(parent.path()):
+                            raise
+                        self.directories.add(self._cache_key(parent))
+                return self._make_directory(urn)
+            except RemoteParentNotFound:
+                # only the top directory is retried, its known parent is forgotten, so the next attempt starts higher
+                if self._cache_key(Urn(missing[-1].parent(), directory=True)) in self.directories or \
+                        missing[-1].parent() == Urn.separate:
+                    raise
+
+    def _make_directory(self, urn):
+        """Sends `MKCOL` request and remembers the directory when it is made or it already exists.
+
+        :param urn: the URN of directory.
+        :return: True if request executed with code 200 or 201 or the directory already exists and False otherwise.
+        """
         try:
-            print(f"Making Directory {remote_path}")
-            response = self.execute_request(action='mkdir', path=directory_urn.quote())
-            print(f"Made Directory {remote_path}")
+            response = self.execute_request(action='mkdir', path=urn.quote())
         except MethodNotSupported:
             # Yandex WebDAV returns 405 status code when directory already exists
+            self.directories.add(self._cache_key(urn))
             return True
-        return response.status_code in (200, 201)
+        except ResponseErrorCode as error:
+            # the missing parent is reported by 409 status code, it may be removed by another client
+            if error.code != 409:
+                raise
+            self._forget_parent(urn)
+            raise RemoteParentNotFound(urn.path())
+        self._invalidate(urn)
+        if response.status_code not in (200, 201):
+            return False
+        self.directories.add(self._cache_key(urn))
+        return True
 
     @wrap_connection_error
-    def download_iter(self, remote_path):
+    def download_iter(self, remote_path, checksums=None):
         """Downloads file from WebDAV and return content in generator
 
         :param remote_path: path to file on WebDAV server.
+        :param checksums: (optional) the instance of `webdav3.checksum.Checksums` which digests are computed over
+                the chunks while they are iterated. The checksums reported by the server in `OC-Checksum` header are
+                compared at the end of content and ChecksumMismatch is raised in case they differ.
         """
 
         urn = Urn(remote_path)
-        if self.is_dir(urn.path()):
-            raise OptionNotValid(name="remote_path", value=remote_path)
+        if not self.webdav.optimistic:
+            if self.is_dir(urn.path()):
+                raise OptionNotValid(name="remote_path", value=remote_path)
 
-        if not self.check(urn.path()):
-            raise RemoteResourceNotFound(urn.path())
+            if not self.check(urn.path()):
+                raise RemoteResourceNotFound(urn.path())
 
-        response = self.execute_request(action='download', path=urn.quote())
-        return response.iter_content(chunk_size=self.chunk_size)
+        if self.content_cache.enabled:
+            chunks, _, response = self._open_content(urn)
+        else:
+            response = self._execute_operation(action='download', urn=urn)
+            chunks = response.iter_content(chunk_size=self.chunk_size)
+        if checksums is not None:
+            return iter_checksums(chunks, checksums, urn.path(), response.headers.get('oc-checksum'))
+        return chunks
 
     @wrap_connection_error
     def download_from(self, buff, remote_path, progress=None, progress_args=()):
@@ -369,27 +1160,113 @@ class Client(object):
                 object or a Client instance in order to edit the message with the updated progress status.
         """
         urn = Urn(remote_path)
-        if self.is_dir(urn.path()):
-            raise OptionNotValid(name="remote_path", value=remote_path)
+        if not self.webdav.optimistic:
+            if self.is_dir(urn.path()):
+                raise OptionNotValid(name="remote_path", value=remote_path)
 
-        if not self.check(urn.path()):
-            raise RemoteResourceNotFound(urn.path())
+            if not self.check(urn.path()):
+                raise RemoteResourceNotFound(urn.path())
 
-        response = self.execute_request(action='download', path=urn.quote())
-        clen_str = response.headers.get('content-length')
-        total = int(clen_str) if clen_str is not None else None
+        if self.content_cache.enabled:
+            chunks, total, _ = self._open_content(urn)
+        else:
+            response = self._execute_operation(action='download', urn=urn)
+            chunks = response.iter_content(chunk_size=self.chunk_size)
+            clen_str = response.headers.get('content-length')
+            total = int(clen_str) if clen_str is not None else None
         current = 0
 
         if callable(progress):
             progress(current, total, *progress_args)  # zero call
 
-        for chunk in response.iter_content(chunk_size=self.chunk_size):
+        for chunk in chunks:
             buff.write(chunk)
-            current += self.chunk_size
+            current += len(chunk)
             if callable(progress):
                 progress(current, total, *progress_args)
 
-    def download(self, remote_path, local_path, progress=None, progress_args=()):
+    @wrap_connection_error
+    def download_into(self, remote_path, buffer=None, progress=None, progress_args=()):
+        """Downloads file from WebDAV directly into the buffer without intermediate copies of received chunks.
+        The content is requested without compression and read by `readinto` of the response stream.
+
+        :param remote_path: path to file on WebDAV server.
+        :param buffer: (optional) writable buffer object like bytearray, memoryview, mmap or numpy array which should
+                fit the whole file. By default the bytearray of size from 'content-length' header is allocated.
+        :param progress: Pass a callback function to view the file transmission progress.
+                The function must take *(current, total)* as positional arguments (look at Other Parameters below for a
+                detailed description) and will be called back each time a new file chunk has been successfully
+                transmitted.
+                `total` will be None if missing the HTTP header 'content-length' in the response from the remote.
+                Example def progress_update(current, total, *args) ...
+        :param progress_args: A tuple with extra custom arguments for the progress callback function.
+                You can pass anything you need to be available in the progress callback scope; for example, a Message
+                object or a Client instance in order to edit the message with the updated progress status.
+        :return: the memoryview of the part of buffer filled by content of file.
+        """
+        urn = Urn(remote_path)
+        if not self.webdav.optimistic:
+            if self.is_dir(urn.path()):
+                raise OptionNotValid(name="remote_path", value=remote_path)
+
+            if not self.check(urn.path()):
+                raise RemoteResourceNotFound(urn.path())
+
+        response = self._execute_operation(action='download', urn=urn, headers_ext=["Accept-Encoding: identity"])
+        with response:
+            clen_str = response.headers.get('content-length')
+            encoded = response.headers.get('content-encoding', 'identity').lower() != 'identity'
+            total = int(clen_str) if clen_str is not None and not encoded else None
+            current = 0
+
+            if callable(progress):
+                progress(current, total, *progress_args)  # zero call
+
+            if buffer is None and total is None:
+                # The size is unknown, so there is nothing to preallocate
+                buffer = bytearray()
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    buffer += chunk
+                    current += len(chunk)
+                    if callable(progress):
+                        progress(current, total, *progress_args)
+                return memoryview(buffer)
+
+            view = memoryview(bytearray(total) if buffer is None else buffer).cast('B')
+            if total is not None and total > len(view):
+                raise OptionNotValid(name="buffer", value=len(view))
+
+            if encoded:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if current + len(chunk) > len(view):
+                        raise OptionNotValid(name="buffer", value=len(view))
+                    view[current:current + len(chunk)] = chunk
+                    current += len(chunk)
+                    if callable(progress):
+                        progress(current, total, *progress_args)
+                return view[:current]
+
+            # http.client response reads straight from socket into the buffer, urllib3 copies in its readinto
+            stream = getattr(response.raw, '_fp', None)
+            if not hasattr(stream, 'readinto'):
+                stream = response.raw
+            while current < len(view):
+                size = stream.readinto(view[current:current + self.chunk_size])
+                if not size:
+                    break
+                current += size
+                if callable(progress):
+                    progress(current, total, *progress_args)
+            if current == len(view) and total is None and stream.read(1):
+                raise OptionNotValid(name="buffer", value=len(view))
+            if total is not None and current < total:
+                raise ConnectionException(http.client.IncompleteRead(view[:current].tobytes(), total - current))
+            if stream is not response.raw and current == total:
+                # The body is read completely bypassing urllib3, so the connection can be returned to the pool
+                response.raw.release_conn()
+            return view[:current]
+
+    def download(self, remote_path, local_path, progress=None, progress_args=(), resume=False):
         """Downloads remote resource from WebDAV and save it in local path.
         More information you can find by link http://webdav.org/specs/rfc4918.html#rfc.section.9.4
 
@@ -402,16 +1279,19 @@ class Client(object):
         :param progress_args: A tuple with extra custom arguments for the progress callback function.
                 You can pass anything you need to be available in the progress callback scope; for example, a Message
                 object or a Client instance in order to edit the message with the updated progress status.
+        :param resume: (optional) True to continue interrupted downloading as `download_directory` and `download_file`
+                do. Defaults is False.
         """
         urn = Urn(remote_path)
         if self.is_dir(urn.path()):
             self.download_directory(local_path=local_path, remote_path=remote_path, progress=progress,
-                                    progress_args=progress_args)
+                                    progress_args=progress_args, resume=resume)
         else:
             self.download_file(local_path=local_path, remote_path=remote_path, progress=progress,
-                               progress_args=progress_args)
+                               progress_args=progress_args, resume=resume)
 
-    def download_directory(self, remote_path, local_path, progress=None, progress_args=()):
+    def download_directory(self, remote_path, local_path, progress=None, progress_args=(), resume=False,
+                           max_workers=None, conditional=False):
         """Downloads directory and downloads all nested files and directories from remote WebDAV to local.
         If there is something on local path it deletes directories and files then creates new.
 
@@ -424,26 +1304,117 @@ class Client(object):
         :param progress_args: A tuple with extra custom arguments for the progress callback function.
                 You can pass anything you need to be available in the progress callback scope; for example, a Message
                 object or a Client instance in order to edit the message with the updated progress status.
+        :param resume: (optional) True to continue interrupted downloading. The existing local directory is kept,
+                partially downloaded files are resumed as `download_file` does and files which have the same size as
+                remote ones and no state of downloading are skipped. Defaults is False.
+        :param max_workers: (optional) maximum amount of files downloaded in parallel. When it is set the directories
+                are listed by `walk`, each local directory is created before its files are downloaded, the progress
+                is aggregated over all files and errors of files are collected and raised as `TransferErrors` after
+                all other files are downloaded. Defaults is None, the files are downloaded one by one.
+        :param conditional: (optional) True to skip files which are the same as remote ones like `download_file`
+                does. The existing local directory is kept and files which ETags in the listing are the same as
+                recorded ones are skipped without requests. Defaults is False.
         """
         urn = Urn(remote_path, directory=True)
         if not self.is_dir(urn.path()):
             raise OptionNotValid(name="remote_path", value=remote_path)
 
-        if os.path.exists(local_path):
+        if os.path.exists(local_path) and not resume and not conditional:
             shutil.rmtree(local_path)
 
-        os.makedirs(local_path)
+        if not os.path.isdir(local_path):
+            os.makedirs(local_path)
+
+        with self.etag_index.deferred():
+            if max_workers:
+                self._download_directory_parallel(urn, local_path, int(max_workers), progress, progress_args, resume,
+                                                  conditional)
+                return
 
-        for resource_name in self.list(urn.path()):
-            if urn.path().endswith(resource_name):
-                continue
-            _remote_path = "{parent}{name}".format(parent=urn.path(), name=resource_name)
-            _local_path = os.path.join(local_path, resource_name)
-            self.download(local_path=_local_path, remote_path=_remote_path, progress=progress,
-                          progress_args=progress_args)
+            for info in self.list(urn.path(), get_info=True, properties=['size', 'etag']):
+                resource_name = Urn(info['path'], info['isdir']).filename()
+                if urn.path().endswith(resource_name):
+                    continue
+                _remote_path = "{parent}{name}".format(parent=urn.path(), name=resource_name)
+                _local_path = os.path.join(local_path, resource_name)
+                if info['isdir']:
+                    self.download_directory(local_path=_local_path, remote_path=_remote_path, progress=progress,
+                                            progress_args=progress_args, resume=resume, conditional=conditional)
+                elif not self._is_up_to_date(info, _remote_path, _local_path, resume, conditional):
+                    self.download_file(local_path=_local_path, remote_path=_remote_path, progress=progress,
+                                       progress_args=progress_args, resume=resume, conditional=conditional)
+
+    def _download_directory_parallel(self, urn, local_path, max_workers, progress, progress_args, resume,
+                                     conditional):
+        aggregated = AggregatedProgress(progress, progress_args)
+        futures = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for directory_path, _, files in self.walk(urn.path(), max_workers=max_workers, get_info=True,
+                                                      properties=['size', 'etag']):
+                local_directory = os.path.join(local_path, *directory_path[len(urn.path()):].split('/'))
+                if not os.path.isdir(local_directory):
+                    os.makedirs(local_directory)
+                for info in files:
+                    resource_name = Urn(info['path']).filename()
+                    _remote_path = "{parent}{name}".format(parent=directory_path, name=resource_name)
+                    _local_path = os.path.join(local_directory, resource_name)
+                    if self._is_up_to_date(info, _remote_path, _local_path, resume, conditional):
+                        continue
+                    size = int(info['size']) if info['size'] else None
+                    file_progress = aggregated.add(_remote_path, size)
+                    future = executor.submit(self.download_file, remote_path=_remote_path, local_path=_local_path,
+                                             progress=file_progress, resume=resume, conditional=conditional)
+                    futures[future] = (_remote_path, size)
+            self._collect_errors(futures, aggregated)
+
+    def _is_up_to_date(self, info, remote_path, local_path, resume, conditional):
+        """Checks the local file should not be downloaded again.
+
+        :param info: the information about remote file received by listing of directory.
+        :param remote_path: the path to remote file.
+        :param local_path: the path to local file.
+        :param resume: True when completely downloaded files should be skipped.
+        :param conditional: True when files with the same ETag as recorded in the index should be skipped.
+        :return: True in case the local file is up to date.
+        """
+        if conditional and info.get('etag') and \
+                self.etag_index.get(local_path, self.get_url(Urn(remote_path).quote())) == info['etag']:
+            return True
+        return resume and self._is_downloaded(local_path, info['size'])
+
+    @staticmethod
+    def _collect_errors(futures, aggregated):
+        """Waits for parallel transfers of files and raises errors of all failed transfers.
+
+        :param futures: the dictionary of futures of transfers and tuples of path and size of transferred files.
+        :param aggregated: the aggregated progress of transfers.
+        """
+        errors = []
+        for future in as_completed(futures):
+            path, size = futures[future]
+            try:
+                future.result()
+                aggregated.finish(path, size)
+            except Exception as error:
+                errors.append((path, error))
+        if errors:
+            raise TransferErrors(errors)
+
+    @staticmethod
+    def _is_downloaded(local_path, size):
+        """Checks the local file was completely downloaded before.
+
+        :param local_path: the path to local file.
+        :param size: the size of remote file as it is received from WebDAV server.
+        :return: True in case the local file has the same size and there is no state of interrupted downloading.
+        """
+        if not os.path.isfile(local_path) or os.path.exists(local_path + Client.resume_suffix):
+            return False
+        return size is not None and str(os.path.getsize(local_path)) == size
 
     @wrap_connection_error
-    def download_file(self, remote_path, local_path, progress=None, progress_args=()):
+    def download_file(self, remote_path, local_path, progress=None, progress_args=(), connections=1, resume=False,
+                      conditional=False, checksums=None, pipeline=None, fsync=None):
         """Downloads file from WebDAV server and save it locally.
         More information you can find by link http://webdav.org/specs/rfc4918.html#rfc.section.9.4
 
@@ -458,31 +1429,306 @@ class Client(object):
         :param progress_args: A tuple with extra custom arguments for the progress callback function.
                 You can pass anything you need to be available in the progress callback scope; for example, a Message
                 object or a Client instance in order to edit the message with the updated progress status.
+        :param connections: (optional) amount of parallel connections. When it is more than 1 the file is downloaded
+                by segments using `Range` requests which are written at their offsets, the progress callback is called
+                from the downloading threads then. In case the server ignores `Range` or the file is changed during
+                downloading it is downloaded by single request. Defaults is 1.
+        :param resume: (optional) True to continue interrupted downloading. The etag of file and amount of written
+                bytes are kept in the file with `.webdav-resume` suffix next to the local file while it is downloading,
+                when the file exists only the missing tail is requested. In case the remote file was changed it is
+                downloaded from the beginning. Defaults is False.
+        :param conditional: (optional) True to skip downloading when the local file is the same as remote one. ETags
+                of downloaded files are recorded in `.webdav-index.json` file of local directory and following
+                downloads send `If-None-Match`, the response 304 means the local file is up to date. Defaults is False.
+        :param checksums: (optional) the instance of `webdav3.checksum.Checksums` which digests are computed over
+                the content while it is written, so the file is not read again. The checksums reported by the server
+                in `OC-Checksum` header are compared and ChecksumMismatch is raised in case they differ. The file is
+                downloaded by single connection then, when resuming the existing part of file is hashed first.
+        :param pipeline: (optional) maximum amount of received chunks queued for background thread which writes them
+                to the local file, so writing to slow disks overlaps with receiving. Defaults to
+                `webdav_pipeline_depth`.
+        :param fsync: (optional) True to flush the local file to disk by `fsync` before it is reported as downloaded or
+                amount of bytes after which the file is flushed while it is written. Defaults to `webdav_fsync`.
+        :return: True in case the file is downloaded and False in case the local file is up to date.
         """
         urn = Urn(remote_path)
-        if self.is_dir(urn.path()):
+        if not self.webdav.optimistic and self.is_dir(urn.path()):
             raise OptionNotValid(name="remote_path", value=remote_path)
 
         if os.path.isdir(local_path):
             raise OptionNotValid(name="local_path", value=local_path)
 
-        if not self.check(urn.path()):
+        if not self.webdav.optimistic and not self.check(urn.path()):
             raise RemoteResourceNotFound(urn.path())
 
-        with open(local_path, 'wb') as local_file:
-            response = self.execute_request('download', urn.quote())
-            clen_str=response.headers.get('content-length')
-            total = int(clen_str) if clen_str is not None else None
-            current = 0
+        state_path = local_path + Client.resume_suffix
+        state = self._read_resume_state(state_path) if resume and os.path.isfile(local_path) else None
+        remote = self.get_url(urn.quote())
+        etag = self.etag_index.get(local_path, remote) if conditional and state is None else None
+        if checksums is not None:
+            checksums.reset()
+        cached = state is None and etag is None and self.content_cache.enabled
+        if state is None and etag is None and int(connections) > 1 and checksums is None and not cached:
+            etag = self._download_segments(urn, local_path, int(connections), progress, progress_args)
+            if etag is not None:
+                if conditional:
+                    self.etag_index.put(local_path, remote, etag)
+                return True
+
+        offset, headers = 0, []
+        if cached:
+            chunks, size, response = self._open_content(urn)
+        else:
+            if state is not None:
+                offset = min(int(state.get('written', 0)), os.path.getsize(local_path))
+                headers = ["Range: bytes={offset}-".format(offset=offset), "Accept-Encoding: identity"]
+                if state.get('etag'):
+                    headers.append("If-Range: {etag}".format(etag=state['etag']))
+            elif etag:
+                headers = ["If-None-Match: {etag}".format(etag=etag)]
+            try:
+                response = self._execute_operation(action='download', urn=urn, headers_ext=headers)
+            except ResponseErrorCode as error:
+                if state is None or error.code != 416:
+                    raise
+                response = self._execute_operation(action='download', urn=urn)
+            if response.status_code == 304:
+                response.close()
+                return False
+            if response.status_code == 206 and self._range_start(response) != offset:
+                # the part does not continue the local file, so the whole file is downloaded again
+                response.close()
+                response = self._execute_operation(action='download', urn=urn)
+            if response.status_code != 206:
+                offset = 0
+            chunks = response.iter_content(chunk_size=self.chunk_size)
+            clen_str = response.headers.get('content-length')
+            size = int(clen_str) if clen_str is not None else None
+
+        validator = response.headers.get('etag') or response.headers.get('last-modified')
+        if resume and validator:
+            self._write_resume_state(state_path, validator, offset)
+
+        with open(local_path, 'r+b' if offset else 'wb') as local_file:
+            if checksums is not None and offset:
+                self._update_checksums(local_file, offset, checksums)
+            local_file.seek(offset)
+            local_file.truncate()
+            total = offset + size if size is not None else None
+            current = offset
 
             if callable(progress):
                 progress(current, total, *progress_args)  # zero call
 
-            for block in response.iter_content(chunk_size=self.chunk_size):
-                local_file.write(block)
-                current += self.chunk_size
-                if callable(progress):
-                    progress(current, total, *progress_args)
+            checkpoint = None
+            if resume and validator:
+                checkpoint = functools.partial(self._write_resume_state, state_path, validator)
+            writer = DiskWriter(local_file, depth=self.webdav.pipeline_depth if pipeline is None else pipeline,
+                                fsync=self.webdav.fsync if fsync is None else fsync, checkpoint=checkpoint)
+            try:
+                for block in chunks:
+                    writer.write(block)
+                    if checksums is not None:
+                        checksums.update(block)
+                    current += len(block)
+                    if callable(progress):
+                        progress(current, total, *progress_args)
+                writer.close()
+            except BaseException:
+                written = writer.abort()
+                if resume and validator:
+                    self._write_resume_state(state_path, validator, written)
+                raise
+        if resume and os.path.exists(state_path):
+            os.remove(state_path)
+        if conditional:
+            self.etag_index.put(local_path, remote, response.headers.get('etag'))
+        if checksums is not None and checksums.verify_remote:
+            checksums.verify(response.headers.get('oc-checksum'), urn.path())
+        return True
+
+    def _open_content(self, urn):
+        """Requests content of remote file through the content cache. The cached content is validated by
+        `If-None-Match` request and it is read from the cache when the server responds 304, otherwise the received
+        content is written to the cache while it is iterated.
+
+        :param urn: the URN of remote file.
+        :return: the tuple of iterator over chunks of content, the size of content or None if it is unknown and
+                 the response of server.
+        """
+        cache = self.content_cache
+        # the full path includes root, so clients with different roots sharing the cache do not mix up content
+        path = self.get_full_path(urn)
+        etag = cache.lookup(self.webdav.hostname, path)
+        headers = ["If-None-Match: {etag}".format(etag=etag)] if etag else []
+        response = self._execute_operation(action='download', urn=urn, headers_ext=headers)
+        if response.status_code == 304:
+            response.close()
+            cached_file = cache.open(self.webdav.hostname, path, etag)
+            if cached_file is not None:
+                return self._iter_file(cached_file), os.fstat(cached_file.fileno()).st_size, response
+            response = self._execute_operation(action='download', urn=urn)
+
+        chunks = response.iter_content(chunk_size=self.chunk_size)
+        writer = cache.writer(self.webdav.hostname, path, response.headers.get('etag'))
+        if writer is not None:
+            chunks = writer.tee(chunks)
+        clen_str = response.headers.get('content-length')
+        return chunks, int(clen_str) if clen_str is not None else None, response
+
+    def _iter_file(self, local_file):
+        """Iterates over chunks of file and closes it at the end.
+
+        :param local_file: the binary file object.
+        :return: generator of chunks of file content.
+        """
+        with local_file:
+            for block in iter(lambda: local_file.read(self.chunk_size), b''):
+                yield block
+
+    def _update_checksums(self, local_file, size, checksums):
+        """Updates checksums by the beginning of local file which was downloaded before.
+
+        :param local_file: the local file opened for reading.
+        :param size: amount of bytes to read from the beginning of file.
+        :param checksums: the instance of `webdav3.checksum.Checksums`.
+        """
+        local_file.seek(0)
+        while size > 0:
+            block = local_file.read(min(self.chunk_size, size))
+            if not block:
+                break
+            checksums.update(block)
+            size -= len(block)
+
+    def _verify_upload(self, urn, response, checksums):
+        """Compares checksums of uploaded content with checksums reported by the server. They are taken from
+        `OC-Checksum` header of response or requested as `oc:checksums` property, servers without checksums are
+        not verified.
+
+        :param urn: the URN of uploaded file.
+        :param response: the response of upload request.
+        :param checksums: the instance of `webdav3.checksum.Checksums` or None.
+        """
+        if checksums is None or not checksums.verify_remote:
+            return
+        expected = response.headers.get('oc-checksum')
+        if not expected:
+            data = WebDavXmlUtils.create_get_property_request_content(Client.checksums_property)
+            try:
+                response = self.execute_request(action='get_property', path=urn.quote(), data=data)
+            except (ResponseErrorCode, MethodNotSupported, RemoteResourceNotFound):
+                return
+            expected = WebDavXmlUtils.parse_checksums_response(response.content)
+        checksums.verify(expected, urn.path())
+
+    @staticmethod
+    def _read_resume_state(state_path):
+        """Reads state of partially downloaded file.
+
+        :param state_path: the path to file of state.
+        :return: the dictionary with `etag` and `written` keys or None in case there is no valid state.
+        """
+        try:
+            with open(state_path, encoding='utf-8') as state_file:
+                state = json.load(state_file)
+            return state if isinstance(state, dict) else None
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_resume_state(state_path, etag, written):
+        """Writes state of partially downloaded file.
+
+        :param state_path: the path to file of state.
+        :param etag: the etag of remote file or date of its modification.
+        :param written: amount of bytes written to local file.
+        """
+        # the state is replaced at once, so the process killed while writing it does not leave broken state,
+        # the name of temporary file keeps the suffix, so it is skipped by uploading of directories
+        temp_path = os.path.join(os.path.dirname(state_path), '.' + os.path.basename(state_path))
+        with open(temp_path, 'w', encoding='utf-8') as state_file:
+            json.dump({'etag': etag, 'written': written}, state_file)
+        os.replace(temp_path, state_path)
+
+    @staticmethod
+    def _range_start(response):
+        """Returns the position of the first byte of partial content from `Content-Range` header.
+
+        :param response: the response with status 206.
+        :return: the position or None in case the header is missing or invalid.
+        """
+        try:
+            return parse_content_range(response.headers.get('content-range', ''))[0]
+        except OptionNotValid:
+            return None
+
+    def _download_segments(self, urn, local_path, connections, progress=None, progress_args=()):
+        """Downloads file by segments in parallel connections. The first request of small range reveals the size
+        and the validator of file, the rest of file is split to segments which are requested with `If-Range`.
+
+        :param urn: the URN of remote file.
+        :param local_path: the path to save file locally.
+        :param connections: amount of parallel connections.
+        :param progress: (optional) the progress callback as for `download_file`.
+        :param progress_args: (optional) extra arguments of the progress callback.
+        :return: the ETag of downloaded file or empty string if it is unknown, None in case the server does not support
+                 ranges or the file was changed, so it should be downloaded by single request.
+        """
+        try:
+            response = self._execute_operation(action='download', urn=urn, headers_ext=[
+                "Range: bytes=0-{end}".format(end=self.chunk_size - 1), "Accept-Encoding: identity"])
+        except ResponseErrorCode as error:
+            if error.code == 416:
+                return None
+            raise
+
+        content_range = response.headers.get('content-range', '')
+        total = content_range.rsplit('/', 1)[-1]
+        if response.status_code != 206 or not total.isdigit():
+            response.close()
+            return None
+        total = int(total)
+        validator = response.headers.get('etag') or response.headers.get('last-modified')
+
+        lock = threading.Lock()
+        state = {'current': 0}
+        if callable(progress):
+            progress(0, total, *progress_args)  # zero call
+
+        def write(segment_response, offset):
+            with segment_response, open(local_path, 'r+b') as local_file:
+                local_file.seek(offset)
+                for block in segment_response.iter_content(chunk_size=self.chunk_size):
+                    local_file.write(block)
+                    with lock:
+                        state['current'] += len(block)
+                        if callable(progress):
+                            progress(state['current'], total, *progress_args)
+
+        def download_segment(start, end):
+            headers = ["Range: bytes={start}-{end}".format(start=start, end=end), "Accept-Encoding: identity"]
+            if validator:
+                headers.append("If-Range: {validator}".format(validator=validator))
+            segment_response = self._execute_operation(action='download', urn=urn, headers_ext=headers)
+            if segment_response.status_code != 206:
+                segment_response.close()
+                return False
+            write(segment_response, start)
+            return True
+
+        with open(local_path, 'wb') as local_file:
+            local_file.truncate(total)
+
+        start = self.chunk_size
+        segment_size = max(-(-(total - start) // connections), self.chunk_size)
+        segments = [(offset, min(offset + segment_size, total) - 1) for offset in range(start, total, segment_size)]
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            results = [executor.submit(download_segment, *segment) for segment in segments]
+            write(response, 0)
+            if not all(result.result() for result in results):
+                return None
+            return response.headers.get('etag') or ''
 
     def download_sync(self, remote_path, local_path, callback=None, progress=None, progress_args=()):
         """Downloads remote resources from WebDAV server synchronously.
@@ -521,41 +1767,63 @@ class Client(object):
         threading.Thread(target=target).start()
 
     @wrap_connection_error
-    def upload_iter(self, read_callback, remote_path):
+    def upload_iter(self, read_callback, remote_path, length=None):
         """Uploads file from buffer to remote path on WebDAV server.
         More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PUT
 
         :param callable read_callback: the read callback.
         :param str remote_path: the path to save file remotely on WebDAV server.
+        :param int length: (optional) the length of content in bytes. When it is declared the content is sent with
+                `Content-Length` header instead of chunked transfer encoding.
         """
         urn = Urn(remote_path)
         if urn.is_dir():
             raise OptionNotValid(name="remote_path", value=remote_path)
 
-        if not self.check(urn.parent()):
+        if not self.webdav.optimistic and not self._parent_exists(urn):
             raise RemoteParentNotFound(urn.path())
 
         if not callable(read_callback):
             raise OptionNotValid(name='read_callback', value=read_callback)
 
-        self.execute_request(action='upload', path=urn.quote(), data=read_callback)
+        data = read_callback
+        if length is not None:
+            data = UploadBody(read_callback, length) if length else b''
+        self._execute_operation(action='upload', urn=urn, data=data)
+        self._invalidate(urn)
 
     @wrap_connection_error
-    def upload_to(self, buff, remote_path):
+    def upload_to(self, buff, remote_path, checksums=None, length=None):
         """Uploads file from buffer to remote path on WebDAV server.
         More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PUT
 
         :param buff: the buffer with content for file.
         :param remote_path: the path to save file remotely on WebDAV server.
+        :param checksums: (optional) the instance of `webdav3.checksum.Checksums` which digests are computed over
+                the content while it is sent. The checksums reported by the server are compared after uploading and
+                ChecksumMismatch is raised in case they differ.
+        :param length: (optional) the length of content of file-like buffer or iterable of chunks in bytes. When it is
+                declared the content is sent with `Content-Length` header instead of chunked transfer encoding, it is
+                required for streams which length can not be determined.
         """
         urn = Urn(remote_path)
         if urn.is_dir():
             raise OptionNotValid(name="remote_path", value=remote_path)
 
-        if not self.check(urn.parent()):
+        if not self.webdav.optimistic and not self._parent_exists(urn):
             raise RemoteParentNotFound(urn.path())
 
-        self.execute_request(action='upload', path=urn.quote(), data=buff)
+        if checksums is not None:
+            checksums.reset()
+        if isinstance(buff, (str, bytes, bytearray)):
+            if checksums is not None:
+                checksums.update(buff.encode('utf-8') if isinstance(buff, str) else buff)
+        elif length is not None or (checksums is not None and hasattr(buff, 'read')):
+            length = requests.utils.super_len(buff) if length is None else length
+            buff = UploadBody(buff, length, self.chunk_size, checksums=checksums) if length else b''
+        response = self._execute_operation(action='upload', urn=urn, data=buff)
+        self._invalidate(urn)
+        self._verify_upload(urn, response, checksums)
 
     def upload(self, remote_path, local_path, progress=None, progress_args=()):
         """Uploads resource to remote path on WebDAV server.
@@ -578,7 +1846,7 @@ class Client(object):
         else:
             self.upload_file(local_path=local_path, remote_path=remote_path, progress=progress, progress_args=progress_args)
 
-    def upload_directory(self, remote_path, local_path, progress=None, progress_args=()):
+    def upload_directory(self, remote_path, local_path, progress=None, progress_args=(), max_workers=None):
         """Uploads directory to remote path on WebDAV server.
         In case directory is exist on remote server it will delete it and then upload directory with nested files and
         directories.
@@ -592,6 +1860,10 @@ class Client(object):
         :param progress_args: A tuple with extra custom arguments for the progress callback function.
                 You can pass anything you need to be available in the progress callback scope; for example, a Message
                 object or a Client instance in order to edit the message with the updated progress status.
+        :param max_workers: (optional) maximum amount of files uploaded in parallel. When it is set each remote
+                directory is created before its files are uploaded, the progress is aggregated over all files and
+                errors of files are collected and raised as `TransferErrors` after all other files are uploaded.
+                Defaults is None, the files are uploaded one by one.
         """
         urn = Urn(remote_path, directory=True)
         if not urn.is_dir():
@@ -608,15 +1880,45 @@ class Client(object):
 
         self.mkdir(remote_path)
 
+        if max_workers:
+            self._upload_directory_parallel(urn, local_path, int(max_workers), progress, progress_args)
+            return
+
         for resource_name in listdir(local_path):
             _remote_path = "{parent}{name}".format(parent=urn.path(), name=resource_name).replace('\\', '')
             _local_path = os.path.join(local_path, resource_name)
             self.upload(local_path=_local_path, remote_path=_remote_path, progress=progress,
                         progress_args=progress_args)
 
+    def _upload_directory_parallel(self, urn, local_path, max_workers, progress, progress_args):
+        aggregated = AggregatedProgress(progress, progress_args)
+        futures = {}
+        directories = []
+        for local_directory, _, files in os.walk(local_path):
+            relative_path = os.path.relpath(local_directory, local_path)
+            remote_directory = urn.path()
+            if relative_path != os.curdir:
+                remote_directory = Urn(urn.path() + relative_path.replace(os.sep, Urn.separate),
+                                       directory=True).path()
+            directories.append((local_directory, remote_directory, files))
+        self.make_directories(remote_directory for (_, remote_directory, _) in directories)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for local_directory, remote_directory, files in directories:
+                for resource_name in files:
+                    _remote_path = "{parent}{name}".format(parent=remote_directory, name=resource_name)
+                    _local_path = os.path.join(local_directory, resource_name)
+                    size = os.path.getsize(_local_path)
+                    file_progress = aggregated.add(_remote_path, size)
+                    future = executor.submit(self.upload_file, remote_path=_remote_path, local_path=_local_path,
+                                             progress=file_progress)
+                    futures[future] = (_remote_path, size)
+            self._collect_errors(futures, aggregated)
+
     @wrap_connection_error
-    def upload_file(self, remote_path, local_path, progress=None, progress_args=(), force=False):
-        """Uploads file to remote path on WebDAV server. File should be 2Gb or less.
+    def upload_file(self, remote_path, local_path, progress=None, progress_args=(), force=False, checksums=None,
+                    resume=False, pipeline=None):
+        """Uploads file to remote path on WebDAV server. File should be 2Gb or less, use `upload_chunked` for larger
+        files.
         More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PUT
 
         :param remote_path: the path to uploading file on WebDAV server.
@@ -629,6 +1931,19 @@ class Client(object):
                 You can pass anything you need to be available in the progress callback scope; for example, a Message
                 object or a Client instance in order to edit the message with the updated progress status.
         :param force:  if the directory isn't there it will creat the directory.
+        :param checksums: (optional) the instance of `webdav3.checksum.Checksums` which digests are computed over
+                the content while it is sent, so the file is not read again. The checksums reported by the server are
+                compared after uploading and ChecksumMismatch is raised in case they differ.
+        :param resume: (optional) True to continue interrupted uploading. The journal of uploading is kept in the file
+                with `.webdav-upload` suffix next to the local file until the file is uploaded. When the upload is
+                resumed the size of content already stored on the server is requested, its last block is compared
+                with the local file by `Range` request and only the remainder is sent by `PATCH` request with
+                `X-Update-Range` header of SabreDAV or by `PUT` request with `Content-Range` header. In case the server
+                supports neither of them or it keeps other content the whole file is uploaded again.
+                Defaults is False.
+        :param pipeline: (optional) amount of reusable buffers which the file is read into by background thread while
+                the previous chunks are sent, so reading of slow disks overlaps with sending. Defaults to
+                `webdav_pipeline_depth`, when it is 0 the file is mapped to memory and sent by the calling thread.
         """
         if not os.path.exists(local_path):
             raise LocalResourceNotFound(local_path)
@@ -640,31 +1955,324 @@ class Client(object):
         if os.path.isdir(local_path):
             raise OptionNotValid(name="local_path", value=local_path)
 
-        if not self.check(urn.parent()):
+        if not self.webdav.optimistic and not self._parent_exists(urn):
             if force == True:
                 self.mkdir(urn.parent(), recursive=True)
             else:
                 raise RemoteParentNotFound(urn.path())
 
+        journal_path = local_path + Client.upload_journal_suffix
+        if resume:
+            journal = self._read_upload_journal(journal_path, urn, local_path)
+            if journal is not None and 'transfer' not in journal and \
+                    self._resume_upload(urn, local_path, journal, progress, progress_args, checksums, pipeline):
+                os.remove(journal_path)
+                return
+            self._write_upload_journal(journal_path, urn, local_path)
+
         with open(local_path, "rb") as local_file:
             total = os.path.getsize(local_path)
+            body = UploadBody(local_file, total, self.chunk_size, progress, progress_args, checksums,
+                              pipeline=self.webdav.pipeline_depth if pipeline is None else pipeline)
 
-            def read_in_chunks(file_object):
-                progress(0, total, *progress_args)
-                current = 0
+            def send():
+                if checksums is not None:
+                    checksums.reset()
+                # the empty body is sent as is, otherwise requests uses chunked transfer encoding for it
+                return self._execute_operation(action='upload', urn=urn, data=body if total else b'')
 
-                while current < total:
-                    data = file_object.read(self.chunk_size)
-                    progress(current, total, *progress_args)  # call to progress function
-                    current += len(data)
-                    if not data:
-                        break
-                    yield data
+            try:
+                response = send()
+            except RemoteParentNotFound:
+                # The parent is created on demand in optimistic mode instead of checking it in advance, otherwise
+                # the known parent is removed by another client
+                if force != True:
+                    raise
+                self.mkdir(urn.parent(), recursive=True)
+                response = send()
+        self._invalidate(urn)
+        if resume and os.path.exists(journal_path):
+            os.remove(journal_path)
+        self._verify_upload(urn, response, checksums)
+
+    def _read_upload_journal(self, journal_path, urn, local_path):
+        """Reads journal of interrupted uploading.
+
+        :param journal_path: the path to file of journal.
+        :param urn: the URN of remote file.
+        :param local_path: the path to local file.
+        :return: the dictionary of journal or None in case there is no journal or the local file was changed.
+        """
+        journal = self._read_resume_state(journal_path)
+        if journal is None or journal.get('remote') != self.get_url(urn.quote()):
+            return None
+        stat = os.stat(local_path)
+        if journal.get('size') != stat.st_size or journal.get('mtime') != stat.st_mtime_ns:
+            return None
+        return journal
+
+    def _write_upload_journal(self, journal_path, urn, local_path, **state):
+        """Writes journal of uploading, it identifies the remote file and the version of local file.
+
+        :param journal_path: the path to file of journal.
+        :param urn: the URN of remote file.
+        :param local_path: the path to local file.
+        :param state: the additional state of uploading.
+        """
+        stat = os.stat(local_path)
+        journal = dict(state, remote=self.get_url(urn.quote()), size=stat.st_size, mtime=stat.st_mtime_ns)
+        with open(journal_path, 'w', encoding='utf-8') as journal_file:
+            json.dump(journal, journal_file)
+
+    def _remote_size(self, urn):
+        """Requests size of remote file.
+
+        :param urn: the URN of remote file.
+        :return: the size in bytes or None in case the file does not exist.
+        """
+        self._invalidate(urn)
+        try:
+            info = self.info(urn.path(), properties=['size'])
+        except RemoteResourceNotFound:
+            return None
+        return int(info['size']) if info.get('size') else None
+
+    def _is_stored_prefix(self, urn, local_path, offset):
+        """Checks that the content stored on the server is the beginning of local file by comparing the last block
+        before offset, so the previous version of remote file which is left by the interrupted request is not resumed.
+
+        :param urn: the URN of remote file.
+        :param local_path: the path to local file.
+        :param offset: the size of remote file.
+        :return: True in case the remote file ends with the same block as the beginning of local file.
+        """
+        start = max(0, offset - self.chunk_size)
+        headers = ["Range: bytes={start}-{end}".format(start=start, end=offset - 1), "Accept-Encoding: identity"]
+        response = self._execute_operation(action='download', urn=urn, headers_ext=headers)
+        with response:
+            # the server which ignores Range would send the whole file, so it is not read
+            if response.status_code != 206 or self._range_start(response) != start:
+                return False
+            stored = response.content
+        with open(local_path, 'rb') as local_file:
+            local_file.seek(start)
+            return local_file.read(offset - start) == stored
+
+    def _resume_upload(self, urn, local_path, journal, progress=None, progress_args=(), checksums=None,
+                       pipeline=None):
+        """Sends the remainder of local file which is not stored on the server yet.
+
+        :param urn: the URN of remote file.
+        :param local_path: the path to local file.
+        :param journal: the journal of interrupted uploading.
+        :param progress: (optional) the progress callback function.
+        :param progress_args: (optional) a tuple with extra custom arguments for the progress callback function.
+        :param checksums: (optional) the instance of `webdav3.checksum.Checksums`.
+        :param pipeline: (optional) amount of buffers read ahead by background thread as for `upload_file`.
+        :return: True in case the file is uploaded and False in case it should be uploaded again.
+        """
+        total = journal['size']
+        offset = self._remote_size(urn)
+        if not offset or offset >= total or not self._is_stored_prefix(urn, local_path, offset):
+            return False
+
+        with open(local_path, 'rb') as local_file:
+            def remainder():
+                if checksums is not None:
+                    checksums.reset()
+                    self._update_checksums(local_file, offset, checksums)
+                local_file.seek(offset)
+                return UploadBody(local_file, total - offset, self.chunk_size, checksums=checksums,
+                                  pipeline=self.webdav.pipeline_depth if pipeline is None else pipeline)
 
             if callable(progress):
-                self.execute_request(action='upload', path=urn.quote(), data=read_in_chunks(local_file))
-            else:
-                self.execute_request(action='upload', path=urn.quote(), data=local_file)
+                progress(offset, total, *progress_args)
+            try:
+                headers = ["X-Update-Range: bytes={start}-{end}".format(start=offset, end=total - 1)]
+                response = self.execute_request(action='patch', path=urn.quote(), data=remainder(),
+                                                headers_ext=headers)
+            except (MethodNotSupported, ResponseErrorCode) as error:
+                if isinstance(error, ResponseErrorCode) and error.code not in (400, 415, 501):
+                    raise
+                try:
+                    headers = ["Content-Range: bytes {start}-{end}/{total}".format(start=offset, end=total - 1,
+                                                                                   total=total)]
+                    response = self.execute_request(action='upload', path=urn.quote(), data=remainder(),
+                                                    headers_ext=headers)
+                except (MethodNotSupported, ResponseErrorCode) as error:
+                    if isinstance(error, ResponseErrorCode) and error.code not in (400, 416, 501):
+                        raise
+                    return False
+                # servers which ignore Content-Range store the remainder only
+                if self._remote_size(urn) != total:
+                    return False
+        self._invalidate(urn)
+        if callable(progress):
+            progress(total, total, *progress_args)
+        self._verify_upload(urn, response, checksums)
+        return True
+
+    @wrap_connection_error
+    def upload_chunked(self, remote_path, local_path, chunk_size=None, max_workers=None, retries=3, progress=None,
+                       progress_args=(), resume=False):
+        """Uploads large file by chunks in parallel using chunking protocol of Nextcloud and ownCloud servers.
+        The chunks are uploaded to temporary directory created by `MKCOL` request in the collection of uploads and
+        the file is assembled by `MOVE` request of `.file` resource, failed chunks are uploaded again individually.
+        In case the collection of uploads is unknown or the server does not support chunking the file is uploaded by
+        single `PUT` request of `upload_file`.
+        More information you can find by link https://docs.nextcloud.com/server/latest/developer_manual/client_apis/WebDAV/chunking.html
+
+        :param remote_path: the path to uploading file on WebDAV server.
+        :param local_path: the path to local file for uploading.
+        :param chunk_size: (optional) the size of chunk in bytes. Defaults to `webdav_chunked_upload_size`.
+        :param max_workers: (optional) maximum amount of chunks uploaded in parallel. Defaults to
+                `webdav_pool_maxsize`.
+        :param retries: (optional) maximum amount of attempts to upload each chunk. Defaults is 3.
+        :param progress: Pass a callback function to view the file transmission progress.
+                The function must take *(current, total)* as positional arguments and will be called back each time a
+                chunk has been successfully uploaded. Example def progress_update(current, total, *args) ...
+        :param progress_args: A tuple with extra custom arguments for the progress callback function.
+        :param resume: (optional) True to continue interrupted uploading. The temporary directory of chunks is kept
+                when uploading fails and it is recorded in the journal of uploading in the file with `.webdav-upload`
+                suffix, only the chunks missing in the directory are uploaded then. Defaults is False.
+        """
+        if not os.path.exists(local_path):
+            raise LocalResourceNotFound(local_path)
+
+        urn = Urn(remote_path)
+        if urn.is_dir():
+            raise OptionNotValid(name="remote_path", value=remote_path)
+
+        if os.path.isdir(local_path):
+            raise OptionNotValid(name="local_path", value=local_path)
+
+        journal_path = local_path + Client.upload_journal_suffix
+        journal = self._read_upload_journal(journal_path, urn, local_path) if resume else None
+        if journal is not None and 'transfer' in journal:
+            chunk_size = journal.get('chunk_size')
+        chunk_size = int(chunk_size or self.webdav.chunked_upload_size)
+        if chunk_size <= 0:
+            raise OptionNotValid(name="chunk_size", value=chunk_size)
+
+        uploads_url = self._chunked_uploads_url()
+        total = os.path.getsize(local_path)
+        if uploads_url is None or total <= chunk_size:
+            return self.upload_file(remote_path=remote_path, local_path=local_path, progress=progress,
+                                    progress_args=progress_args, resume=resume)
+
+        if not self.webdav.optimistic and not self._parent_exists(urn):
+            raise RemoteParentNotFound(urn.path())
+
+        headers = ["Destination: {url}".format(url=self.get_url(urn.quote())),
+                   "OC-Total-Length: {total}".format(total=total)]
+        uploaded = None
+        if journal is not None and 'transfer' in journal:
+            transfer_url = journal['transfer']
+            uploaded = self._list_chunks(transfer_url)
+        if uploaded is None:
+            uploaded = {}
+            transfer_url = "{uploads}/webdav-{id}".format(uploads=uploads_url, id=uuid.uuid4().hex)
+            try:
+                self.execute_request(action='mkdir', path=transfer_url, headers_ext=headers, url=transfer_url)
+            except (MethodNotSupported, RemoteResourceNotFound, ResponseErrorCode) as error:
+                if isinstance(error, ResponseErrorCode) and error.code not in (400, 403, 501):
+                    raise
+                log.debug("Chunked upload is not supported, %s is uploaded by single request", urn.path())
+                return self.upload_file(remote_path=remote_path, local_path=local_path, progress=progress,
+                                        progress_args=progress_args, resume=resume)
+            if resume:
+                self._write_upload_journal(journal_path, urn, local_path, transfer=transfer_url,
+                                           chunk_size=chunk_size)
+
+        try:
+            aggregated = AggregatedProgress(progress, progress_args)
+            aggregated.total = total
+            futures = []
+            with ThreadPoolExecutor(max_workers=int(max_workers or self.webdav.pool_maxsize)) as executor:
+                for (number, offset) in enumerate(range(0, total, chunk_size), start=1):
+                    size = min(chunk_size, total - offset)
+                    if uploaded.get("{number:05d}".format(number=number)) == size:
+                        aggregated.update(number, size)
+                        continue
+                    futures.append(executor.submit(self._upload_chunk, local_path, offset, chunk_size, number,
+                                                   transfer_url, headers, int(retries), aggregated))
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+            file_url = "{transfer}/.file".format(transfer=transfer_url)
+            self.execute_request(action='move', path=file_url, headers_ext=headers, url=file_url)
+        except BaseException:
+            if not resume:
+                try:
+                    self.execute_request(action='clean', path=transfer_url, url=transfer_url)
+                except Exception:
+                    log.debug("Temporary directory of chunked upload %s is not removed", transfer_url)
+            raise
+        self._invalidate(urn)
+        if resume and os.path.exists(journal_path):
+            os.remove(journal_path)
+
+    def _list_chunks(self, transfer_url):
+        """Lists chunks already uploaded to temporary directory of chunked upload.
+
+        :param transfer_url: the URL of temporary directory of upload.
+        :return: the dictionary of names and sizes of chunks or None in case the directory does not exist.
+        """
+        data, headers = self._propfind_request(['size'])
+        try:
+            response = self.execute_request(action='list', path=transfer_url, data=data, headers_ext=headers,
+                                            url=transfer_url)
+        except RemoteResourceNotFound:
+            return None
+        chunks = {}
+        for info in WebDavXmlUtils.parse_get_list_info_response(response.content):
+            if not info['isdir'] and info['size']:
+                chunks[Urn(info['path']).filename()] = int(info['size'])
+        return chunks
+
+    def _upload_chunk(self, local_path, offset, chunk_size, number, transfer_url, headers, retries, aggregated):
+        """Uploads chunk of file, it is uploaded again in case of connection errors and server errors.
+
+        :param local_path: the path to local file.
+        :param offset: the offset of chunk in file.
+        :param chunk_size: the size of chunk in bytes.
+        :param number: the number of chunk starting from 1.
+        :param transfer_url: the URL of temporary directory of upload.
+        :param headers: the additional headers of request.
+        :param retries: maximum amount of attempts.
+        :param aggregated: the aggregated progress of upload.
+        """
+        with open(local_path, 'rb') as local_file:
+            local_file.seek(offset)
+            data = local_file.read(chunk_size)
+        url = "{transfer}/{number:05d}".format(transfer=transfer_url, number=number)
+        for attempt in range(1, max(retries, 1) + 1):
+            try:
+                self.execute_request(action='upload', path=url, data=data, headers_ext=headers, url=url)
+                break
+            except (requests.RequestException, ResponseErrorCode) as error:
+                if attempt >= retries or (isinstance(error, ResponseErrorCode) and error.code < 500):
+                    raise
+                log.debug("Upload of chunk %s failed by %s, attempt %s", url, error, attempt)
+        aggregated.update(number, len(data))
+
+    def _chunked_uploads_url(self):
+        """Returns URL of collection of chunked uploads. It is configured by `webdav_chunked_upload_root` or derived
+        from root directory of Nextcloud and ownCloud servers like `/remote.php/dav/files/<user>`.
+
+        :return: the URL or None in case it is unknown.
+        """
+        uploads_root = self.webdav.chunked_upload_root
+        if not uploads_root:
+            parts = unquote(self.webdav.root).strip(Urn.separate).split(Urn.separate)
+            if len(parts) != 4 or parts[:3] != ['remote.php', 'dav', 'files']:
+                return None
+            uploads_root = Urn.separate.join(['', 'remote.php', 'dav', 'uploads', parts[3]])
+        return "{hostname}{root}".format(hostname=self.webdav.hostname, root=Urn(uploads_root).quote().rstrip('/'))
 
     def upload_sync(self, remote_path, local_path, callback=None, progress=None, progress_args=()):
         """Uploads resource to remote path on WebDAV server synchronously.
@@ -715,19 +2323,26 @@ class Client(object):
         :param depth: folder depth to copy
         """
         urn_from = Urn(remote_path_from)
-        if not self.check(urn_from.path()):
-            raise RemoteResourceNotFound(urn_from.path())
-
         urn_to = Urn(remote_path_to)
-        if not self.check(urn_to.parent()):
-            raise RemoteParentNotFound(urn_to.path())
+        if not self.webdav.optimistic:
+            if not self.check(urn_from.path()):
+                raise RemoteResourceNotFound(urn_from.path())
+
+            if not self.check(urn_to.parent()):
+                raise RemoteParentNotFound(urn_to.path())
 
         headers = [
             "Destination: {url}".format(url=self.get_url(urn_to.quote()))
         ]
-        if self.is_dir(urn_from.path()):
+        if self.webdav.optimistic:
+            # the directory is recognized by tailing slash instead of additional request
+            is_dir = urn_from.is_dir()
+        else:
+            is_dir = self.is_dir(urn_from.path())
+        if is_dir:
             headers.append("Depth: {depth}".format(depth=depth))
-        self.execute_request(action='copy', path=urn_from.quote(), headers_ext=headers)
+        self._execute_operation(action='copy', urn=urn_from, headers_ext=headers)
+        self._invalidate(urn_to, recursive=True)
 
     @wrap_connection_error
     def move(self, remote_path_from, remote_path_to, overwrite=False):
@@ -739,16 +2354,107 @@ class Client(object):
         :param overwrite: (optional) the flag, overwrite file if it exists. Defaults is False
         """
         urn_from = Urn(remote_path_from)
-        if not self.check(urn_from.path()):
-            raise RemoteResourceNotFound(urn_from.path())
-
         urn_to = Urn(remote_path_to)
-        if not self.check(urn_to.parent()):
-            raise RemoteParentNotFound(urn_to.path())
+        if not self.webdav.optimistic:
+            if not self.check(urn_from.path()):
+                raise RemoteResourceNotFound(urn_from.path())
+
+            if not self.check(urn_to.parent()):
+                raise RemoteParentNotFound(urn_to.path())
 
         header_destination = "Destination: {path}".format(path=self.get_url(urn_to.quote()))
         header_overwrite = "Overwrite: {flag}".format(flag="T" if overwrite else "F")
-        self.execute_request(action='move', path=urn_from.quote(), headers_ext=[header_destination, header_overwrite])
+        self._execute_operation(action='move', urn=urn_from, headers_ext=[header_destination, header_overwrite])
+        self._invalidate(urn_from, recursive=True)
+        self._invalidate(urn_to, recursive=True)
+
+    @wrap_connection_error
+    def transfer(self, remote_path_from, remote_path_to, target=None, max_workers=None, progress=None,
+                 progress_args=()):
+        """Transfers file or directory to another WebDAV server without saving it locally. The content received by
+        `GET` request is sent by `PUT` request of target client while it is received. In case both paths are on the same
+        server and the same user is logged in the resource is copied by server-side `COPY` request.
+
+        :param remote_path_from: the path to file or directory on WebDAV server of this client.
+        :param remote_path_to: the path to file or directory on WebDAV server of target client.
+        :param target: (optional) the client of target WebDAV server. Defaults is this client.
+        :param max_workers: (optional) maximum amount of files of directory transferred in parallel, errors of files
+                are collected and raised as TransferErrors after all other files are transferred. Defaults is None,
+                the files are transferred one by one.
+        :param progress: Pass a callback function to view the file transmission progress.
+                The function must take *(current, total)* as positional arguments and will be called back each time a
+                new chunk has been successfully transmitted. For directories the progress is aggregated over all
+                files. Example def progress_update(current, total, *args) ...
+        :param progress_args: A tuple with extra custom arguments for the progress callback function.
+        """
+        target = self if target is None else target
+        urn_from = Urn(remote_path_from)
+        is_dir = urn_from.is_dir() if self.webdav.optimistic else self.is_dir(urn_from.path())
+        urn_from = Urn(remote_path_from, directory=is_dir)
+        urn_to = Urn(remote_path_to, directory=is_dir)
+
+        if self._is_same_server(target):
+            headers = ["Destination: {url}".format(url=target.get_url(urn_to.quote()))]
+            if is_dir:
+                headers.append("Depth: infinity")
+            self._execute_operation(action='copy', urn=urn_from, headers_ext=headers)
+            target._invalidate(urn_to, recursive=True)
+            return
+
+        if not is_dir:
+            if not target.webdav.optimistic and not target.check(urn_to.parent()):
+                raise RemoteParentNotFound(urn_to.path())
+            self._transfer_file(urn_from, target, urn_to, progress, progress_args)
+            return
+
+        aggregated = AggregatedProgress(progress, progress_args)
+        futures = {}
+        with ThreadPoolExecutor(max_workers=int(max_workers or 1)) as executor:
+            for directory_path, _, files in self.walk(urn_from.path(), max_workers=max_workers, get_info=True,
+                                                      properties=['size']):
+                target_directory = urn_to.path() + directory_path[len(urn_from.path()):]
+                target.mkdir(target_directory)
+                for info in files:
+                    resource_name = Urn(info['path']).filename()
+                    _remote_path = "{parent}{name}".format(parent=directory_path, name=resource_name)
+                    size = int(info['size']) if info['size'] else None
+                    file_progress = aggregated.add(_remote_path, size)
+                    future = executor.submit(self._transfer_file, Urn(_remote_path), target,
+                                             Urn(target_directory + resource_name), file_progress)
+                    futures[future] = (_remote_path, size)
+            self._collect_errors(futures, aggregated)
+
+    def _is_same_server(self, target):
+        """Checks the target client works with the same WebDAV server and user, so resources can be copied by
+        server-side `COPY` request.
+
+        :param target: the client of target WebDAV server.
+        :return: True in case it is the same server.
+        """
+        if target is self:
+            return True
+        return urlsplit(self.webdav.hostname)[:2] == urlsplit(target.webdav.hostname)[:2] and \
+            self.webdav.login == target.webdav.login and self.webdav.token == target.webdav.token
+
+    def _transfer_file(self, urn_from, target, urn_to, progress=None, progress_args=()):
+        """Transfers file to another WebDAV server by streaming content of `GET` response to `PUT` request.
+
+        :param urn_from: the URN of file on WebDAV server of this client.
+        :param target: the client of target WebDAV server.
+        :param urn_to: the URN of file on WebDAV server of target client.
+        :param progress: (optional) the progress callback function.
+        :param progress_args: (optional) a tuple with extra custom arguments for the progress callback function.
+        """
+        response = self._execute_operation(action='download', urn=urn_from, headers_ext=["Accept-Encoding: identity"])
+        with response:
+            clen_str = response.headers.get('content-length')
+            if clen_str is not None and response.headers.get('content-encoding', 'identity') == 'identity':
+                data = TransferStream(response, int(clen_str), progress, progress_args)
+            else:
+                # the length of decoded content is unknown, it is sent by chunked transfer encoding
+                data = response.iter_content(chunk_size=self.chunk_size)
+            target._execute_operation(action='upload', urn=urn_to, data=data)
+        target._invalidate(urn_to)
 
     @wrap_connection_error
     def clean(self, remote_path):
@@ -760,13 +2466,16 @@ class Client(object):
         """
         urn = Urn(remote_path)
         self.execute_request(action='clean', path=urn.quote())
+        self._invalidate(urn, recursive=True)
 
     @wrap_connection_error
-    def info(self, remote_path):
+    def info(self, remote_path, typed=False, properties=None):
         """Gets information about resource on WebDAV.
         More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PROPFIND
 
         :param str remote_path: the path to remote resource.
+        :param typed: true to get the information as compact `ResourceInfo` record instead of dictionary.
+        :param properties: (optional) the names of information attributes to request as for `list`.
         :return: a dictionary of information attributes and them values with following keys:
                  `created`: date of resource creation,
                  `name`: name of resource,
@@ -776,13 +2485,81 @@ class Client(object):
                  `content_type`: content type of resource.
         """
         urn = Urn(remote_path)
+        info = self.cache.get(self._cache_key(urn))
+        if info is not None:
+            if typed:
+                return ResourceInfo.from_dict(info)
+            del info['isdir'], info['path']
+            return info
+
         self._check_remote_resource(remote_path, urn)
 
-        response = self.execute_request(action='info', path=urn.quote())
+        data, headers = self._propfind_request(properties)
+        response = self.execute_request(action='info', path=urn.quote(), data=data, headers_ext=headers)
+        self._cache_response(response.content, complete=data is None)
         path = self.get_full_path(urn)
+        if typed:
+            response = WebDavXmlUtils.extract_response_for_path(content=response.content, path=path,
+                                                                hostname=self.webdav.hostname)
+            return ResourceInfo.from_dict(WebDavXmlUtils.get_list_info_from_response(response))
         return WebDavXmlUtils.parse_info_response(content=response.content, path=path, hostname=self.webdav.hostname)
 
+    @wrap_connection_error
+    def info_batch(self, remote_paths, max_workers=None, typed=False, properties=None):
+        """Gets information about many resources on WebDAV. The paths are grouped by parent directories and each
+        directory is requested once by PROPFIND of depth 1, the requests are executed in parallel.
+        More information you can find by link http://webdav.org/specs/rfc4918.html#METHOD_PROPFIND
+
+        :param remote_paths: the paths to remote resources.
+        :param max_workers: (optional) maximum amount of parallel requests. Defaults to `webdav_pool_maxsize`.
+        :param typed: true to get the information as compact `ResourceInfo` records instead of dictionaries.
+        :param properties: (optional) the names of information attributes to request as for `list`.
+        :return: the dictionary of remote paths and information about them as `info` returns it, the value is None
+                 in case the resource does not exist.
+        """
+        self._propfind_request(properties)
+        result = {}
+        parents = OrderedDict()
+        for remote_path in remote_paths:
+            urn = Urn(remote_path)
+            info = self.cache.get(self._cache_key(urn)) if properties is None else None
+            if info is not None:
+                result[remote_path] = info
+            elif urn.path() == Client.root:
+                try:
+                    result[remote_path] = self.info(remote_path, typed=typed, properties=properties)
+                except RemoteResourceNotFound:
+                    result[remote_path] = None
+            else:
+                parents.setdefault(urn.parent(), []).append(remote_path)
+
+        def list_directory(directory_path):
+            try:
+                return [info for info in self._iter_directory(Urn(directory_path, directory=True), properties)]
+            except RemoteResourceNotFound:
+                return []
+
+        if parents:
+            max_workers = int(max_workers or self.webdav.pool_maxsize)
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(parents))) as executor:
+                listings = executor.map(list_directory, parents.keys())
+                for paths, resources in zip(parents.values(), listings):
+                    found = {self._info_key(info): info for info in resources}
+                    for remote_path in paths:
+                        result[remote_path] = found.get(self._cache_key(Urn(remote_path)))
+
+        for (remote_path, info) in result.items():
+            if info is None or isinstance(info, ResourceInfo):
+                continue
+            if typed:
+                result[remote_path] = ResourceInfo.from_dict(info)
+            else:
+                result[remote_path] = {key: value for (key, value) in info.items() if key not in ('isdir', 'path')}
+        return result
+
     def _check_remote_resource(self, remote_path, urn):
+        if self.webdav.optimistic:
+            return
         if not self.check(urn.path()) and not self.check(Urn(remote_path, directory=True).path()):
             raise RemoteResourceNotFound(remote_path)
 
@@ -795,9 +2572,15 @@ class Client(object):
         :return: True in case the remote resource is directory and False otherwise.
         """
         urn = Urn(remote_path)
+        info = self.cache.get(self._cache_key(urn), complete=False)
+        if info is not None:
+            return info['isdir']
+
         self._check_remote_resource(remote_path, urn)
 
-        response = self.execute_request(action='info', path=urn.quote(), headers_ext=["Depth: 0"])
+        data, headers = self._propfind_request((), ["Depth: 0"])
+        response = self.execute_request(action='info', path=urn.quote(), data=data, headers_ext=headers)
+        self._cache_response(response.content, complete=False)
         path = self.get_full_path(urn)
         return WebDavXmlUtils.parse_is_dir_response(content=response.content, path=path, hostname=self.webdav.hostname)
 
@@ -813,11 +2596,11 @@ class Client(object):
         :return: the value of property or None if property is not found.
         """
         urn = Urn(remote_path)
-        if not self.check(urn.path()):
+        if not self.webdav.optimistic and not self.check(urn.path()):
             raise RemoteResourceNotFound(urn.path())
 
         data = WebDavXmlUtils.create_get_property_request_content(option)
-        response = self.execute_request(action='get_property', path=urn.quote(), data=data)
+        response = self._execute_operation(action='get_property', urn=urn, data=data)
         return WebDavXmlUtils.parse_get_property_response(response.content, option['name'])
 
     @wrap_connection_error
@@ -845,11 +2628,12 @@ class Client(object):
                        `value`: (optional) the value of property which will be set. Defaults is empty string.
         """
         urn = Urn(remote_path)
-        if not self.check(urn.path()):
+        if not self.webdav.optimistic and not self.check(urn.path()):
             raise RemoteResourceNotFound(urn.path())
 
         data = WebDavXmlUtils.create_set_property_batch_request_content(option)
-        self.execute_request(action='set_property', path=urn.quote(), data=data)
+        self._execute_operation(action='set_property', urn=urn, data=data)
+        self.cache.invalidate(self._cache_key(urn))
 
     @wrap_connection_error
     def lock(self, remote_path=root, timeout=0):
@@ -877,6 +2661,93 @@ class Client(object):
         urn = Urn(remote_path)
         return Resource(self, urn)
 
+    @wrap_connection_error
+    def read_ranges(self, remote_path, ranges, gap=8192, max_workers=None):
+        """Reads many byte ranges of remote file by single request. Overlapping and nearby ranges are merged, all
+        ranges are requested by one `Range` header and `multipart/byteranges` response is parsed while it is
+        received. In case the server returns whole content instead, the ranges are taken from it, and in case it
+        returns only one range, the other ranges are requested in parallel one by one.
+        More information you can find by link https://tools.ietf.org/html/rfc7233#section-4.1
+
+        :param remote_path: the path to remote file.
+        :param ranges: the list of tuples of offset and length of needed ranges.
+        :param gap: (optional) maximum amount of unneeded bytes between ranges which are requested as one range.
+                    Defaults to 8192.
+        :param max_workers: (optional) maximum amount of parallel requests when the server does not support many
+                            ranges in one request. Defaults to `webdav_pool_maxsize`.
+        :return: the list of contents of ranges in the same order as ranges were passed, the content is shorter
+                 than requested length when the range exceeds the end of file.
+        """
+        ranges = list(ranges)
+        segments = coalesce_ranges(ranges, gap=max(int(gap), 0))
+        if not segments:
+            return []
+        urn = Urn(remote_path)
+
+        def request_range(segment):
+            headers = ["Range: bytes={start}-{end}".format(start=segment[0], end=segment[1]),
+                       "Accept-Encoding: identity"]
+            response = self._execute_operation(action='download', urn=urn, headers_ext=headers)
+            with response:
+                if response.status_code == 206:
+                    return segment[0], response.content
+                return segment[0], response.content[segment[0]:segment[1] + 1]
+
+        header = ",".join("{start}-{end}".format(start=start, end=end) for (start, end) in segments)
+        response = self._execute_operation(action='download', urn=urn, headers_ext=[
+            "Range: bytes={ranges}".format(ranges=header), "Accept-Encoding: identity"])
+        with response:
+            content_type = response.headers.get('content-type', '')
+            if response.status_code != 206:
+                # the server ignores ranges, so the ranges are taken from the full content
+                parts = [(0, response.content)]
+            elif content_type.lower().startswith('multipart/byteranges'):
+                boundary = content_type.split('boundary=', 1)[-1].split(';', 1)[0].strip().strip('"')
+                response.raw.decode_content = True
+                parts = list(iter_byteranges(BufferedReader(response.raw), boundary))
+            else:
+                start, _, _ = parse_content_range(response.headers.get('content-range', ''))
+                parts = [(start, response.content)]
+
+        # the server which does not support many ranges returns only one of them, the rest is requested one by one
+        missing = [segment for segment in segments
+                   if not any(start <= segment[0] and segment[1] < start + len(part) for (start, part) in parts)]
+        if missing and response.status_code == 206:
+            max_workers = min(int(max_workers or self.webdav.pool_maxsize), len(missing))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                parts.extend(executor.map(request_range, missing))
+
+        result = []
+        for (offset, length) in ranges:
+            content = b''
+            for (start, part) in parts:
+                if start <= offset < start + len(part):
+                    content = part[offset - start:offset - start + length]
+                    break
+            result.append(content)
+        return result
+
+    @wrap_connection_error
+    def open(self, remote_path, mode='rb', block_size=1048576, cache_size=16, read_ahead=4):
+        """Opens remote file for random access reading. The content is requested by blocks using `Range` requests, so
+        only the read parts of file are downloaded.
+        More information you can find by link https://tools.ietf.org/html/rfc7233
+
+        :param remote_path: the path to remote file.
+        :param mode: the mode of opening, only 'rb' is supported.
+        :param block_size: (optional) the size of block requested from server in bytes. Defaults to 1 MiB.
+        :param cache_size: (optional) maximum amount of blocks kept in LRU cache. Defaults to 16.
+        :param read_ahead: (optional) amount of following blocks requested in advance when the file is read
+                           sequentially. Defaults to 4.
+        :return: the seekable file object, the instance of `RemoteFile` which is `io.RawIOBase`.
+        """
+        if mode != 'rb':
+            raise OptionNotValid(name="mode", value=mode)
+        urn = Urn(remote_path)
+        if not self.webdav.optimistic and self.is_dir(urn.path()):
+            raise OptionNotValid(name="remote_path", value=remote_path)
+        return RemoteFile(self, urn, block_size=block_size, cache_size=cache_size, read_ahead=read_ahead)
+
     def push(self, remote_directory, local_directory):
 
         def prune(src, exp):
@@ -892,6 +2763,8 @@ class Client(object):
         remote_resource_names = prune(paths, expression)
 
         for local_resource_name in listdir(local_directory):
+            if local_resource_name == ETagIndex.file_name or local_resource_name.endswith(Client.resume_suffix):
+                continue
             local_path = os.path.join(local_directory, local_resource_name)
             remote_path = "{remote_directory}{resource_name}".format(remote_directory=urn.path(),
                                                                      resource_name=local_resource_name)
@@ -909,7 +2782,7 @@ class Client(object):
                 updated = True
         return updated
 
-    def pull(self, remote_directory, local_directory):
+    def pull(self, remote_directory, local_directory, resume=False, conditional=False):
         def prune(src, exp):
             return [sub(exp, "", item) for item in src]
 
@@ -920,30 +2793,40 @@ class Client(object):
 
         local_resource_names = listdir(local_directory)
 
-        paths = self.list(urn.path())
+        infos = {Urn(info['path'], info['isdir']).filename(): info
+                 for info in self.list(urn.path(), get_info=True, properties=['etag'])}
+        paths = list(infos)
         expression = "{begin}{end}".format(begin="^", end=remote_directory)
         remote_resource_names = prune(paths, expression)
 
-        for remote_resource_name in remote_resource_names:
-            if urn.path().endswith(remote_resource_name):
-                continue
-            local_path = os.path.join(local_directory, remote_resource_name)
-            remote_path = "{remote_directory}{resource_name}".format(remote_directory=urn.path(),
-                                                                     resource_name=remote_resource_name)
-            remote_urn = Urn(remote_path)
-
-            if remote_urn.path().endswith("/"):
-                if not os.path.exists(local_path):
-                    updated = True
-                    os.mkdir(local_path)
-                result = self.pull(remote_directory=remote_path, local_directory=local_path)
-                updated = updated or result
-            else:
-                if remote_resource_name in local_resource_names and self.is_local_more_recent(local_path, remote_path):
+        with self.etag_index.deferred():
+            for remote_resource_name in remote_resource_names:
+                if urn.path().endswith(remote_resource_name):
                     continue
-
-                self.download_file(remote_path=remote_path, local_path=local_path)
-                updated = True
+                local_path = os.path.join(local_directory, remote_resource_name)
+                remote_path = "{remote_directory}{resource_name}".format(remote_directory=urn.path(),
+                                                                         resource_name=remote_resource_name)
+                remote_urn = Urn(remote_path)
+
+                if remote_urn.path().endswith("/"):
+                    if not os.path.exists(local_path):
+                        updated = True
+                        os.mkdir(local_path)
+                    result = self.pull(remote_directory=remote_path, local_directory=local_path, resume=resume,
+                                       conditional=conditional)
+                    updated = updated or result
+                else:
+                    info = infos.get(remote_resource_name, {'etag': None, 'size': None})
+                    if conditional and self._is_up_to_date(info, remote_path, local_path, False, True):
+                        continue
+                    if not conditional and remote_resource_name in local_resource_names and \
+                            not os.path.exists(local_path + Client.resume_suffix) and \
+                            self.is_local_more_recent(local_path, remote_path):
+                        continue
+
+                    result = self.download_file(remote_path=remote_path, local_path=local_path, resume=resume,
+                                                conditional=conditional)
+                    updated = updated or result
         return updated
 
     def is_local_more_recent(self, local_path, remote_path):
@@ -956,13 +2839,12 @@ class Client(object):
                  None if comparison is not possible
         """
         try:
-            remote_info = self.info(remote_path)
-            remote_last_mod_date = remote_info['modified']
-            remote_last_mod_date = dateutil_parser.parse(remote_last_mod_date)
-            remote_last_mod_date_unix_ts = int(remote_last_mod_date.timestamp())
+            remote_last_mod_date_unix_ts = self.info(remote_path, typed=True).modified
+            if remote_last_mod_date_unix_ts is None:
+                return None
             local_last_mod_date_unix_ts = int(os.stat(local_path).st_mtime)
 
-            return remote_last_mod_date_unix_ts < local_last_mod_date_unix_ts
+            return int(remote_last_mod_date_unix_ts) < local_last_mod_date_unix_ts
         except (ValueError, RuntimeWarning, KeyError):
             # If there is problem when parsing dates, or cannot get
             # last modified information, return None
@@ -1037,6 +2919,12 @@ class Resource(object):
     def read_async(self, local_path, callback=None):
         return self.client.upload_async(local_path=local_path, remote_path=self.urn.path(), callback=callback)
 
+    def open(self, mode='rb', **kwargs):
+        return self.client.open(self.urn.path(), mode=mode, **kwargs)
+
+    def write_into(self, buffer=None):
+        return self.client.download_into(buffer=buffer, remote_path=self.urn.path())
+
     def write_to(self, buff):
         return self.client.download_from(buff=buff, remote_path=self.urn.path())
 
@@ -1061,6 +2949,17 @@ class Resource(object):
 
 
 class WebDavXmlUtils:
+    # mapping of DAV properties to keys of information dictionary
+    info_properties = OrderedDict([
+        ('{DAV:}creationdate', 'created'),
+        ('{DAV:}displayname', 'name'),
+        ('{DAV:}getcontentlength', 'size'),
+        ('{DAV:}getlastmodified', 'modified'),
+        ('{DAV:}getetag', 'etag'),
+        ('{DAV:}getcontenttype', 'content_type'),
+    ])
+    info_attributes = OrderedDict((name, tag[len('{DAV:}'):]) for (tag, name) in info_properties.items())
+
     def __init__(self):
         pass
 
@@ -1083,20 +2982,72 @@ class WebDavXmlUtils:
             tree = etree.fromstring(content)
             infos = []
             for response in tree.findall(".//{DAV:}response"):
-                href_el = next(iter(response.findall(".//{DAV:}href")), None)
-                if href_el is None:
-                    continue
-                path = unquote(urlsplit(href_el.text).path)
-                info = dict()
-                is_dir = len(response.findall(".//{DAV:}collection")) > 0
-                info = WebDavXmlUtils.get_info_from_response(response)
-                info['isdir'] = is_dir
-                info['path'] = path
-                infos.append(info)
+                info = WebDavXmlUtils.get_list_info_from_response(response)
+                if info is not None:
+                    infos.append(info)
             return infos
         except etree.XMLSyntaxError:
             return list()
 
+    @staticmethod
+    def iter_get_list_info_response(stream):
+        """Parses response XML from WebDAV server incrementally while it is read from stream and extracts file and
+        directory infos. Parsed elements are released after each response, so the memory usage stays flat.
+
+        :param stream: the file-like object with XML content of HTTP response for getting list of files.
+        :return: generator of information dictionaries with the same keys as `parse_get_list_info_response` returns,
+                 `etree.XMLSyntaxError` is raised when the content is truncated or malformed.
+        """
+        for _, response in etree.iterparse(stream, events=('end',), tag='{DAV:}response'):
+            info = WebDavXmlUtils.get_list_info_from_response(response)
+            response.clear()
+            while response.getprevious() is not None:
+                del response.getparent()[0]
+            if info is not None:
+                yield info
+
+    @staticmethod
+    def get_list_info_from_response(response):
+        """Get information attributes of list item from response
+
+        :param response: XML object of response for the remote resource.
+        :return: the information dictionary with the same keys as `parse_get_list_info_response` returns or None in
+                 case the response has no href.
+        """
+        href, is_dir, info = WebDavXmlUtils.decode_response(response)
+        if href is None:
+            return None
+        info['isdir'] = is_dir
+        info['path'] = unquote(urlsplit(href).path)
+        return info
+
+    @staticmethod
+    def decode_response(response):
+        """Decodes response for the remote resource by single pass over its properties instead of searching each
+        property in the whole subtree.
+
+        :param response: XML object of response for the remote resource.
+        :return: the tuple of href of resource or None if it is missing, True if resource is directory and the
+                 dictionary of information attributes as `get_info_from_response` returns.
+        """
+        info_properties = WebDavXmlUtils.info_properties
+        info = dict.fromkeys(info_properties.values())
+        href = None
+        is_dir = False
+        for node in response:
+            if node.tag == '{DAV:}propstat':
+                for prop in node.iterchildren('{DAV:}prop'):
+                    for prop_node in prop:
+                        name = info_properties.get(prop_node.tag)
+                        if name is not None:
+                            if info[name] is None:
+                                info[name] = prop_node.text or ''
+                        elif prop_node.tag == '{DAV:}resourcetype':
+                            is_dir = is_dir or prop_node.find('{DAV:}collection') is not None
+            elif node.tag == '{DAV:}href' and href is None:
+                href = node.text
+        return href, is_dir, info
+
     @staticmethod
     def parse_get_list_response(content):
         """Parses of response content XML from WebDAV server and extract file and directory names.
@@ -1108,12 +3059,10 @@ class WebDavXmlUtils:
             tree = etree.fromstring(content)
             urns = []
             for response in tree.findall(".//{DAV:}response"):
-                href_el = next(iter(response.findall(".//{DAV:}href")), None)
-                if href_el is None:
+                href, is_dir, _ = WebDavXmlUtils.decode_response(response)
+                if href is None:
                     continue
-                href = Urn.separate + unquote(urlsplit(href_el.text).path)
-                is_dir = len(response.findall(".//{DAV:}collection")) > 0
-                urns.append(Urn(href, is_dir))
+                urns.append(Urn(Urn.separate + unquote(urlsplit(href).path), is_dir))
             return urns
         except etree.XMLSyntaxError:
             return list()
@@ -1131,6 +3080,22 @@ class WebDavXmlUtils:
         tree = etree.ElementTree(root)
         return WebDavXmlUtils.etree_to_string(tree)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def create_propfind_request_content(names):
+        """Creates an XML for requesting of selected properties of remote resources.
+        The content is created once for each set of properties and reused by following requests.
+
+        :param names: the tuple of names of properties in DAV namespace, for example ('getetag', 'resourcetype').
+        :return: the XML string of request content.
+        """
+        root = etree.Element("propfind", xmlns="DAV:")
+        prop = etree.SubElement(root, "prop")
+        for name in names:
+            etree.SubElement(prop, name)
+        tree = etree.ElementTree(root)
+        return WebDavXmlUtils.etree_to_string(tree)
+
     @staticmethod
     def parse_free_space_response(content, hostname):
         """Parses of response content XML from WebDAV server and extract an amount of free space.
@@ -1164,18 +3129,7 @@ class WebDavXmlUtils:
                  `etag`: etag of resource,
                  `content_type`: content type of resource.
         """
-        find_attributes = {
-            'created': ".//{DAV:}creationdate",
-            'name': ".//{DAV:}displayname",
-            'size': ".//{DAV:}getcontentlength",
-            'modified': ".//{DAV:}getlastmodified",
-            'etag': ".//{DAV:}getetag",
-            'content_type': ".//{DAV:}getcontenttype",
-        }
-        info = dict()
-        for (name, value) in find_attributes.items():
-            info[name] = response.findtext(value)
-        return info
+        return WebDavXmlUtils.decode_response(response)[2]
 
     @staticmethod
     def parse_info_response(content, path, hostname):
@@ -1227,6 +3181,20 @@ class WebDavXmlUtils:
         tree = etree.ElementTree(root)
         return WebDavXmlUtils.etree_to_string(tree)
 
+    @staticmethod
+    def parse_checksums_response(content):
+        """Parses of response content XML from WebDAV server for getting `oc:checksums` property.
+
+        :param content: the XML content of response as string.
+        :return: the checksums in the format of `OC-Checksum` header or None if they have not been found.
+        """
+        try:
+            tree = etree.fromstring(content)
+        except etree.XMLSyntaxError:
+            return None
+        checksums = [node.text.strip() for node in tree.iter('{http://owncloud.org/ns}checksum') if node.text]
+        return ' '.join(checksums) or None
+
     @staticmethod
     def parse_get_property_response(content, name):
         """Parses of response content XML from WebDAV server for getting metadata property value for some resource.
@@ -1270,7 +3238,8 @@ class WebDavXmlUtils:
 
     @staticmethod
     def extract_response_for_path(content, path, hostname):
-        """Extracts single response for specified remote resource.
+        """Extracts single response for specified remote resource. The content is parsed incrementally and parsing
+        stops on the found response, the responses for other resources are released as soon as they are checked.
 
         :param content: raw content of response as string.
         :param path: the path to needed remote resource.
@@ -1278,12 +3247,12 @@ class WebDavXmlUtils:
         :return: XML object of response for the remote resource defined by path.
         """
         prefix = urlparse(hostname).path
+        if isinstance(content, str):
+            content = content.encode('utf-8')
         try:
-            tree = etree.fromstring(content)
-            responses = tree.findall("{DAV:}response")
             n_path = Urn.normalize_path(path)
 
-            for resp in responses:
+            for _, resp in etree.iterparse(BytesIO(content), events=('end',), tag='{DAV:}response'):
                 href = resp.findtext("{DAV:}href")
 
                 if Urn.compare_path(n_path, href) is True:
@@ -1291,6 +3260,7 @@ class WebDavXmlUtils:
                 href_without_prefix = href[len(prefix):] if href.startswith(prefix) else href
                 if Urn.compare_path(n_path, href_without_prefix) is True:
                     return resp
+                resp.clear()
             raise RemoteResourceNotFound(path)
         except etree.XMLSyntaxError:
             raise MethodNotSupported(name="is_dir", server=hostname)
@@ -1303,6 +3273,11 @@ class LockClient(Client):
         self.webdav = client.webdav
         self.requests = client.requests
         self.timeout = self.webdav.timeout
+        self.cache = client.cache
+        self.depth_infinity = client.depth_infinity
+        self.etag_index = client.etag_index
+        self.content_cache = client.content_cache
+        self.directories = client.directories
 
         self.__lock_path = lock_path
         self.__lock_token = lock_token
@@ -25,7 +25,10 @@ class WebDAVSettings(ConnectionSettings):
     ns = "webdav:"
     prefix = "webdav_"
     keys = {'hostname', 'login', 'password', 'token', 'root', 'cert_path', 'key_path', 'recv_speed', 'send_speed',
-            'verbose', 'disable_check', 'override_methods', 'timeout', 'chunk_size'}
+            'verbose', 'disable_check', 'override_methods', 'timeout', 'chunk_size', 'pool_connections', 'pool_maxsize',
+            'pool_block', 'keep_alive_timeout', 'optimistic', 'metadata_cache_size', 'metadata_cache_ttl',
+            'content_cache_path', 'content_cache_size', 'chunked_upload_root', 'chunked_upload_size', 'pipeline_depth',
+            'fsync'}
 
     def __init__(self, options):
         self.hostname = None
@@ -42,6 +45,19 @@ class WebDAVSettings(ConnectionSettings):
         self.override_methods = {}
         self.timeout = 30
         self.chunk_size = 65536
+        self.pool_connections = 10
+        self.pool_maxsize = 10
+        self.pool_block = False
+        self.keep_alive_timeout = None
+        self.optimistic = False
+        self.metadata_cache_size = 0
+        self.metadata_cache_ttl = 60
+        self.content_cache_path = None
+        self.content_cache_size = 1073741824
+        self.chunked_upload_root = None
+        self.chunked_upload_size = 10485760
+        self.pipeline_depth = 0
+        self.fsync = False
 
         self.options = dict()
 
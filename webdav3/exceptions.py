@@ -108,3 +108,25 @@ class ResourceLocked(WebDavException):
 
     def __str__(self):
         return "Resource {path} locked".format(path=self.path)
+
+
+class TransferErrors(WebDavException):
+    def __init__(self, errors):
+        self.errors = errors
+
+    def __str__(self):
+        return "Transfer of {count} resources failed: {errors}".format(
+            count=len(self.errors), errors="; ".join("{path}: {error}".format(path=path, error=error)
+                                                     for (path, error) in self.errors))
+
+
+class ChecksumMismatch(WebDavException):
+    def __init__(self, path, algorithm, expected, actual):
+        self.path = path
+        self.algorithm = algorithm
+        self.expected = expected
+        self.actual = actual
+
+    def __str__(self):
+        return "Checksum {algorithm} of {path} is {actual}, but server reports {expected}".format(
+            algorithm=self.algorithm, path=self.path, actual=self.actual, expected=self.expected)
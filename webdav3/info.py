@@ -0,0 +1,130 @@
+import sys
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+
+from dateutil import parser as dateutil_parser
+
+_unparsed = object()
+
+
+def to_timestamp(value):
+    """Converts date of WebDAV property to POSIX timestamp.
+    The `getlastmodified` property uses RFC 1123 format and `creationdate` uses ISO 8601 format, other formats are
+    parsed by dateutil. Dates without time zone are treated as UTC.
+
+    :param value: the string value of date.
+    :return: the timestamp in seconds or None in case the value is empty or could not be parsed.
+    """
+    if not value:
+        return None
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            date = dateutil_parser.isoparse(value)
+        except (ValueError, OverflowError):
+            try:
+                date = dateutil_parser.parse(value)
+            except (ValueError, OverflowError):
+                return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date.timestamp()
+
+
+class ResourceInfo(object):
+    """The compact record of information about remote resource.
+    Size is stored as integer, dates are kept as received and converted to timestamps on first access only.
+    The parent path and content type are interned, so they are shared by all resources of the same listing.
+    """
+    __slots__ = ('_parent', '_basename', 'name', 'size', 'etag', 'content_type', 'isdir',
+                 'modified_raw', 'created_raw', '_modified', '_created')
+
+    def __init__(self, path, isdir=False, name=None, size=None, etag=None, content_type=None, modified=None,
+                 created=None):
+        """Constructor of resource information
+
+        :param path: the path of resource.
+        :param isdir: True if resource is directory.
+        :param name: the display name of resource.
+        :param size: the size of resource in bytes.
+        :param etag: the etag of resource.
+        :param content_type: the content type of resource.
+        :param modified: the date of resource modification as it was received from WebDAV server.
+        :param created: the date of resource creation as it was received from WebDAV server.
+        """
+        index = path.rfind('/', 0, -1) + 1
+        self._parent = sys.intern(path[:index])
+        self._basename = path[index:]
+        self.name = self._basename if name == self._basename else name
+        try:
+            self.size = int(size) if size else None
+        except ValueError:
+            self.size = None
+        self.etag = etag
+        self.content_type = sys.intern(content_type) if content_type else content_type
+        self.isdir = isdir
+        self.modified_raw = modified
+        self.created_raw = created
+        self._modified = _unparsed
+        self._created = _unparsed
+
+    @classmethod
+    def from_dict(cls, info):
+        """Creates record from the dictionary of information attributes as `Client.list` returns it.
+
+        :param info: the dictionary of information attributes.
+        :return: the instance of ResourceInfo.
+        """
+        return cls(path=info.get('path') or '', isdir=info.get('isdir', False), name=info.get('name'),
+                   size=info.get('size'), etag=info.get('etag'), content_type=info.get('content_type'),
+                   modified=info.get('modified'), created=info.get('created'))
+
+    @property
+    def path(self):
+        return self._parent + self._basename
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @property
+    def modified(self):
+        """The date of resource modification as POSIX timestamp or None in case it is unknown."""
+        if self._modified is _unparsed:
+            self._modified = to_timestamp(self.modified_raw)
+        return self._modified
+
+    @property
+    def created(self):
+        """The date of resource creation as POSIX timestamp or None in case it is unknown."""
+        if self._created is _unparsed:
+            self._created = to_timestamp(self.created_raw)
+        return self._created
+
+    def to_dict(self):
+        """Converts record to the dictionary of information attributes in the same form as `Client.list` returns.
+
+        :return: the dictionary of information attributes.
+        """
+        return {
+            'created': self.created_raw,
+            'name': self.name,
+            'size': str(self.size) if self.size is not None else None,
+            'modified': self.modified_raw,
+            'etag': self.etag,
+            'content_type': self.content_type,
+            'isdir': self.isdir,
+            'path': self.path,
+        }
+
+    def __eq__(self, other):
+        if not isinstance(other, ResourceInfo):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "ResourceInfo(path={path!r}, isdir={isdir!r}, size={size!r}, modified={modified!r})".format(
+            path=self.path, isdir=self.isdir, size=self.size, modified=self.modified_raw)
@@ -0,0 +1,223 @@
+import io
+import threading
+from collections import OrderedDict
+
+from webdav3.exceptions import OptionNotValid, MethodNotSupported, ResponseErrorCode
+
+
+def coalesce_ranges(ranges, gap=0):
+    """Merges overlapping and nearby ranges, so they can be requested as one range.
+
+    :param ranges: the list of tuples of offset and length of ranges.
+    :param gap: maximum amount of unneeded bytes between ranges which are still merged.
+    :return: the sorted list of tuples of first and last byte positions of merged ranges.
+    """
+    segments = []
+    for (offset, length) in sorted(ranges):
+        if offset < 0 or length <= 0:
+            raise OptionNotValid(name="ranges", value=(offset, length))
+        end = offset + length - 1
+        if segments and offset <= segments[-1][1] + gap + 1:
+            segments[-1][1] = max(segments[-1][1], end)
+        else:
+            segments.append([offset, end])
+    return [tuple(segment) for segment in segments]
+
+
+def parse_content_range(value):
+    """Parses value of `Content-Range` header.
+
+    :param value: the value of header, for example 'bytes 0-99/1000'.
+    :return: the tuple of first and last byte positions and the total size or None if the size is unknown.
+    """
+    unit, _, content_range = value.strip().partition(' ')
+    positions, _, total = content_range.partition('/')
+    start, _, end = positions.partition('-')
+    if unit != 'bytes' or not start.isdigit() or not end.isdigit():
+        raise OptionNotValid(name="Content-Range", value=value)
+    return int(start), int(end), int(total) if total.isdigit() else None
+
+
+def iter_byteranges(stream, boundary):
+    """Parses `multipart/byteranges` content while it is read from the stream.
+
+    :param stream: the buffered binary stream of response content.
+    :param boundary: the boundary of parts from `Content-Type` header.
+    :return: generator of tuples of first byte position and content of each part.
+    """
+    delimiter = b'--' + boundary.encode('latin-1')
+    line = stream.readline()
+    while line:
+        line = line.strip()
+        if line == delimiter + b'--':
+            return
+        if line != delimiter:
+            line = stream.readline()
+            continue
+        headers = {}
+        line = stream.readline()
+        while line.strip():
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+            line = stream.readline()
+        start, end, _ = parse_content_range(headers.get('content-range', ''))
+        yield start, stream.read(end - start + 1)
+        line = stream.readline()
+
+
+class RemoteFile(io.RawIOBase):
+    """Read-only seekable file object for remote file on WebDAV server.
+    The content is requested by blocks using `Range` requests, the recently used blocks are kept in LRU cache and
+    sequential reading requests following blocks in advance by the same request. In case the server ignores `Range`
+    the full content is received once and kept in memory.
+    """
+
+    def __init__(self, client, urn, block_size=1048576, cache_size=16, read_ahead=4):
+        """Constructor of remote file
+
+        :param client: the client of WebDAV server.
+        :param urn: the URN of remote file.
+        :param block_size: the size of block requested from server in bytes.
+        :param cache_size: maximum amount of cached blocks.
+        :param read_ahead: amount of blocks requested in advance when the file is read sequentially.
+        """
+        super().__init__()
+        if int(block_size) <= 0:
+            raise OptionNotValid(name="block_size", value=block_size)
+        self.client = client
+        self.urn = urn
+        self.block_size = int(block_size)
+        self.cache_size = max(int(cache_size), 1)
+        self.read_ahead = max(int(read_ahead), 0)
+        self._position = 0
+        self._last_block = None
+        self._blocks = OrderedDict()
+        self._content = None
+        self._lock = threading.RLock()
+
+        response = client.execute_request(action='check', path=urn.quote(), headers_ext=["Accept-Encoding: identity"])
+        with response:
+            size = response.headers.get('content-length')
+            self.etag = response.headers.get('etag')
+        self.size = int(size) if size is not None else self._probe_size()
+
+    def _probe_size(self):
+        """Finds the size of file which is not reported by `HEAD` response, for example of dynamic resources. It is
+        taken from `Content-Range` of response to the request of the first byte.
+
+        :return: the size of file in bytes.
+        """
+        headers = ["Range: bytes=0-0", "Accept-Encoding: identity"]
+        try:
+            response = self.client.execute_request(action='download', path=self.urn.quote(), headers_ext=headers)
+        except ResponseErrorCode as error:
+            # the range is not satisfiable for empty file only
+            if error.code == 416:
+                return 0
+            raise
+        with response:
+            self.etag = self.etag or response.headers.get('etag')
+            if response.status_code != 206:
+                self._content = response.content
+                return len(self._content)
+            size = parse_content_range(response.headers.get('content-range', ''))[2]
+        if size is None:
+            raise MethodNotSupported(name="open", server=self.client.webdav.hostname)
+        return size
+
+    @property
+    def name(self):
+        return self.urn.path()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise OptionNotValid(name="whence", value=whence)
+        if position < 0:
+            raise OptionNotValid(name="offset", value=offset)
+        self._position = position
+        return position
+
+    def readinto(self, buffer):
+        view = memoryview(buffer).cast('B')
+        with self._lock:
+            written = 0
+            while written < len(view) and self._position < self.size:
+                index, offset = divmod(self._position, self.block_size)
+                block = self._get_block(index)
+                size = min(len(block) - offset, len(view) - written)
+                if size <= 0:
+                    break
+                view[written:written + size] = block[offset:offset + size]
+                written += size
+                self._position += size
+            return written
+
+    def readall(self):
+        return self.read(max(self.size - self._position, 0))
+
+    def close(self):
+        self._blocks.clear()
+        self._content = None
+        super().close()
+
+    def _get_block(self, index):
+        """Returns block of file content from cache or requests it from server.
+
+        :param index: the index of block.
+        :return: the content of block.
+        """
+        block = self._blocks.get(index)
+        sequential = self._last_block is not None and index == self._last_block + 1
+        self._last_block = index
+        if block is not None:
+            self._blocks.move_to_end(index)
+            return block
+
+        count = 1
+        if sequential:
+            last_index = (self.size - 1) // self.block_size
+            while count <= self.read_ahead and index + count <= last_index and index + count not in self._blocks:
+                count += 1
+        content = self._request_range(index * self.block_size, min((index + count) * self.block_size, self.size) - 1)
+        for number in range(count):
+            self._blocks[index + number] = content[number * self.block_size:(number + 1) * self.block_size]
+            self._blocks.move_to_end(index + number)
+        block = self._blocks[index]
+        while len(self._blocks) > self.cache_size:
+            self._blocks.popitem(last=False)
+        return block
+
+    def _request_range(self, start, end):
+        """Requests range of file content. In case the server ignores `Range` the full content is kept, so the
+        following ranges are not requested.
+
+        :param start: the first byte position of range.
+        :param end: the last byte position of range.
+        :return: the content of range.
+        """
+        if self._content is not None:
+            return self._content[start:end + 1]
+        headers = ["Range: bytes={start}-{end}".format(start=start, end=end), "Accept-Encoding: identity"]
+        if self.etag:
+            headers.append("If-Match: {etag}".format(etag=self.etag))
+        response = self.client.execute_request(action='download', path=self.urn.quote(), headers_ext=headers)
+        with response:
+            if response.status_code == 206:
+                return response.content
+            self._content = response.content
+        return self._content[start:end + 1]